@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Audio hot-path micro-benchmarks: recorder capture, stop_recording, external files, AAC.
+
+Each case runs in a fresh worker process so its peak RSS is its own. Capture is driven
+by a synthetic input stream that hands generated blocks to AudioRecorder's callback as
+fast as it accepts them, so the numbers are the recorder's own cost, not real time.
+
+    python -m benchmarks.bench_audio --durations 10 60 600 --compare latest
+    python -m benchmarks.bench_audio --cases capture --rates 48000 --durations 7200
+"""
+
+import argparse
+import functools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from typing import Any, Callable, Dict, List, Tuple
+
+from .harness import (ROOT, RESULTS_DIR, compare, format_table, latest_results, load_results,
+                      run_process, save_results)
+
+SRC_DIR = os.path.join(ROOT, 'src')
+
+CASES = ('capture', 'external_wav', 'external_aac', 'convert_aac')
+DEFAULT_RATES = (16000, 44100, 48000)
+DEFAULT_DURATIONS = (10, 60, 600, 3600, 7200)
+FILE_SAMPLE_RATE = 44100
+
+COLUMNS = ('wall_ms', 'peak_python_kb', 'copy_factor', 'live_blocks', 'max_rss_kb')
+
+
+class SyntheticInputStream:
+    """Stand-in for sounddevice.InputStream that delivers generated blocks on demand."""
+
+    def __init__(self, samplerate, channels=1, device=None, callback=None, blocksize=1024, **kwargs):
+        import numpy as np
+
+        self.samplerate = int(samplerate)
+        self.channels = channels
+        self.callback = callback
+        self.blocksize = blocksize
+        t = np.arange(blocksize) / self.samplerate
+        tone = (0.1 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+        # Real streams reuse their buffer between callbacks too; the recorder must copy it
+        self._block = np.repeat(tone[:, None], channels, axis=1)
+        self.active = False
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+
+    def feed(self, seconds: float) -> int:
+        """Deliver seconds of audio to the callback; returns the number of callbacks."""
+        remaining = int(seconds * self.samplerate)
+        callbacks = 0
+        while remaining > 0:
+            frames = min(self.blocksize, remaining)
+            self.callback(self._block[:frames], frames, None, None)
+            remaining -= frames
+            callbacks += 1
+        return callbacks
+
+
+def _import_recorder(blocksize: int):
+    """Import AudioRecorder with capture routed to SyntheticInputStream."""
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
+    try:
+        import sounddevice  # noqa: F401
+    except (ImportError, OSError):
+        # Headless benchmark hosts may lack PortAudio; capture never touches a device here
+        sys.modules['sounddevice'] = types.ModuleType('sounddevice')
+    from second_voice.core import recorder as recorder_module
+
+    recorder_module.sd = types.SimpleNamespace(
+        InputStream=functools.partial(SyntheticInputStream, blocksize=blocksize))
+    return recorder_module.AudioRecorder
+
+
+def _measure(steps: List[Tuple[str, Callable[[], Any]]], audio_bytes: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Run steps in order twice: untraced for wall time, then under tracemalloc for memory.
+
+    :param steps: (name, callable) run in sequence; later steps may depend on earlier ones
+    :param audio_bytes: Size of the audio as float32 samples, for copy_factor
+    :return: Step name -> metrics
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        extra = step()
+        rows[name] = {'wall_ms': round((time.perf_counter() - started) * 1000, 3)}
+        if isinstance(extra, dict):
+            rows[name].update(extra)
+
+    tracemalloc.start()
+    try:
+        for name, step in steps:
+            tracemalloc.reset_peak()
+            before_bytes = tracemalloc.get_traced_memory()[0]
+            before_blocks = len(tracemalloc.take_snapshot().traces)
+            step()
+            peak = tracemalloc.get_traced_memory()[1]
+            rows[name].update({
+                'peak_python_kb': round(peak / 1024, 1),
+                # Extra memory at the step's peak, in multiples of the audio itself
+                'copy_factor': round((peak - before_bytes) / audio_bytes, 2) if audio_bytes else 0.0,
+                # Blocks the step allocated that were still alive when it returned
+                'live_blocks': len(tracemalloc.take_snapshot().traces) - before_blocks,
+            })
+    finally:
+        tracemalloc.stop()
+    return rows
+
+
+def run_case(case: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Run one benchmark case in this process (the --worker entry point)."""
+    AudioRecorder = _import_recorder(case.get('blocksize', 1024))
+    kind = case['kind']
+    temp_dir = tempfile.mkdtemp(prefix='bench-audio-', dir=case['work_dir'])
+    recorder = AudioRecorder({'audio_config': {'sample_rate': case['rate'], 'channels': 1},
+                              'temp_dir': temp_dir})
+    audio_bytes = int(case['duration'] * case['rate']) * 4
+
+    try:
+        if kind == 'capture':
+            def capture():
+                recorder.start_recording()
+                return {'callbacks': recorder.stream.feed(case['duration'])}
+
+            def stop():
+                os.unlink(recorder.stop_recording())
+
+            return _measure([('capture', capture), ('stop_recording', stop)], audio_bytes)
+
+        if kind in ('external_wav', 'external_aac'):
+            def process():
+                wav_path = recorder.process_external_file(case['path'])[0]
+                os.unlink(wav_path)
+
+            return _measure([(kind, process)], audio_bytes)
+
+        if kind == 'convert_aac':
+            from second_voice.audio.aac_handler import AACHandler
+            output = os.path.join(temp_dir, 'converted.wav')
+
+            def convert():
+                AACHandler.convert_to_wav(case['path'], output)
+                os.unlink(output)
+
+            return _measure([(kind, convert)], audio_bytes)
+
+        raise ValueError(f"Unknown case: {kind}")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def write_wav(path: str, seconds: float, sample_rate: int = FILE_SAMPLE_RATE):
+    """Write a mono tone as 16-bit WAV in blocks, so long files don't need the whole signal in memory."""
+    import numpy as np
+    import soundfile as sf
+
+    block = sample_rate * 10
+    tone = (0.1 * np.sin(2 * np.pi * 440 * np.arange(block) / sample_rate)).astype(np.float32)
+    remaining = int(seconds * sample_rate)
+    with sf.SoundFile(path, 'w', samplerate=sample_rate, channels=1, subtype='PCM_16') as out:
+        while remaining > 0:
+            out.write(tone[:min(block, remaining)])
+            remaining -= block
+
+
+def write_m4a(path: str, seconds: float, sample_rate: int = FILE_SAMPLE_RATE):
+    """Encode a tone as AAC in an M4A container with ffmpeg."""
+    subprocess.run(['ffmpeg', '-v', 'error', '-y', '-f', 'lavfi',
+                    '-i', f"sine=frequency=440:sample_rate={sample_rate}:duration={seconds}",
+                    '-c:a', 'aac', '-b:a', '96k', path], check=True)
+
+
+def aac_unavailable() -> str:
+    """Why the AAC cases cannot run here, or '' if they can."""
+    if not shutil.which('ffmpeg'):
+        return "ffmpeg not found"
+    try:
+        import pydub  # noqa: F401
+    except ImportError:
+        return "pydub not installed"
+    return ''
+
+
+def run(args) -> Dict[str, Dict[str, Any]]:
+    """Run the selected cases, one worker process each, and return their metrics."""
+    results: Dict[str, Dict[str, Any]] = {}
+    skip_aac = aac_unavailable()
+    with tempfile.TemporaryDirectory(prefix='second-voice-bench-audio-') as work_dir:
+        cases = []
+        for kind in args.cases:
+            if kind in ('external_aac', 'convert_aac') and skip_aac:
+                print(f"Skipping {kind}: {skip_aac}", file=sys.stderr)
+                continue
+            for duration in args.durations:
+                if kind == 'capture':
+                    cases.extend({'kind': kind, 'rate': rate, 'duration': duration} for rate in args.rates)
+                else:
+                    suffix = '.wav' if kind == 'external_wav' else '.m4a'
+                    path = os.path.join(work_dir, f"input-{duration:g}s{suffix}")
+                    if not os.path.exists(path):
+                        print(f"Generating {os.path.basename(path)}...", file=sys.stderr)
+                        (write_wav if suffix == '.wav' else write_m4a)(path, duration)
+                    cases.append({'kind': kind, 'rate': FILE_SAMPLE_RATE, 'duration': duration, 'path': path})
+
+        for case in cases:
+            case.update(work_dir=work_dir, blocksize=args.blocksize)
+            label = f"{case['rate']}Hz {case['duration']:g}s"
+            print(f"Running {case['kind']} {label}...", file=sys.stderr)
+            try:
+                stdout, _, max_rss_kb = run_process(
+                    [sys.executable, '-m', 'benchmarks.bench_audio', '--worker', json.dumps(case)], cwd=ROOT)
+            except RuntimeError as e:
+                print(f"  failed: {e}", file=sys.stderr)
+                continue
+            for name, metrics in json.loads(stdout).items():
+                # Peak RSS covers the whole worker (all steps of the case)
+                metrics['max_rss_kb'] = max_rss_kb
+                results[f"{name} {label}"] = metrics
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES), metavar='CASE',
+                        help=f"Cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument('--rates', nargs='+', type=int, default=list(DEFAULT_RATES),
+                        help="Capture sample rates in Hz (default: 16000 44100 48000)")
+    parser.add_argument('--durations', nargs='+', type=float, default=list(DEFAULT_DURATIONS),
+                        help="Audio lengths in seconds (default: 10 60 600 3600 7200)")
+    parser.add_argument('--blocksize', type=int, default=1024,
+                        help="Frames per capture callback (default: 1024)")
+    parser.add_argument('--results-dir', default=RESULTS_DIR, help="Where result files are stored")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="Result file to compare with ('latest' for the newest stored run)")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Relative change reported as a regression (default: 0.2 = 20%%)")
+    parser.add_argument('--no-save', action='store_true', help="Don't store this run's results")
+    parser.add_argument('--worker', metavar='CASE_JSON', help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.worker:
+        print(json.dumps(run_case(json.loads(args.worker))))
+        return 0
+
+    baseline_path = latest_results('audio', args.results_dir) if args.compare == 'latest' else args.compare
+    scenarios = run(args)
+    print(format_table(scenarios, COLUMNS))
+
+    if not args.no_save and scenarios:
+        parameters = {'cases': args.cases, 'rates': args.rates, 'durations': args.durations,
+                      'blocksize': args.blocksize}
+        print(f"\nResults saved: {save_results('audio', parameters, scenarios, args.results_dir)}")
+
+    if args.compare:
+        if not baseline_path:
+            print("No stored results to compare with")
+            return 0
+        regressions = compare(scenarios, load_results(baseline_path)['scenarios'], args.threshold)
+        print(f"\nCompared with {baseline_path}:")
+        for line in regressions or ["No regressions"]:
+            print(f"  {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
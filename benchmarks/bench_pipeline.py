@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+End-to-end pipeline benchmarks against local Whisper and Ollama stand-ins.
+
+Starts the stand-in servers, points an isolated second_voice settings file at them and
+measures the real AIProcessor calls in-process, and the CLI pipeline modes as fresh
+processes. Reports throughput, p50/p99 latency and memory per scenario, stores the
+results under benchmarks/results/ and compares them with a previous run.
+
+    python -m benchmarks.bench_pipeline --iterations 20 --llm-latency 0.2 --compare latest
+"""
+
+import argparse
+import json
+import math
+import os
+import struct
+import sys
+import tempfile
+import wave
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List
+
+from .harness import (ROOT, RESULTS_DIR, compare, format_table, latest_results, load_results,
+                      measure_call, measure_command, save_results)
+from .servers import OllamaStub, WhisperStub
+
+SRC_DIR = os.path.join(ROOT, 'src')
+RUN_PY = os.path.join(SRC_DIR, 'cli', 'run.py')
+
+SCENARIOS = (
+    'processor.transcribe',
+    'processor.process',
+    'processor.stream',
+    'processor.headers',
+    'cli.transcribe_only',
+    'cli.translate_only',
+)
+
+# Credentials for remote providers, removed so a failing stand-in can never fail over to them
+REMOTE_CREDENTIALS = ('GROQ_API_KEY', 'OPENROUTER_API_KEY', 'OPENAI_API_KEY', 'CLINE_API_KEY')
+
+COLUMNS = ('throughput_per_s', 'p50_ms', 'p99_ms', 'peak_python_kb', 'max_rss_kb', 'stub_requests')
+
+TRANSCRIPT = (
+    "okay so the idea is um we want to measure how long the pipeline takes end to end "
+    "and uh where the time goes between transcription and the cleanup pass"
+)
+
+
+def write_wav(path: str, seconds: float, sample_rate: int = 16000):
+    """Write a mono 16-bit test tone (stdlib only, so the harness needs no audio stack)."""
+    frames = int(seconds * sample_rate)
+    with wave.open(path, 'wb') as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        samples = (int(8000 * math.sin(2 * math.pi * 440 * i / sample_rate)) for i in range(frames))
+        out.writeframes(b''.join(struct.pack('<h', sample) for sample in samples))
+
+
+def write_settings(home: str, whisper: WhisperStub, ollama: OllamaStub, temp_dir: str) -> str:
+    """
+    Write settings.json under home pointing local_whisper and ollama at the stand-ins.
+
+    The settings file heads the mellona config chain, so both the in-process processor
+    and the CLI (run with HOME=home) resolve these endpoints.
+    """
+    config_dir = os.path.join(home, '.config', 'second_voice')
+    os.makedirs(config_dir, exist_ok=True)
+    path = os.path.join(config_dir, 'settings.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'mode': 'menu',
+            'stt_provider': 'local_whisper',
+            'llm_provider': 'ollama',
+            'local_whisper_url': whisper.transcriptions_url,
+            'ollama_url': f"{ollama.url}/api/generate",
+            'temp_dir': temp_dir,
+            'stream_output': False,
+        }, f, indent=2)
+    return path
+
+
+def bench_environment(home: str, ollama: OllamaStub) -> Dict[str, str]:
+    """Environment every scenario runs in: the isolated home, the Ollama stand-in, no remote keys."""
+    env = {key: value for key, value in os.environ.items() if key not in REMOTE_CREDENTIALS}
+    env.update(HOME=home, OLLAMA_HOST=ollama.url,
+               PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get('PYTHONPATH')])))
+    return env
+
+
+@contextmanager
+def environment_of(env: Dict[str, str]):
+    """Run the in-process scenarios under the same environment as the CLI ones."""
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def processor_scenarios(settings_path: str, audio_path: str) -> Dict[str, Callable[[int], Any]]:
+    """In-process AIProcessor calls, keyed by scenario name (build and run them inside environment_of)."""
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
+    from second_voice.core.config import ConfigurationManager
+    from second_voice.core.processor import AIProcessor
+
+    processor = AIProcessor(ConfigurationManager(settings_path))
+    return {
+        'processor.transcribe': lambda i: processor.transcribe(audio_path),
+        'processor.process': lambda i: processor.process_text(TRANSCRIPT),
+        'processor.stream': lambda i: list(processor.stream_text(TRANSCRIPT)),
+        'processor.headers': lambda i: processor.process_with_headers_and_fallback(TRANSCRIPT),
+    }
+
+
+def cli_scenarios(workdir: str, audio_path: str, text_path: str) -> Dict[str, Callable[[int], List[str]]]:
+    """CLI pipeline command lines, keyed by scenario name (outputs never collide)."""
+    def output(name, index, suffix):
+        return os.path.join(workdir, 'out', f"{name}-{index}{suffix}")
+
+    return {
+        'cli.transcribe_only': lambda i: [sys.executable, RUN_PY, '--transcribe-only',
+                                          '--audio-file', audio_path,
+                                          '--text-file', output('transcribe', i, '.txt')],
+        'cli.translate_only': lambda i: [sys.executable, RUN_PY, '--translate-only',
+                                         '--text-file', text_path,
+                                         '--output-file', output('translate', i, '.md')],
+    }
+
+
+def run(args) -> Dict[str, Dict[str, Any]]:
+    """Run the selected scenarios and return their metrics."""
+    results: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix='second-voice-bench-') as workdir, \
+            WhisperStub(latency=args.stt_latency, jitter=args.jitter) as whisper, \
+            OllamaStub(latency=args.llm_latency, jitter=args.jitter, token_delay=args.token_delay,
+                       tokens=args.tokens) as ollama:
+        home = os.path.join(workdir, 'home')
+        temp_dir = os.path.join(workdir, 'tmp')
+        os.makedirs(os.path.join(workdir, 'out'))
+        settings_path = write_settings(home, whisper, ollama, temp_dir)
+        audio_path = os.path.join(workdir, 'sample.wav')
+        write_wav(audio_path, args.audio_seconds)
+        text_path = os.path.join(workdir, 'transcript.txt')
+        with open(text_path, 'w', encoding='utf-8') as f:
+            f.write(TRANSCRIPT)
+
+        env = bench_environment(home, ollama)
+        selected = [name for name in SCENARIOS if name in args.scenarios]
+        with environment_of(env):
+            in_process = processor_scenarios(settings_path, audio_path) if any(
+                name.startswith('processor.') for name in selected) else {}
+        commands = cli_scenarios(workdir, audio_path, text_path)
+
+        for name in selected:
+            print(f"Running {name}...", file=sys.stderr)
+            before = whisper.request_count + ollama.request_count
+            try:
+                if name in in_process:
+                    with environment_of(env):
+                        metrics = measure_call(in_process[name], args.iterations, args.warmup)
+                else:
+                    metrics = measure_command(commands[name], args.iterations, args.warmup, env=env, cwd=workdir)
+            except Exception as e:
+                print(f"  {name} failed: {e}", file=sys.stderr)
+                continue
+            metrics['stub_requests'] = whisper.request_count + ollama.request_count - before
+            if not metrics['stub_requests']:
+                # Whatever was timed, it was not the pipeline against the stand-ins
+                print(f"  {name} failed: it never reached the stand-in servers; check that the mellona "
+                      f"local_whisper/ollama profiles use the settings file URLs", file=sys.stderr)
+                continue
+            results[name] = metrics
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=20, help="Timed runs per scenario (default: 20)")
+    parser.add_argument('--warmup', type=int, default=1, help="Untimed runs first (default: 1)")
+    parser.add_argument('--stt-latency', type=float, default=0.05,
+                        help="Whisper stand-in delay before responding, seconds (default: 0.05)")
+    parser.add_argument('--llm-latency', type=float, default=0.1,
+                        help="Ollama stand-in delay before the first token, seconds (default: 0.1)")
+    parser.add_argument('--token-delay', type=float, default=0.005,
+                        help="Ollama stand-in delay between streamed tokens, seconds (default: 0.005)")
+    parser.add_argument('--tokens', type=int, default=40, help="Tokens per LLM response (default: 40)")
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help="Random extra latency as a fraction of the base latency (default: 0)")
+    parser.add_argument('--audio-seconds', type=float, default=5.0,
+                        help="Length of the generated test recording (default: 5)")
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS),
+                        metavar='SCENARIO', help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument('--results-dir', default=RESULTS_DIR, help="Where result files are stored")
+    parser.add_argument('--compare', metavar='FILE',
+                        help="Result file to compare with ('latest' for the newest stored run)")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Relative change reported as a regression (default: 0.2 = 20%%)")
+    parser.add_argument('--no-save', action='store_true', help="Don't store this run's results")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    baseline_path = latest_results('pipeline', args.results_dir) if args.compare == 'latest' else args.compare
+
+    scenarios = run(args)
+    print(format_table(scenarios, COLUMNS))
+
+    if not args.no_save and scenarios:
+        parameters = {key: getattr(args, key) for key in
+                      ('iterations', 'warmup', 'stt_latency', 'llm_latency', 'token_delay', 'tokens',
+                       'jitter', 'audio_seconds')}
+        print(f"\nResults saved: {save_results('pipeline', parameters, scenarios, args.results_dir)}")
+
+    if args.compare:
+        if not baseline_path:
+            print("No stored results to compare with")
+            return 0
+        regressions = compare(scenarios, load_results(baseline_path)['scenarios'], args.threshold)
+        print(f"\nCompared with {baseline_path}:")
+        for line in regressions or ["No regressions"]:
+            print(f"  {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""Timing, memory measurement and result storage shared by the benchmark suites."""
+
+import glob
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+# Metrics where a larger value is worse; compare() flags increases beyond the threshold
+LOWER_IS_BETTER = ('p50_ms', 'p99_ms', 'wall_ms', 'peak_python_kb', 'max_rss_kb', 'live_blocks')
+# Metrics where a smaller value is worse
+HIGHER_IS_BETTER = ('throughput_per_s',)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of values (pct in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(latencies: Sequence[float], wall_time: float) -> Dict[str, float]:
+    """
+    Latency and throughput figures for a run.
+
+    :param latencies: Seconds per iteration
+    :param wall_time: Seconds for all iterations together
+    """
+    count = len(latencies)
+    return {
+        'iterations': count,
+        'throughput_per_s': round(count / wall_time, 3) if wall_time else 0.0,
+        'mean_ms': round(sum(latencies) / count * 1000, 3) if count else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'min_ms': round(min(latencies) * 1000, 3) if count else 0.0,
+        'max_ms': round(max(latencies) * 1000, 3) if count else 0.0,
+    }
+
+
+def _max_rss_kb(usage) -> int:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return int(usage.ru_maxrss / 1024) if sys.platform == 'darwin' else int(usage.ru_maxrss)
+
+
+def measure_call(func: Callable[[int], Any], iterations: int, warmup: int = 1) -> Dict[str, Any]:
+    """
+    Time an in-process call.
+
+    Iterations run untraced so tracemalloc does not skew latency; one extra traced call
+    then records peak Python heap use.
+
+    :param func: Called with the iteration number
+    :param iterations: Timed calls
+    :param warmup: Untimed calls first (imports, connection setup)
+    """
+    for index in range(warmup):
+        func(-1 - index)
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for index in range(iterations):
+        call_started = time.perf_counter()
+        func(index)
+        latencies.append(time.perf_counter() - call_started)
+    result = summarize(latencies, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        func(iterations)
+        result['peak_python_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+    result['max_rss_kb'] = _max_rss_kb(resource.getrusage(resource.RUSAGE_SELF))
+    return result
+
+
+def run_process(argv: List[str], env: Optional[Dict[str, str]] = None,
+                cwd: Optional[str] = None) -> Tuple[bytes, float, int]:
+    """
+    Run a command to completion.
+
+    :return: (stdout, seconds taken, the child's own peak RSS in KB)
+    :raises RuntimeError: If the command exits non-zero
+    """
+    started = time.perf_counter()
+    process = subprocess.Popen(argv, env=env, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    # Pipes are drained by hand: communicate() would reap the child before wait4 can
+    stderr_chunks: List[bytes] = []
+    reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    reader.start()
+    stdout = process.stdout.read()
+    reader.join()
+    process.stdout.close()
+    process.stderr.close()
+    # wait4 reports this child's own resource use (RUSAGE_CHILDREN would mix all runs)
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    elapsed = time.perf_counter() - started
+    if process.returncode != 0:
+        stderr = b''.join(stderr_chunks).decode('utf-8', 'replace').strip()
+        raise RuntimeError(f"{' '.join(argv)} exited {process.returncode}: {stderr[-500:]}")
+    return stdout, elapsed, _max_rss_kb(usage)
+
+
+def measure_command(make_argv: Callable[[int], List[str]], iterations: int, warmup: int = 1,
+                    env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Time a command run as a fresh process each iteration, with its peak RSS.
+
+    :param make_argv: Builds the command line for an iteration number
+    :param iterations: Timed runs
+    :param warmup: Untimed runs first (fills the OS page cache)
+    :raises RuntimeError: If a run exits non-zero
+    """
+    for index in range(warmup):
+        run_process(make_argv(-1 - index), env, cwd)
+
+    latencies: List[float] = []
+    peak_rss = 0
+    started = time.perf_counter()
+    for index in range(iterations):
+        _, elapsed, rss = run_process(make_argv(index), env, cwd)
+        latencies.append(elapsed)
+        peak_rss = max(peak_rss, rss)
+    result = summarize(latencies, time.perf_counter() - started)
+    result['max_rss_kb'] = peak_rss
+    return result
+
+
+def environment() -> Dict[str, Any]:
+    """Machine and revision details stored with each result file."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit or None,
+    }
+
+
+def save_results(suite: str, parameters: Dict[str, Any], scenarios: Dict[str, Dict[str, Any]],
+                 directory: str = RESULTS_DIR) -> str:
+    """
+    Write a result file, <suite>-<timestamp>.json, and return its path.
+
+    :param suite: Suite name (e.g. 'pipeline')
+    :param parameters: Settings the run used (latencies, iterations, ...)
+    :param scenarios: Scenario name -> metrics
+    """
+    os.makedirs(directory, exist_ok=True)
+    created = datetime.now()
+    path = os.path.join(directory, f"{suite}-{created.strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'suite': suite,
+            'created': created.isoformat(timespec='seconds'),
+            'environment': environment(),
+            'parameters': parameters,
+            'scenarios': scenarios,
+        }, f, indent=2)
+    return path
+
+
+def latest_results(suite: str, directory: str = RESULTS_DIR) -> Optional[str]:
+    """Path of the newest stored result file for suite, if any."""
+    paths = sorted(glob.glob(os.path.join(directory, f"{suite}-*.json")))
+    return paths[-1] if paths else None
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(current: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float = 0.2) -> List[str]:
+    """
+    List metrics that got worse than the baseline by more than threshold (0.2 = 20%).
+
+    Only scenarios and metrics present in both runs are compared.
+    """
+    regressions = []
+    for name, metrics in current.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        for metric in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            old, new = before.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > threshold:
+                regressions.append(f"{name}: {metric} {old:g} -> {new:g} ({change:+.0%} worse)")
+    return regressions
+
+
+def format_table(scenarios: Dict[str, Dict[str, Any]], columns: Sequence[str]) -> str:
+    """Plain-text table of scenario metrics."""
+    width = max([len('scenario')] + [len(name) for name in scenarios])
+    lines = [f"{'scenario':<{width}}  " + '  '.join(f"{column:>14}" for column in columns)]
+    for name, metrics in scenarios.items():
+        cells = []
+        for column in columns:
+            value = metrics.get(column)
+            cells.append(f"{value:>14g}" if isinstance(value, (int, float)) else f"{'-':>14}")
+        lines.append(f"{name:<{width}}  " + '  '.join(cells))
+    return '\n'.join(lines)
@@ -0,0 +1,264 @@
+"""Local HTTP stand-ins for the Whisper and Ollama APIs, with configurable latency."""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+DEFAULT_TRANSCRIPT = (
+    "okay so um the plan for today is to uh review the benchmark numbers and then "
+    "list the slowest stages so we can decide what to optimise next"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Dispatches requests to the owning StubServer."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+
+    def _body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def do_GET(self):
+        self.server.stub.handle(self, 'GET', b'')
+
+    def do_POST(self):
+        self.server.stub.handle(self, 'POST', self._body())
+
+
+class StubServer:
+    """
+    Threaded HTTP server on 127.0.0.1 that answers like a provider API.
+
+    Every response waits ``latency`` seconds (plus up to ``jitter`` of that, at random)
+    before the first byte; streamed responses also wait ``token_delay`` between chunks.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, token_delay: float = 0.0,
+                 seed: Optional[int] = 0):
+        """
+        :param latency: Seconds before the first byte of each response
+        :param jitter: Extra random delay, as a fraction of latency (0.2 = up to +20%)
+        :param token_delay: Seconds between streamed chunks
+        :param seed: Random seed for the jitter (None for unseeded)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.token_delay = token_delay
+        self.requests: Dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL, e.g. http://127.0.0.1:54321."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        """Requests answered so far, over all paths."""
+        with self._lock:
+            return sum(self.requests.values())
+
+    def start(self) -> 'StubServer':
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name=type(self).__name__, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _wait(self):
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self.latency * self.jitter * self._random.random()
+        if delay:
+            time.sleep(delay)
+
+    def handle(self, handler: _Handler, method: str, body: bytes):
+        path = handler.path.split('?', 1)[0]
+        route = self.routes().get((method, path))
+        if route is None:
+            self._send_json(handler, 404, {'error': f'no route for {method} {path}'})
+            return
+        with self._lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+        self._wait()
+        route(handler, body)
+
+    def routes(self) -> Dict[tuple, Any]:
+        """(method, path) -> callable(handler, body)."""
+        return {}
+
+    @staticmethod
+    def _send_json(handler: _Handler, status: int, payload: Any):
+        data = json.dumps(payload).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _send_stream(self, handler: _Handler, content_type: str, lines: List[bytes]):
+        handler.send_response(200)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Transfer-Encoding', 'chunked')
+        handler.end_headers()
+        for index, line in enumerate(lines):
+            if index and self.token_delay:
+                time.sleep(self.token_delay)
+            handler.wfile.write(f"{len(line):x}\r\n".encode('ascii') + line + b"\r\n")
+            handler.wfile.flush()
+        handler.wfile.write(b"0\r\n\r\n")
+
+
+class WhisperStub(StubServer):
+    """OpenAI-compatible /v1/audio/transcriptions (as served by faster-whisper-server)."""
+
+    def __init__(self, transcript: str = DEFAULT_TRANSCRIPT, **kwargs):
+        super().__init__(**kwargs)
+        self.transcript = transcript
+
+    @property
+    def transcriptions_url(self) -> str:
+        return f"{self.url}/v1/audio/transcriptions"
+
+    def routes(self):
+        return {
+            ('POST', '/v1/audio/transcriptions'): self._transcribe,
+            ('GET', '/v1/models'): self._models,
+        }
+
+    def _transcribe(self, handler, body: bytes):
+        if b'name="response_format"\r\n\r\ntext' in body:
+            data = self.transcript.encode('utf-8')
+            handler.send_response(200)
+            handler.send_header('Content-Type', 'text/plain; charset=utf-8')
+            handler.send_header('Content-Length', str(len(data)))
+            handler.end_headers()
+            handler.wfile.write(data)
+            return
+        words = self.transcript.split()
+        words_per_segment = 12
+        segments = []
+        for index in range(0, len(words), words_per_segment):
+            chunk = words[index:index + words_per_segment]
+            start = index * 0.4
+            segments.append({
+                'id': len(segments),
+                'start': start,
+                'end': start + len(chunk) * 0.4,
+                'text': ' ' + ' '.join(chunk),
+            })
+        self._send_json(handler, 200, {
+            'task': 'transcribe',
+            'language': 'en',
+            'duration': len(words) * 0.4,
+            'text': self.transcript,
+            'segments': segments,
+        })
+
+    def _models(self, handler, body: bytes):
+        self._send_json(handler, 200, {'data': [{'id': 'small.en', 'object': 'model'}]})
+
+
+class OllamaStub(StubServer):
+    """Ollama /api/generate and /api/chat, plus the OpenAI-compatible /v1/chat/completions."""
+
+    def __init__(self, tokens: int = 40, model: str = 'llama-pro:latest', **kwargs):
+        """
+        :param tokens: Chunks per response (each chunk is one word)
+        :param model: Model name reported by /api/tags
+        """
+        super().__init__(**kwargs)
+        self.tokens = tokens
+        self.model = model
+
+    def routes(self):
+        return {
+            ('POST', '/api/generate'): self._generate,
+            ('POST', '/api/chat'): self._chat,
+            ('POST', '/v1/chat/completions'): self._completions,
+            ('GET', '/api/tags'): self._tags,
+            ('GET', '/api/version'): lambda handler, body: self._send_json(handler, 200, {'version': 'stub'}),
+        }
+
+    def _words(self) -> List[str]:
+        base = ("# Benchmark notes\n\nThe plan is to review the benchmark numbers and list the "
+                "slowest stages before deciding what to optimise next.").split(' ')
+        return [(base[i % len(base)] + ' ') for i in range(self.tokens)]
+
+    @staticmethod
+    def _request(body: bytes) -> Dict[str, Any]:
+        try:
+            return json.loads(body or b'{}')
+        except ValueError:
+            return {}
+
+    def _ollama(self, handler, body: bytes, chat: bool):
+        request = self._request(body)
+        words = self._words()
+        model = request.get('model', self.model)
+
+        def message(text):
+            return {'message': {'role': 'assistant', 'content': text}} if chat else {'response': text}
+
+        if request.get('stream', True):  # Ollama streams unless told not to
+            lines = [json.dumps(dict(model=model, done=False, **message(word))).encode('utf-8') + b"\n"
+                     for word in words]
+            lines.append(json.dumps(dict(model=model, done=True, eval_count=len(words),
+                                         **message(''))).encode('utf-8') + b"\n")
+            self._send_stream(handler, 'application/x-ndjson', lines)
+        else:
+            self._send_json(handler, 200, dict(model=model, done=True, eval_count=len(words),
+                                               **message(''.join(words))))
+
+    def _generate(self, handler, body):
+        self._ollama(handler, body, chat=False)
+
+    def _chat(self, handler, body):
+        self._ollama(handler, body, chat=True)
+
+    def _completions(self, handler, body: bytes):
+        request = self._request(body)
+        words = self._words()
+        model = request.get('model', self.model)
+        if request.get('stream'):
+            lines = [b"data: " + json.dumps({
+                'id': 'stub', 'object': 'chat.completion.chunk', 'model': model,
+                'choices': [{'index': 0, 'delta': {'content': word}, 'finish_reason': None}],
+            }).encode('utf-8') + b"\n\n" for word in words]
+            lines.append(b"data: [DONE]\n\n")
+            self._send_stream(handler, 'text/event-stream', lines)
+        else:
+            self._send_json(handler, 200, {
+                'id': 'stub', 'object': 'chat.completion', 'model': model,
+                'choices': [{'index': 0, 'finish_reason': 'stop',
+                             'message': {'role': 'assistant', 'content': ''.join(words)}}],
+                'usage': {'completion_tokens': len(words)},
+            })
+
+    def _tags(self, handler, body):
+        self._send_json(handler, 200, {'models': [{'name': self.model, 'model': self.model}]})
@@ -0,0 +1,49 @@
+"""
+Gunicorn configuration for the Whisper API service.
+
+Run with:  gunicorn -c gunicorn.conf.py service:app
+
+faster-whisper (CTranslate2) starts its own thread pool when a model is loaded,
+and those threads do not survive fork(). The model is therefore loaded inside
+each worker after fork, never in the master. To serve concurrent requests from
+one shared copy of the model, scale threads (and WHISPER__NUM_WORKERS, the
+number of parallel CTranslate2 decoders) rather than worker processes; every
+extra process holds its own copy of the model weights.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('WHISPER_PORT', '9090')}"
+
+# One process holding one model; requests share it through threads
+workers = int(os.getenv("WHISPER_HTTP_WORKERS", "1"))
+worker_class = "gthread"
+threads = int(os.getenv("WHISPER_HTTP_THREADS", os.getenv("WHISPER__NUM_WORKERS", "1")))
+
+# Import the app (Flask, numpy, faster_whisper code pages) once in the master so
+# workers start fast and share those pages copy-on-write
+preload_app = True
+
+# Long dictations can take minutes to decode on CPU
+timeout = int(os.getenv("WHISPER_HTTP_TIMEOUT", "600"))
+graceful_timeout = 30
+keepalive = 5
+
+loglevel = os.getenv("LOG_LEVEL", "INFO").lower()
+accesslog = "-"
+errorlog = "-"
+
+
+def post_worker_init(worker):
+    """Load and warm up the model in the worker; /health/ready flips once done"""
+    import service
+
+    service.initialize_in_background()
+
+
+def child_exit(server, worker):
+    """Drop a dead worker's live gauges from multiprocess metrics"""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
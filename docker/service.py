@@ -6,17 +6,41 @@ OpenAI-compatible transcription endpoint
 
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+import numpy as np
 from flask import Flask, request, jsonify
 from faster_whisper import WhisperModel
+from faster_whisper.audio import decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    generate_latest, multiprocess,
+)
 
 # Configuration from environment
 MODEL_NAME = os.getenv("WHISPER_MODEL", "small.en")
 COMPUTE_TYPE = os.getenv("WHISPER__COMPUTE_TYPE", "float32")
 NUM_WORKERS = int(os.getenv("WHISPER__NUM_WORKERS", "1"))
+CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", "0"))  # per decoder; 0 = CTranslate2 default
 DEVICE = os.getenv("WHISPER_DEVICE", "cuda")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+PORT = int(os.getenv("WHISPER_PORT", "9090"))
+
+# Request defaults (each can be overridden per request, see /docs)
+DEFAULT_LANGUAGE = os.getenv("WHISPER_LANGUAGE", "en")  # "auto" enables detection
+DEFAULT_VAD_FILTER = os.getenv("WHISPER_VAD_FILTER", "true").lower() in ("1", "true", "yes")
+DEFAULT_TRIM_SILENCE = os.getenv("WHISPER_TRIM_SILENCE", "false").lower() in ("1", "true", "yes")
+SAMPLE_RATE = 16000
+
+# Long uploads are split at VAD silence and decoded in parallel, one chunk per
+# decoder slot. Only worthwhile with more than one decoder (WHISPER__NUM_WORKERS).
+CHUNKING_ENABLED = NUM_WORKERS > 1 and os.getenv("WHISPER_CHUNKING", "true").lower() in ("1", "true", "yes")
+CHUNK_MIN_SECONDS = float(os.getenv("WHISPER_CHUNK_MIN_SECONDS", "120"))
+CHUNK_SECONDS = float(os.getenv("WHISPER_CHUNK_SECONDS", "60"))
 
 # Setup logging
 logging.basicConfig(
@@ -27,34 +51,371 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
-# Global model instance (loaded once at startup)
+# Prometheus metrics. With several gunicorn workers, set PROMETHEUS_MULTIPROC_DIR
+# so /metrics aggregates across processes (gauge modes below apply only then).
+REQUESTS = Counter(
+    "whisper_requests_total", "Transcription requests by HTTP status", ["status"])
+REQUEST_LATENCY = Histogram(
+    "whisper_request_duration_seconds", "End-to-end transcription request latency",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600))
+DECODE_LATENCY = Histogram(
+    "whisper_decode_duration_seconds", "Model decode time per request, excluding queue wait",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600))
+AUDIO_SECONDS = Counter(
+    "whisper_audio_seconds_total", "Seconds of audio transcribed")
+SKIPPED_AUDIO_SECONDS = Counter(
+    "whisper_skipped_audio_seconds_total", "Seconds of audio skipped by trimming or VAD")
+REAL_TIME_FACTOR = Histogram(
+    "whisper_real_time_factor", "Decode time divided by audio duration (lower is faster)",
+    buckets=(0.01, 0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 5))
+IN_PROGRESS = Gauge(
+    "whisper_requests_in_progress", "Transcription requests currently being handled",
+    multiprocess_mode="livesum")
+QUEUE_DEPTH = Gauge(
+    "whisper_queue_depth", "Requests waiting for a free decoder slot",
+    multiprocess_mode="livesum")
+DECODER_SLOTS = Gauge(
+    "whisper_decoder_slots", "Parallel decoders available (WHISPER__NUM_WORKERS)",
+    multiprocess_mode="livesum")
+MODEL_LOAD_SECONDS = Gauge(
+    "whisper_model_load_seconds", "Time taken to load the model", ["model", "device"],
+    multiprocess_mode="liveall")
+MODEL_MEMORY_BYTES = Gauge(
+    "whisper_model_memory_bytes", "Host resident memory added by loading the model",
+    ["model", "device"], multiprocess_mode="liveall")
+
+# Bound concurrent decodes to the number of CTranslate2 workers so waiting
+# requests are visible as queue depth instead of hidden inside the model
+_decode_slots = threading.BoundedSemaphore(NUM_WORKERS)
+DECODER_SLOTS.set(NUM_WORKERS)
+
+
+def _rss_bytes():
+    """Resident set size of this process (Linux), or 0 if unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+# Global model instance (loaded once per process, shared by all request threads)
 model = None
 
+# Readiness: set only after the model is loaded AND a warm-up inference succeeded
+_ready = threading.Event()
+_init_lock = threading.Lock()
+_init_error = None
+
 
 def load_model():
     """Load the Whisper model on startup"""
     global model
     if model is None:
         logger.info(f"Loading {MODEL_NAME} model on device '{DEVICE}'...")
+        rss_before = _rss_bytes()
+        start = time.perf_counter()
         model = WhisperModel(
             MODEL_NAME,
             device=DEVICE,
             compute_type=COMPUTE_TYPE,
             num_workers=NUM_WORKERS,
+            cpu_threads=CPU_THREADS,
         )
-        logger.info(f"Model loaded successfully")
+        load_seconds = time.perf_counter() - start
+        MODEL_LOAD_SECONDS.labels(model=MODEL_NAME, device=DEVICE).set(load_seconds)
+        MODEL_MEMORY_BYTES.labels(model=MODEL_NAME, device=DEVICE).set(max(0, _rss_bytes() - rss_before))
+        logger.info(f"Model loaded successfully in {load_seconds:.1f}s")
     return model
 
 
+def decode(whisper_model, audio, **kwargs):
+    """Run one transcription in a decoder slot
+
+    Returns the materialised segments, the TranscriptionInfo and the decode time.
+    """
+    QUEUE_DEPTH.inc()
+    _decode_slots.acquire()
+    QUEUE_DEPTH.dec()
+    try:
+        start = time.perf_counter()
+        segments, info = whisper_model.transcribe(audio, **kwargs)
+        # Segments are a lazy generator; decoding happens while consuming it
+        segments = list(segments)
+        return segments, info, time.perf_counter() - start
+    finally:
+        _decode_slots.release()
+
+
+_chunk_pool = None
+_chunk_pool_lock = threading.Lock()
+
+
+def chunk_pool():
+    """Executor feeding chunks to the decoder slots (created lazily, after fork)"""
+    global _chunk_pool
+    with _chunk_pool_lock:
+        if _chunk_pool is None:
+            _chunk_pool = ThreadPoolExecutor(max_workers=NUM_WORKERS, thread_name_prefix="whisper-chunk")
+    return _chunk_pool
+
+
+def warm_up(whisper_model):
+    """Run one inference on a second of silence so kernels and caches are hot"""
+    logger.info("Running warm-up inference...")
+    silence = np.zeros(16000, dtype=np.float32)
+    segments, _ = whisper_model.transcribe(silence, language="en", beam_size=1, vad_filter=False)
+    # Segments are generated lazily; consume them so decoding actually runs
+    list(segments)
+    logger.info("Warm-up inference complete")
+
+
+def initialize():
+    """Load and warm up the model once; safe to call from several threads"""
+    global _init_error
+    if _ready.is_set():
+        return model
+    with _init_lock:
+        if not _ready.is_set():
+            try:
+                warm_up(load_model())
+                _init_error = None
+                _ready.set()
+            except Exception as e:
+                _init_error = str(e)
+                logger.error(f"Model initialization failed: {e}", exc_info=True)
+                raise
+    return model
+
+
+def initialize_in_background():
+    """Start initialization without blocking, so liveness answers while the model loads"""
+    thread = threading.Thread(target=initialize, name="whisper-init", daemon=True)
+    thread.start()
+    return thread
+
+
+def readiness():
+    """Build the readiness response body and status code"""
+    if _ready.is_set():
+        return {"status": "ok", "model": MODEL_NAME}, 200
+    body = {"status": "error" if _init_error else "loading", "model": MODEL_NAME}
+    if _init_error:
+        body["error"] = _init_error
+    return body, 503
+
+
 @app.route("/health", methods=["GET"])
 def health():
-    """Health check endpoint"""
-    return jsonify({"status": "ok", "model": MODEL_NAME}), 200
+    """Health check endpoint (readiness semantics, kept for existing probes)"""
+    body, status = readiness()
+    return jsonify(body), status
+
+
+@app.route("/health/live", methods=["GET"])
+def health_live():
+    """Liveness: the process is up and serving HTTP, model state is not considered"""
+    return jsonify({"status": "alive"}), 200
+
+
+@app.route("/health/ready", methods=["GET"])
+def health_ready():
+    """Readiness: 200 only once the model is loaded and a warm-up inference has run"""
+    body, status = readiness()
+    return jsonify(body), status
+
+
+RESPONSE_FORMATS = ("json", "text", "verbose_json")
+
+# Form fields forwarded to faster-whisper's VadOptions, with their types
+VAD_FIELDS = {
+    "vad_threshold": ("threshold", float),
+    "min_speech_duration_ms": ("min_speech_duration_ms", int),
+    "max_speech_duration_s": ("max_speech_duration_s", float),
+    "min_silence_duration_ms": ("min_silence_duration_ms", int),
+    "speech_pad_ms": ("speech_pad_ms", int),
+}
+
+
+def _env_vad_parameters():
+    """VAD defaults from WHISPER_VAD_<FIELD> environment variables"""
+    params = {}
+    for field, (option, cast) in VAD_FIELDS.items():
+        value = os.getenv(f"WHISPER_VAD_{field.upper()}")
+        if value is not None:
+            params[option] = cast(value)
+    return params
+
+
+DEFAULT_VAD_PARAMETERS = _env_vad_parameters()
+
+
+def _form_bool(form, name, default):
+    value = form.get(name)
+    if value is None or value == "":
+        return default
+    if value.lower() in ("1", "true", "yes", "on"):
+        return True
+    if value.lower() in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"{name} must be a boolean, got {value!r}")
+
+
+def parse_decode_options(form):
+    """Read language and VAD options from the request form
+
+    Raises ValueError with a client-facing message on invalid input.
+    """
+    language = form.get("language") or DEFAULT_LANGUAGE
+    vad_parameters = dict(DEFAULT_VAD_PARAMETERS)
+    for field, (option, cast) in VAD_FIELDS.items():
+        value = form.get(field)
+        if value is None or value == "":
+            continue
+        try:
+            vad_parameters[option] = cast(value)
+        except ValueError:
+            raise ValueError(f"{field} must be a {cast.__name__}, got {value!r}")
+
+    return {
+        "language": None if language == "auto" else language,
+        "vad_filter": _form_bool(form, "vad_filter", DEFAULT_VAD_FILTER),
+        "vad_parameters": vad_parameters,
+        "trim_silence": _form_bool(form, "trim_silence", DEFAULT_TRIM_SILENCE),
+    }
+
+
+def trim_silence(audio, vad_parameters):
+    """Cut leading and trailing silence from 16 kHz audio
+
+    Returns the trimmed samples and the offset (seconds) of the first kept sample,
+    so timestamps can be shifted back onto the original timeline.
+    """
+    speech = get_speech_timestamps(audio, VadOptions(**vad_parameters))
+    if not speech:
+        return audio[:0], 0.0
+    start, end = speech[0]["start"], speech[-1]["end"]
+    return audio[start:end], start / SAMPLE_RATE
+
+
+def plan_chunks(audio, vad_parameters, max_chunk_seconds=CHUNK_SECONDS, vad=True):
+    """Split 16 kHz audio into contiguous chunks that only break inside silence
+
+    Speech regions are grouped greedily until a chunk would exceed
+    ``max_chunk_seconds``; the cut is placed midway through the silence gap.
+    A single speech region longer than the limit becomes its own chunk (bound it
+    with ``max_speech_duration_s`` if needed). Without VAD (``vad=False``, for
+    requests with vad_filter off), or when VAD finds no speech, the audio is cut
+    into fixed-length chunks instead, so it is still decoded in full.
+    Returns (start, end) sample pairs.
+    """
+    max_samples = int(max_chunk_seconds * SAMPLE_RATE)
+    speech = get_speech_timestamps(audio, VadOptions(**vad_parameters)) if vad else None
+    if not speech:
+        return [(start, min(start + max_samples, len(audio))) for start in range(0, len(audio), max_samples)]
+
+    chunks = []
+    chunk_start = 0
+    chunk_speech_start = speech[0]["start"]
+    for previous, region in zip(speech, speech[1:]):
+        if region["end"] - chunk_speech_start > max_samples:
+            cut = (previous["end"] + region["start"]) // 2
+            chunks.append((chunk_start, cut))
+            chunk_start = cut
+            chunk_speech_start = region["start"]
+    chunks.append((chunk_start, len(audio)))
+    return chunks
+
+
+def transcribe_chunked(whisper_model, audio, base_offset, vad_parameters, **decode_kwargs):
+    """Decode chunks of ``audio`` in parallel and return them in order
+
+    Without a requested language, the first chunk is decoded on its own and the
+    language it detects is used for the rest, so every chunk agrees with the
+    language reported for the request.
+
+    Returns a list of (offset_seconds, segments, info) per chunk plus the wall
+    time of the parallel phase.
+    """
+    chunks = plan_chunks(audio, vad_parameters, vad=decode_kwargs.get("vad_filter", True))
+    logger.info(f"Decoding {len(audio) / SAMPLE_RATE:.1f}s of audio as {len(chunks)} chunks "
+                f"across {NUM_WORKERS} decoders")
+
+    start = time.perf_counter()
+    pool = chunk_pool()
+
+    def submit(chunk, options):
+        chunk_start, chunk_end = chunk
+        return pool.submit(decode, whisper_model, audio[chunk_start:chunk_end],
+                           vad_parameters=vad_parameters or None, **options)
+
+    futures = [submit(chunk, decode_kwargs) for chunk in chunks[:1]]
+    if futures and decode_kwargs.get("language") is None and len(chunks) > 1:
+        _, first_info, _ = futures[0].result()
+        decode_kwargs = dict(decode_kwargs, language=first_info.language)
+        logger.info(f"Detected language {first_info.language!r} on the first chunk")
+    futures += [submit(chunk, decode_kwargs) for chunk in chunks[1:]]
+    results = []
+    for (chunk_start, _), future in zip(chunks, futures):
+        segments, info, _ = future.result()
+        results.append((base_offset + chunk_start / SAMPLE_RATE, segments, info))
+    return results, time.perf_counter() - start
+
+
+def speech_duration(info):
+    """Seconds of audio the model actually decoded (after VAD)"""
+    duration = getattr(info, "duration_after_vad", None)
+    return duration if duration is not None else info.duration
+
+
+def segment_to_dict(segment, include_words=False, offset=0.0):
+    """Convert a faster-whisper Segment into an OpenAI-style verbose segment
+
+    ``offset`` (seconds) is added to all timestamps, for audio that was trimmed
+    or split before decoding.
+    """
+    result = {
+        "id": segment.id,
+        "seek": segment.seek,
+        "start": round(segment.start + offset, 3),
+        "end": round(segment.end + offset, 3),
+        "text": segment.text.strip(),
+        "tokens": list(segment.tokens),
+        "temperature": segment.temperature,
+        "avg_logprob": segment.avg_logprob,
+        "compression_ratio": segment.compression_ratio,
+        "no_speech_prob": segment.no_speech_prob,
+    }
+    if include_words and segment.words:
+        result["words"] = [
+            {
+                "word": word.word,
+                "start": round(word.start + offset, 3),
+                "end": round(word.end + offset, 3),
+                "probability": word.probability,
+            }
+            for word in segment.words
+        ]
+    return result
 
 
 @app.route("/v1/audio/transcriptions", methods=["POST"])
 def transcribe():
     """OpenAI-compatible transcription endpoint"""
+    start = time.perf_counter()
+    status = 500
+    IN_PROGRESS.inc()
+    try:
+        response = handle_transcription()
+        status = response[1]
+        return response
+    finally:
+        IN_PROGRESS.dec()
+        REQUESTS.labels(status=str(status)).inc()
+        REQUEST_LATENCY.observe(time.perf_counter() - start)
+
+
+def handle_transcription():
+    """Validate the upload, run the model and build the response"""
     try:
         # Check if file is present
         if "file" not in request.files:
@@ -66,34 +427,146 @@ def transcribe():
 
         # Get model from request (optional, use default if not specified)
         requested_model = request.form.get("model", MODEL_NAME)
-        logger.info(f"Transcription request: file={audio_file.filename}, model={requested_model}")
 
-        # Load model
-        whisper_model = load_model()
+        response_format = request.form.get("response_format", "json")
+        if response_format not in RESPONSE_FORMATS:
+            return jsonify({"error": f"Unsupported response_format: {response_format}"}), 400
+
+        # OpenAI clients send the list as repeated "timestamp_granularities[]" fields
+        granularities = (request.form.getlist("timestamp_granularities[]")
+                         or request.form.getlist("timestamp_granularities")
+                         or ["segment"])
+        verbose = response_format == "verbose_json"
+        word_timestamps = verbose and "word" in granularities
+
+        try:
+            options = parse_decode_options(request.form)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        logger.info(f"Transcription request: file={audio_file.filename}, model={requested_model}, "
+                    f"response_format={response_format}, word_timestamps={word_timestamps}, "
+                    f"language={options['language']}, vad_filter={options['vad_filter']}, "
+                    f"trim_silence={options['trim_silence']}")
+
+        # Load model (no-op once warm; cold workers load and warm up on first request)
+        whisper_model = initialize()
 
         # Read audio file into memory
         audio_data = audio_file.read()
 
-        # Transcribe
+        # Decode the upload ourselves when it may be trimmed or split, so the
+        # samples are decoded only once and the model receives a float array
+        samples = None
+        offset = 0.0
+        input_duration = None
+        if options["trim_silence"] or CHUNKING_ENABLED:
+            samples = decode_audio(BytesIO(audio_data), sampling_rate=SAMPLE_RATE)
+            input_duration = len(samples) / SAMPLE_RATE
+
+        # Optional pre-pass: cut leading/trailing silence so the model never
+        # sees the edges of long dictations
+        if options["trim_silence"]:
+            samples, offset = trim_silence(samples, options["vad_parameters"])
+
+        decode_kwargs = {
+            "language": options["language"],
+            "vad_filter": options["vad_filter"],
+            "word_timestamps": word_timestamps,
+        }
+
+        # Transcribe; each piece is (offset_seconds, segments)
         logger.debug(f"Starting transcription of {len(audio_data)} bytes")
-        segments, info = whisper_model.transcribe(
-            BytesIO(audio_data),
-            language="en",  # small.en is English-only
-            vad_filter=True,
-        )
+        if samples is not None and not len(samples):
+            # Nothing but silence: no need to run the model at all
+            pieces, decode_seconds = [], 0.0
+            language, decoded_duration = options["language"], 0.0
+        elif samples is not None and CHUNKING_ENABLED and len(samples) >= CHUNK_MIN_SECONDS * SAMPLE_RATE:
+            results, decode_seconds = transcribe_chunked(
+                whisper_model, samples, offset, options["vad_parameters"], **decode_kwargs)
+            pieces = [(chunk_offset, segments) for chunk_offset, segments, _ in results]
+            language = results[0][2].language if results else options["language"]
+            decoded_duration = sum(speech_duration(info) for _, _, info in results)
+        else:
+            segments, info, decode_seconds = decode(
+                whisper_model,
+                samples if samples is not None else BytesIO(audio_data),
+                vad_parameters=options["vad_parameters"] or None,
+                **decode_kwargs,
+            )
+            pieces = [(offset, segments)]
+            language = info.language
+            if input_duration is None:
+                input_duration = info.duration
+            decoded_duration = speech_duration(info)
+
+        skipped_duration = max(0.0, input_duration - decoded_duration)
+
+        DECODE_LATENCY.observe(decode_seconds)
+        if input_duration:
+            AUDIO_SECONDS.inc(input_duration)
+            SKIPPED_AUDIO_SECONDS.inc(skipped_duration)
+            REAL_TIME_FACTOR.observe(decode_seconds / input_duration)
+
+        # Merge pieces onto the original timeline and renumber segments
+        segment_dicts = [
+            segment_to_dict(segment, include_words=word_timestamps, offset=piece_offset)
+            for piece_offset, segments in pieces
+            for segment in segments
+        ]
+        for index, segment in enumerate(segment_dicts):
+            segment["id"] = index
 
         # Combine segments into single text
-        text = " ".join([segment.text.strip() for segment in segments])
+        text = " ".join([segment["text"] for segment in segment_dicts])
+
+        logger.info(f"Transcription completed: {len(text)} characters, {len(segment_dicts)} segments, "
+                    f"{skipped_duration:.1f}s of {input_duration:.1f}s skipped")
 
-        logger.info(f"Transcription completed: {len(text)} characters")
+        audio_report = {
+            "duration": round(input_duration, 3),
+            "speech_duration": round(decoded_duration, 3),
+            "skipped_duration": round(skipped_duration, 3),
+            "trim_offset": round(offset, 3),
+        }
 
-        return jsonify({"text": text}), 200
+        if response_format == "text":
+            return text, 200, {
+                "Content-Type": "text/plain; charset=utf-8",
+                "X-Audio-Duration": str(audio_report["duration"]),
+                "X-Skipped-Duration": str(audio_report["skipped_duration"]),
+            }
+
+        if not verbose:
+            return jsonify({"text": text, **audio_report}), 200
+
+        payload = {
+            "task": "transcribe",
+            "language": language,
+            **audio_report,
+            "text": text,
+            "segments": segment_dicts,
+        }
+        if word_timestamps:
+            payload["words"] = [word for segment in segment_dicts for word in segment.get("words", [])]
+
+        return jsonify(payload), 200
 
     except Exception as e:
         logger.error(f"Transcription error: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """Prometheus metrics in text exposition format"""
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), 200, {"Content-Type": CONTENT_TYPE_LATEST}
+
+
 @app.route("/docs", methods=["GET"])
 def docs():
     """Minimal API documentation"""
@@ -109,15 +582,32 @@ def docs():
                 <ul>
                     <li><code>file</code> (required) - Audio file (multipart/form-data)</li>
                     <li><code>model</code> (optional) - Model name (default: """ + MODEL_NAME + """)</li>
+                    <li><code>response_format</code> (optional) - <code>json</code> (default), <code>text</code> or <code>verbose_json</code></li>
+                    <li><code>timestamp_granularities[]</code> (optional) - <code>segment</code> and/or <code>word</code> (verbose_json only)</li>
+                    <li><code>language</code> (optional) - language code, or <code>auto</code> to detect (default: """ + DEFAULT_LANGUAGE + """)</li>
+                    <li><code>vad_filter</code> (optional) - skip non-speech with Silero VAD (default: """ + str(DEFAULT_VAD_FILTER).lower() + """)</li>
+                    <li><code>vad_threshold</code>, <code>min_speech_duration_ms</code>, <code>max_speech_duration_s</code>,
+                        <code>min_silence_duration_ms</code>, <code>speech_pad_ms</code> (optional) - VAD tuning</li>
+                    <li><code>trim_silence</code> (optional) - cut leading/trailing silence before decoding (default: """ + str(DEFAULT_TRIM_SILENCE).lower() + """)</li>
                 </ul>
                 <h2>Response</h2>
-                <pre>{"text": "transcribed text"}</pre>
+                <pre>{"text": "transcribed text", "duration": 62.4, "speech_duration": 48.1,
+ "skipped_duration": 14.3, "trim_offset": 2.1}</pre>
+                <p><code>skipped_duration</code> is the audio removed by trimming and VAD;
+                all timestamps are relative to the original upload.</p>
+                <p>With <code>response_format=verbose_json</code> the response also carries
+                <code>language</code>, <code>duration</code> and <code>segments</code> (start/end,
+                avg_logprob, no_speech_prob and, when requested, per-word timestamps).</p>
                 <h2>Example</h2>
                 <pre>curl -X POST http://localhost:9090/v1/audio/transcriptions \\
   -F "file=@audio.wav" \\
   -F "model=small.en"</pre>
-                <h2>Health Check</h2>
-                <p><code>GET /health</code></p>
+                <h2>Health Checks</h2>
+                <p><code>GET /health/live</code> - process is up</p>
+                <p><code>GET /health/ready</code> - model loaded and warmed up (503 until then)</p>
+                <p><code>GET /health</code> - same as <code>/health/ready</code></p>
+                <h2>Metrics</h2>
+                <p><code>GET /metrics</code> - Prometheus text format</p>
             </body>
         </html>
         """,
@@ -127,7 +617,7 @@ def docs():
 
 
 if __name__ == "__main__":
-    # Pre-load model before starting server
-    load_model()
-    logger.info(f"Starting Whisper API server on 0.0.0.0:9090")
-    app.run(host="0.0.0.0", port=9090, threaded=True)
+    # Development server; production runs under gunicorn (see gunicorn.conf.py)
+    initialize()
+    logger.info(f"Starting Whisper API development server on 0.0.0.0:{PORT}")
+    app.run(host="0.0.0.0", port=PORT, threaded=True)
@@ -1,9 +1,15 @@
 import argparse
+import atexit
+import importlib
 import sys
 import os
 import subprocess
+import time
 from pathlib import Path
 
+# Start of module imports, reported as the 'startup.imports' stage by --profile
+_IMPORTS_STARTED = time.perf_counter()
+
 from mellona import get_arg_parser, apply_cli_args, get_config
 
 # Ensure src directory is in python path
@@ -13,9 +19,34 @@ if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
 from second_voice.core.config import ConfigurationManager
-from second_voice.core.recorder import AudioRecorder
-from second_voice.core.processor import AIProcessor
-from second_voice.modes import detect_mode, get_mode
+from second_voice.core.engine import Engine
+from second_voice.utils import profiling
+
+_IMPORTS_FINISHED = time.perf_counter()
+
+# Heavy components are imported on first use, so a pipeline mode only loads what it
+# needs: the recorder pulls in sounddevice, soundfile and numpy, the modes rich and tkinter.
+_LAZY_IMPORTS = {
+    'AudioRecorder': ('second_voice.core.recorder', 'AudioRecorder'),
+    'AIProcessor': ('second_voice.core.processor', 'AIProcessor'),
+    'detect_mode': ('second_voice.modes', 'detect_mode'),
+    'get_mode': ('second_voice.modes', 'get_mode'),
+}
+
+
+def __getattr__(name):
+    """Import a lazily loaded name on first access (PEP 562)."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name):
+    """Look up a lazily imported name (honours values patched onto this module)."""
+    return globals()[name] if name in globals() else __getattr__(name)
 
 
 # Phase 2: Validation Helper Functions
@@ -106,7 +137,8 @@ def invoke_editor(file_path, config, args):
 
     # Execute
     try:
-        subprocess.run(full_cmd, shell=True, check=False)
+        with profiling.span("editor", editor=editor_cmd):
+            subprocess.run(full_cmd, shell=True, check=False)
     except Exception as e:
         print(f"Warning: Error invoking editor: {e}")
 
@@ -153,16 +185,18 @@ def run_transcribe_only(config, args, processor):
     # Transcribe
     print(f"Transcribing: {audio_path}")
     try:
-        transcript = processor.transcribe(audio_path)
+        with processor.pipeline_deadline():
+            transcript = processor.transcribe(audio_path)
 
         if not transcript:
             print("Error: Transcription failed")
             return 1
 
         # Save transcript
-        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(transcript)
+        with profiling.span("output.write"):
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(transcript)
 
         print(f"Transcribed: {output_path}")
         return 0
@@ -197,16 +231,18 @@ def run_translate_only(config, args, processor):
     # Process/translate
     print(f"Processing: {text_path}")
     try:
-        result = processor.process_with_headers_and_fallback(transcript, context=text_path)
+        with processor.pipeline_deadline():
+            result = processor.process_with_headers_and_fallback(transcript, context=text_path)
 
         if not result:
             print("Error: Translation/processing failed")
             return 1
 
         # Save result
-        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(result)
+        with profiling.span("output.write"):
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(result)
 
         print(f"Processed: {output_path}")
         return 0
@@ -219,7 +255,6 @@ def run_document_mode(config, args, recorder, processor):
     """Execute document mode pipeline: record → transcribe → structure → save."""
     import signal
     import sys
-    import time
 
     output_path = args.output
     project = getattr(args, 'project', None)
@@ -240,15 +275,13 @@ def run_document_mode(config, args, recorder, processor):
             print("Error: Recording initialization failed")
             return 1
 
-        # Keep recording until interrupted
+        # Keep recording until interrupted, redrawing the meter on each level event
         try:
-            while True:
-                amp = recorder.get_amplitude()
+            for amp in recorder.levels():
                 bar_len = min(int(amp * 50), 10)
                 vu_bar = "#" * bar_len + "-" * (10 - bar_len)
                 sys.stdout.write(f"\rLevel: [{vu_bar}] ")
                 sys.stdout.flush()
-                time.sleep(0.1)
         except KeyboardInterrupt:
             pass
 
@@ -264,24 +297,26 @@ def run_document_mode(config, args, recorder, processor):
         print("⌛ Transcribing...")
         from second_voice.utils.timestamp import get_timestamp
         recording_timestamp = get_timestamp()
-        transcript = processor.transcribe(audio_path, recording_timestamp)
+        with processor.pipeline_deadline():
+            transcript = processor.transcribe(audio_path, recording_timestamp)
 
-        if not transcript:
-            print("Error: Transcription failed")
-            return 1
+            if not transcript:
+                print("Error: Transcription failed")
+                return 1
 
-        # Process with document structuring prompt
-        print("⌛ Structuring document...")
-        result = processor.process_document_creation(transcript, recording_path=audio_path, project=project)
+            # Process with document structuring prompt
+            print("⌛ Structuring document...")
+            result = processor.process_document_creation(transcript, recording_path=audio_path, project=project)
 
         if not result:
             print("Error: Document structuring failed")
             return 1
 
         # Save result
-        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(result)
+        with profiling.span("output.write"):
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(result)
 
         print(f"✓ Document created: {output_path}")
         return 0
@@ -331,6 +366,8 @@ def get_audio_file(args, config):
 
 
 def main():
+    main_started = time.perf_counter()
+
     # Get mellona argument parser as parent
     mellona_arg_parser = get_arg_parser()
 
@@ -396,17 +433,19 @@ Pipeline mode examples:
     # General options
     parser.add_argument('--keep-files', action='store_true',
                         help="Keep temporary files after execution")
+    parser.add_argument('--session', type=str,
+                        help="Resume a logged session by id ('last' for the most recent)")
     parser.add_argument('--debug', action='store_true',
                         help="Enable debug logging")
     parser.add_argument('--verbose', action='store_true',
                         help="Enable verbose output")
+    parser.add_argument('--profile', action='store_true',
+                        help="Print a per-stage timing breakdown on exit")
+    parser.add_argument('--profile-trace', type=str, metavar='FILE',
+                        help="Also write the timings as Chrome trace JSON (implies --profile)")
 
     args = parser.parse_args()
 
-    # Apply mellona CLI arguments to config
-    mellona_config = get_config()
-    mellona_config = apply_cli_args(args, mellona_config)
-
     # Helper function to get string args safely (handling mocks)
     def get_str_arg(obj, attr_name, default=None):
         """Get string argument from args, returns None if not a real string."""
@@ -414,6 +453,18 @@ Pipeline mode examples:
         # Check if it's a real string, not a mock or None
         return val if isinstance(val, str) else default
 
+    profile_trace = get_str_arg(args, 'profile_trace')
+    if getattr(args, 'profile', False) is True or profile_trace:
+        profiling.enable()
+        profiling.add_span('startup.imports', _IMPORTS_STARTED, _IMPORTS_FINISHED)
+        profiling.add_span('startup.args', main_started, time.perf_counter())
+        atexit.register(profiling.finish, profile_trace)
+
+    # Apply mellona CLI arguments to config
+    with profiling.span('config.mellona'):
+        mellona_config = get_config()
+        mellona_config = apply_cli_args(args, mellona_config)
+
     # Validate pipeline mode arguments (check for required dependencies)
     validate_pipeline_mode_args(args)
 
@@ -449,7 +500,8 @@ Pipeline mode examples:
         validate_output_file(output, "document-mode")
 
     # Init config
-    config = ConfigurationManager()
+    with profiling.span('config.load'):
+        config = ConfigurationManager()
 
     # Store mellona config for use by AIProcessor
     config.set('mellona_config', mellona_config)
@@ -482,6 +534,10 @@ Pipeline mode examples:
     if args.no_edit:
         config.set('no_edit', True)
 
+    session_id = get_str_arg(args, 'session')
+    if session_id:
+        config.set('session_id', session_id)
+
     # Store output file in config for menu mode access
     if output_file and isinstance(output_file, str):
         config.set('output_file', output_file)
@@ -545,35 +601,50 @@ Pipeline mode examples:
 
             config.set('input_file', input_file_path)
 
-    # Init engine
-    try:
-        recorder = AudioRecorder(config)
-        processor = AIProcessor(config)
-    except Exception as e:
-        print(f"Error initializing engine: {e}")
-        sys.exit(1)
+    # Engine components are built on first use, so each pipeline mode only
+    # constructs what it needs (record-only never resolves the mellona config chain,
+    # transcribe/translate-only never open the audio stack)
+    engine = Engine(
+        config,
+        recorder_factory=lambda cfg: _lazy('AudioRecorder')(cfg),
+        processor_factory=lambda cfg: _lazy('AIProcessor')(cfg),
+    )
+
+    def component(name):
+        """Get an engine component, exiting if it cannot be initialized."""
+        try:
+            return engine.get(name)
+        except Exception as e:
+            print(f"Error initializing engine: {e}")
+            sys.exit(1)
 
     # Handle pipeline modes (fire and forget) - only if boolean flags are set
     if record_only is True:
-        exit_code = run_record_only(config, args, recorder)
+        exit_code = run_record_only(config, args, component('recorder'))
         sys.exit(exit_code)
 
     if transcribe_only is True:
-        exit_code = run_transcribe_only(config, args, processor)
+        exit_code = run_transcribe_only(config, args, component('processor'))
         sys.exit(exit_code)
 
     if translate_only is True:
-        exit_code = run_translate_only(config, args, processor)
+        exit_code = run_translate_only(config, args, component('processor'))
         sys.exit(exit_code)
 
     if document_mode is True:
-        exit_code = run_document_mode(config, args, recorder, processor)
+        exit_code = run_document_mode(config, args, component('recorder'), component('processor'))
         sys.exit(exit_code)
 
+    # Interactive modes use both components
+    recorder = component('recorder')
+    processor = component('processor')
+    # Modes reload settings.json between recordings; the engine applies the changes
+    engine.follow_config()
+
     # Normal mode handling (interactive workflow)
     # Detect mode
     try:
-        mode_name = detect_mode(config)
+        mode_name = _lazy('detect_mode')(config)
         print(f"Starting in {mode_name} mode...")
     except Exception as e:
         print(f"Error detecting mode: {e}")
@@ -588,7 +659,7 @@ Pipeline mode examples:
 
     # Run mode
     try:
-        mode = get_mode(mode_name, config, recorder, processor)
+        mode = _lazy('get_mode')(mode_name, config, recorder, processor)
         output_file = mode.run()
     except Exception as e:
         print(f"Error initializing mode {mode_name}: {e}")
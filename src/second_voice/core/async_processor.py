@@ -0,0 +1,235 @@
+"""Asyncio front end for AIProcessor."""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Optional
+
+from .processor import AIProcessor
+from .transcription import Transcription
+
+logger = logging.getLogger(__name__)
+
+# Per-provider timeout config keys (seconds), used when a call sets no timeout of its own
+STT_TIMEOUTS = {
+    'local_whisper': ('local_whisper_timeout', 300),
+    'groq': ('groq_timeout', 60),
+}
+LLM_TIMEOUTS = {
+    'ollama': ('ollama_timeout', 300),
+    'openrouter': ('openrouter_timeout', 60),
+    'cline': ('cline_timeout', 120),
+}
+
+_STREAM_END = object()
+
+
+class AsyncAIProcessor:
+    """
+    Awaitable transcription and LLM processing on top of AIProcessor.
+
+    Blocking provider calls run on a private thread pool. Semaphores cap how many STT
+    and LLM requests are in flight, and every call has a deadline enforced with
+    asyncio.wait_for, so many requests can be kept going from one event loop.
+
+    Cancelling a call (or reaching its timeout) returns control to the caller at once.
+    Streaming calls also stop reading from the provider; a plain request already sent
+    finishes in its worker thread, its result is discarded, and it keeps its
+    concurrency slot until then. Use one instance per event loop.
+    """
+
+    def __init__(self, config, processor: Optional[AIProcessor] = None):
+        """
+        :param config: ConfigurationManager or dict
+        :param processor: Existing AIProcessor to wrap (created from config if omitted)
+        """
+        self.config = config
+        self.processor = processor or AIProcessor(config)
+        self.stt_concurrency = max(1, int(config.get('async_stt_concurrency', 2)))
+        self.llm_concurrency = max(1, int(config.get('async_llm_concurrency', 4)))
+        self._stt_slots = asyncio.Semaphore(self.stt_concurrency)
+        self._llm_slots = asyncio.Semaphore(self.llm_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.stt_concurrency + self.llm_concurrency,
+            thread_name_prefix='second-voice-async',
+        )
+
+    async def __aenter__(self) -> 'AsyncAIProcessor':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop accepting work; queued calls are cancelled, running ones finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _timeout(self, key: str, defaults: dict, provider: str, timeout: Optional[float]) -> Optional[float]:
+        """
+        Resolve a call's timeout.
+
+        :param key: Config key overriding the provider timeout for this kind of call
+        :param defaults: Provider to (config key, default seconds)
+        :param provider: Active provider
+        :param timeout: Explicit per-call timeout, if any
+        :return: Seconds, or None for no limit
+        """
+        if timeout is not None:
+            return timeout
+        configured = self.config.get(key)
+        if configured is not None:
+            return configured
+        if provider in defaults:
+            provider_key, default = defaults[provider]
+            return self.config.get(provider_key, default)
+        return None
+
+    async def _run(self, slots: asyncio.Semaphore, timeout: Optional[float], name: str,
+                   func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call on the worker pool within a concurrency slot and a deadline.
+
+        :raises TimeoutError: If the call does not finish within timeout seconds
+        """
+        loop = asyncio.get_running_loop()
+        await slots.acquire()
+
+        def release(_future):
+            # The slot is held until the worker thread is done, not just the awaiting task
+            try:
+                loop.call_soon_threadsafe(slots.release)
+            except RuntimeError:
+                pass  # Event loop already closed
+
+        try:
+            future = self._executor.submit(functools.partial(func, *args, **kwargs))
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"{name} timed out after {timeout}s")
+            raise TimeoutError(f"{name} timed out after {timeout}s") from None
+
+    async def transcribe_verbose(self, audio_path: str, recording_timestamp: Optional[str] = None,
+                                 timeout: Optional[float] = None) -> Optional[Transcription]:
+        """
+        Transcribe audio, returning the text with its segment metadata.
+
+        :param audio_path: Path to the audio file
+        :param recording_timestamp: Optional timestamp from recording for matching whisper file
+        :param timeout: Seconds to wait (defaults to transcribe_timeout, then the STT provider's timeout)
+        :return: Transcription or None if transcription fails
+        """
+        timeout = self._timeout('transcribe_timeout', STT_TIMEOUTS, self.processor.stt_provider, timeout)
+        return await self._run(self._stt_slots, timeout, 'transcribe',
+                               self.processor.transcribe_verbose, audio_path, recording_timestamp)
+
+    async def transcribe(self, audio_path: str, recording_timestamp: Optional[str] = None,
+                         timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Transcribe audio using the configured STT provider.
+
+        :param audio_path: Path to the audio file
+        :param recording_timestamp: Optional timestamp from recording for matching whisper file
+        :param timeout: Seconds to wait (defaults to transcribe_timeout, then the STT provider's timeout)
+        :return: Transcribed text or None if transcription fails
+        """
+        transcription = await self.transcribe_verbose(audio_path, recording_timestamp, timeout)
+        return transcription.text if transcription else None
+
+    async def process(self, text: str, context: Optional[str] = None,
+                      timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Clean up text through the LLM.
+
+        :param text: Input text to process
+        :param context: Optional previous context
+        :param timeout: Seconds to wait (defaults to process_timeout, then the LLM provider's timeout)
+        :return: Processed text
+        """
+        timeout = self._timeout('process_timeout', LLM_TIMEOUTS, self.processor.llm_provider, timeout)
+        return await self._run(self._llm_slots, timeout, 'process',
+                               self.processor.process_text, text, context)
+
+    async def process_document(self, transcript: str, recording_path: Optional[str] = None,
+                               project: Optional[str] = None, timeout: Optional[float] = None) -> str:
+        """
+        Structure a transcript into a markdown document.
+
+        Long transcripts are map-reduced over several LLM requests, so there is no
+        provider default here: the limit is document_timeout, if set.
+
+        :param transcript: Raw transcript text
+        :param recording_path: Path to the recording (for the source header)
+        :param project: Optional project name
+        :param timeout: Seconds to wait for the whole document
+        :return: Markdown document with headers
+        """
+        if timeout is None:
+            timeout = self.config.get('document_timeout')
+        return await self._run(self._llm_slots, timeout, 'process_document',
+                               self.processor.process_document_creation, transcript, recording_path, project)
+
+    async def stream(self, text: str, context: Optional[str] = None,
+                     timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Clean up text through the LLM, yielding output chunks as they arrive.
+
+        Leaving the loop early, cancelling the task or reaching the timeout stops the
+        provider stream.
+
+        :param text: Input text to process
+        :param context: Optional previous context
+        :param timeout: Seconds for the whole response (defaults as for process())
+        :raises TimeoutError: If the response is not complete within timeout seconds
+        """
+        timeout = self._timeout('process_timeout', LLM_TIMEOUTS, self.processor.llm_provider, timeout)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        queue: asyncio.Queue = asyncio.Queue()
+        cancel = threading.Event()
+
+        def put(item):
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                cancel.set()  # Event loop already closed
+
+        def pump():
+            try:
+                for chunk in self.processor.stream_text(text, context, cancel=cancel):
+                    put(chunk)
+                    if cancel.is_set():
+                        break
+            except BaseException as e:
+                put(e)
+            finally:
+                put(_STREAM_END)
+
+        worker = self._run(self._llm_slots, None, 'stream', pump)
+        task = asyncio.ensure_future(worker)
+        try:
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - loop.time())
+                try:
+                    item = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    logger.warning(f"stream timed out after {timeout}s")
+                    raise TimeoutError(f"stream timed out after {timeout}s") from None
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            cancel.set()
+            if task.done():
+                task.result()
+            else:
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
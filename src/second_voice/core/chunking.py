@@ -0,0 +1,87 @@
+"""Split long transcripts into token-bounded chunks at natural boundaries."""
+
+import re
+from typing import Any, Dict, Iterable, List
+
+from .context import TokenCounter
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+def group_by_tokens(pieces: Iterable[str], max_tokens: int, counter: TokenCounter,
+                    separator: str = ' ') -> List[List[str]]:
+    """
+    Greedily group consecutive pieces so each joined group totals at most max_tokens.
+
+    A single piece larger than the limit forms its own group.
+
+    :param pieces: Texts in order
+    :param max_tokens: Token limit per group
+    :param counter: Token counter for the target model
+    :param separator: Text the pieces will be joined with (counted towards the limit)
+    :return: Groups of pieces, in order
+    """
+    separator_tokens = counter.count(separator)
+    groups: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for piece in pieces:
+        piece = piece.strip()
+        if not piece:
+            continue
+        tokens = counter.count(piece)
+        if current and current_tokens + separator_tokens + tokens > max_tokens:
+            groups.append(current)
+            current, current_tokens = [], 0
+        if current:
+            current_tokens += separator_tokens
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _pack(pieces: Iterable[str], max_tokens: int, counter: TokenCounter) -> List[str]:
+    """Greedily join pieces with spaces into chunks of at most max_tokens."""
+    return [' '.join(group) for group in group_by_tokens(pieces, max_tokens, counter)]
+
+
+def _bounded(pieces: Iterable[str], max_tokens: int, counter: TokenCounter) -> Iterable[str]:
+    """Break any piece longer than max_tokens at word boundaries."""
+    for piece in pieces:
+        if counter.count(piece) <= max_tokens:
+            yield piece
+        else:
+            yield from _pack(piece.split(), max_tokens, counter)
+
+
+def split_text(text: str, max_tokens: int, counter: TokenCounter) -> List[str]:
+    """
+    Split text at sentence boundaries into chunks of at most max_tokens.
+
+    Sentences longer than the limit are split between words.
+
+    :param text: Text to split
+    :param max_tokens: Token limit per chunk
+    :param counter: Token counter for the target model
+    :return: Chunks in order
+    """
+    sentences = _SENTENCE_END.split(text.strip())
+    return _pack(_bounded(sentences, max_tokens, counter), max_tokens, counter)
+
+
+def split_segments(segments: List[Dict[str, Any]], max_tokens: int, counter: TokenCounter) -> List[str]:
+    """
+    Group transcription segments into chunks of at most max_tokens.
+
+    Segment boundaries follow pauses in speech, so they make better cut points than
+    sentence punctuation guessed by the STT model.
+
+    :param segments: Segment dictionaries with a 'text' field (see Transcription)
+    :param max_tokens: Token limit per chunk
+    :param counter: Token counter for the target model
+    :return: Chunks in order
+    """
+    texts = [segment.get('text') or '' for segment in segments]
+    return _pack(_bounded(texts, max_tokens, counter), max_tokens, counter)
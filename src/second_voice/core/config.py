@@ -1,11 +1,204 @@
 import os
 import json
+import logging
 import pathlib
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Environment variables layered over the file: variable -> dotted config key
+ENV_OVERRIDES = {
+    'SECOND_VOICE_MODE': 'mode',
+    'SECOND_VOICE_STT_PROVIDER': 'stt_provider',
+    'SECOND_VOICE_LLM_PROVIDER': 'llm_provider',
+    'SECOND_VOICE_GOOGLE_PROFILE': 'google_drive.profile',
+    'SECOND_VOICE_GOOGLE_FOLDER': 'google_drive.folder',
+    'SECOND_VOICE_INBOX_DIR': 'google_drive.inbox_dir',
+    'SECOND_VOICE_ARCHIVE_DIR': 'google_drive.archive_dir',
+}
+
+# Types for keys whose default is None (other keys must match their default's type)
+OPTIONAL_TYPES = {
+    'pipeline_timeout': (int, float),
+    'meta_keywords': (list,),
+    'project_keywords': (dict,),
+    'audio_config.device': (int, str),
+}
+
+_MISSING = object()
+
+
+def _freeze(value):
+    """Read-only copy of a JSON-like value (dicts become mapping proxies, lists tuples)."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Mutable copy of a frozen value."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _deep_merge(base: Mapping, override: Mapping) -> Dict[str, Any]:
+    """
+    New dict with override layered over base: nested dicts merge key by key, any other
+    value replaces what is below it. Neither input is modified.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, (dict, MappingProxyType)):
+            below = merged.get(key)
+            merged[key] = _deep_merge(below if isinstance(below, Mapping) else {}, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _set_dotted(data: Dict[str, Any], key: str, value):
+    """Layer value at a dotted key in nested dicts, creating (or replacing non-dict) parents."""
+    *parents, leaf = key.split('.')
+    for part in parents:
+        child = data.get(part)
+        if not isinstance(child, dict):
+            child = data[part] = {}
+        data = child
+    if isinstance(value, (dict, MappingProxyType)) and isinstance(data.get(leaf), Mapping):
+        value = _deep_merge(data[leaf], value)
+    data[leaf] = value
+
+
+def _flat_items(data: Mapping, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """Every plain and dotted key of nested dicts, with its value."""
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        yield name, value
+        if isinstance(value, Mapping):
+            yield from _flat_items(value, f"{name}.")
+
+
+def _lookup(data: Mapping, key: str, default=None):
+    """Walk a dotted key through nested dicts (a missing or None value gives default)."""
+    if '.' not in key:
+        return data.get(key, default)
+    value = data
+    for part in key.split('.'):
+        if not isinstance(value, Mapping):
+            return default
+        value = value.get(part)
+        if value is None:
+            return default
+    return value
+
+
+def _expected_types(key: str, default) -> Optional[tuple]:
+    if default is None:
+        return OPTIONAL_TYPES.get(key)
+    if isinstance(default, bool):
+        return (bool,)
+    if isinstance(default, (int, float)):
+        return (int, float)
+    # Frozen defaults stand for the JSON types they were made from
+    if isinstance(default, Mapping):
+        return (dict,)
+    if isinstance(default, tuple):
+        return (list,)
+    return (type(default),)
+
+
+def _validate(config: Dict[str, Any], defaults: Mapping[str, Any], prefix: str = '',
+              sources: Optional[Dict[str, str]] = None):
+    """
+    Replace values whose type doesn't match the schema with the default, in place.
+
+    The schema is the defaults themselves (plus OPTIONAL_TYPES); unknown keys pass through.
+
+    :param sources: Provenance to update for replaced keys (see ConfigSnapshot.sources)
+    """
+    for key, default in defaults.items():
+        name = f"{prefix}{key}"
+        value = config.get(key)
+        if value is None:
+            continue
+        expected = _expected_types(name, default)
+        if expected and (not isinstance(value, expected) or (bool not in expected and isinstance(value, bool))):
+            logger.warning(f"Config '{name}' should be {'/'.join(t.__name__ for t in expected)}, "
+                           f"got {type(value).__name__}; using the default")
+            config[key] = _thaw(default)
+            if sources is not None:
+                for stale in [k for k in sources if k.startswith(f"{name}.")]:
+                    del sources[stale]
+                sources[name] = 'default'
+                if isinstance(default, Mapping):
+                    sources.update((k, 'default') for k, _ in _flat_items(default, f"{name}."))
+        elif isinstance(default, Mapping) and isinstance(value, dict):
+            _validate(value, default, f"{name}.", sources)
+
+
+class ConfigSnapshot:
+    """
+    Frozen, pre-flattened configuration: every nested value is also stored under its
+    dotted key, so get('google_drive.inbox_dir') is a single dict lookup.
+    """
+
+    def __init__(self, data: Mapping[str, Any], stamp: Any = None, error: Optional[str] = None,
+                 sources: Optional[Mapping[str, str]] = None):
+        """
+        :param data: Resolved configuration
+        :param stamp: Identifies the file state and environment it was loaded from
+        :param error: Why the config file could not be read (its values are then defaults)
+        :param sources: Plain/dotted key -> layer it came from ('default', 'file', 'env:<VAR>')
+        """
+        self.data = _freeze(data)
+        self.stamp = stamp
+        self.error = error
+        self.sources = MappingProxyType(dict(sources or {}))
+        self._flat: Dict[str, Any] = {}
+        self._flatten(self.data, '')
+
+    def _flatten(self, data: Mapping, prefix: str):
+        for key, value in data.items():
+            name = f"{prefix}{key}"
+            # Nested None values read as missing, as dotted lookups always have
+            if not (prefix and value is None):
+                self._flat[name] = value
+            if isinstance(value, Mapping):
+                self._flatten(value, f"{name}.")
+
+    def get(self, key: str, default=None):
+        """Value for a plain or dotted key."""
+        return self._flat.get(key, default)
+
+    def __getitem__(self, key: str):
+        return self.data[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._flat
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable deep copy of the configuration."""
+        return _thaw(self.data)
+
+    def diff(self, other: 'ConfigSnapshot') -> FrozenSet[str]:
+        """Plain and dotted keys whose value differs between this snapshot and other."""
+        keys = self._flat.keys() | other._flat.keys()
+        return frozenset(key for key in keys
+                         if self._flat.get(key, _MISSING) != other._flat.get(key, _MISSING))
+
 
 class ConfigurationManager:
     """Manage application configuration with multiple sources of truth."""
 
-    DEFAULT_CONFIG = {
+    # Frozen (nested mapping proxies and tuples): every load layers over it without copying it
+    DEFAULT_CONFIG = _freeze({
         'mode': 'auto',  # default mode
         'stt_provider': 'local_whisper',
         'llm_provider': 'ollama',
@@ -13,10 +206,29 @@ class ConfigurationManager:
         'groq_stt_model': 'whisper-large-v3',
         'local_whisper_url': 'http://localhost:9090/v1/audio/transcriptions',
         'local_whisper_timeout': 300,  # 5 minutes timeout
+        'pipeline_timeout': None,  # overall seconds for transcribe + process; None for no limit
+        'stt_timestamps': 'word',  # verbose STT metadata: 'word', 'segment' or 'none'
         'ollama_url': 'http://localhost:11434/api/generate',
         'ollama_model': 'llama-pro:latest',
         'cline_llm_model': 'default-model',  # Added Cline CLI model config
+        'document_chunk_tokens': 3000,  # longer document-mode transcripts are map-reduced
+        'document_concurrency': 4,  # parallel LLM requests in map-reduce document mode
+        'async_stt_concurrency': 2,  # AsyncAIProcessor: STT requests in flight
+        'async_llm_concurrency': 4,  # AsyncAIProcessor: LLM requests in flight
+        'stream_output': True,  # render LLM output as it is generated (any key cancels)
+        'menu_pipeline': False,  # menu mode: process recordings in the background while recording the next
+        'meta_keywords': None,  # whole-word list; None uses utils.keywords.DEFAULT_META_KEYWORDS
+        'project_keywords': None,  # {project: [keywords]}; None uses DEFAULT_PROJECT_KEYWORDS
+        'prompt_versions': {},  # pin registry prompts, e.g. {"cleanup.system": "v1"}
+        'prompt_cache': True,  # provider prompt caching (Ollama keep_alive)
+        'ollama_keep_alive': '30m',
         'temp_dir': './tmp',
+        'hot_reload': True,  # interactive modes pick up settings.json edits between recordings
+        'context_token_budget': 2000,  # max tokens of prior context sent per turn
+        'context_keep_turns': 2,  # recent turns kept verbatim; older ones are summarized
+        'context_summary_tokens': 300,
+        'context_summarizer': 'extractive',  # 'extractive' or 'llm'
+        'context_windows': {},  # per-model window overrides, e.g. {"llama3": 8192}
         'openrouter_fallback_models': [
             'meta-llama/llama-3.3-70b-instruct',
             'nousresearch/hermes-3-llama-3.1-405b',
@@ -41,7 +253,8 @@ class ConfigurationManager:
         'audio_config': {
             'sample_rate': 16000,
             'channels': 1,
-            'device': None  # auto-select
+            'device': None,  # auto-select
+            'level_rate': 20,  # VU meter updates per second (0 turns metering off)
         },
         'google_drive': {
             'profile': 'default',
@@ -49,7 +262,13 @@ class ConfigurationManager:
             'inbox_dir': 'dev_notes/inbox',
             'archive_dir': 'dev_notes/inbox-archive'
         }
-    }
+    })
+
+    # Snapshots shared by every instance: path -> (stamp, snapshot)
+    _snapshot_cache: Dict[str, Tuple[Any, ConfigSnapshot]] = {}
+    _cache_lock = threading.Lock()
+    # Temp directories already created in this process (absolute paths)
+    _ensured_dirs = set()
 
     def __init__(self, config_path=None):
         """
@@ -59,47 +278,208 @@ class ConfigurationManager:
                              Defaults to ~/.config/second_voice/settings.json
         """
         self.config_path = config_path or os.path.expanduser('~/.config/second_voice/settings.json')
-        self.config = self._load_config()
+        self._snapshot = self.load_snapshot(self.config_path)
+        # Values from set() (CLI flags and runtime state), deep-merged over the snapshot
+        self._overrides: Dict[str, Any] = {}
+        # Per-key provenance including set() values, built on first use
+        self._provenance: Optional[Dict[str, str]] = None
+        # Mutable working copy, built only if .config is accessed
+        self._config: Optional[Dict[str, Any]] = None
+        # Called with the changed keys after each reload that changes something
+        self._listeners: List[Callable[[FrozenSet[str]], None]] = []
+        self._reload_lock = threading.RLock()
+        self._rejected: Optional[ConfigSnapshot] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+        self._ensure_temp_dir(self._snapshot.get('temp_dir'))
+
+    @classmethod
+    def _stamp(cls, config_path: str):
+        """File state plus environment overrides; a snapshot is reused while this is unchanged."""
+        file_stamp = None
+        if os.path.exists(config_path):
+            try:
+                stat = os.stat(config_path)
+                file_stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            except OSError:
+                pass
+        return file_stamp, tuple(os.environ.get(name) for name in ENV_OVERRIDES)
+
+    @classmethod
+    def load_snapshot(cls, config_path: str) -> ConfigSnapshot:
+        """
+        Resolved, validated snapshot for a config file, cached until the file (by
+        mtime, size and inode) or the SECOND_VOICE_* environment changes.
+        """
+        key = os.path.abspath(config_path)
+        stamp = cls._stamp(config_path)
+        cached = cls._snapshot_cache.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        config, error, sources = cls._load_config(config_path, file_exists=stamp[0] is not None)
+        snapshot = ConfigSnapshot(config, stamp, error, sources)
+        with cls._cache_lock:
+            cls._snapshot_cache[key] = (stamp, snapshot)
+        return snapshot
 
-    def _load_config(self):
+    @classmethod
+    def clear_cache(cls):
+        """Forget cached snapshots and created temp directories (forces the next load from disk)."""
+        with cls._cache_lock:
+            cls._snapshot_cache.clear()
+            cls._ensured_dirs.clear()
+
+    @classmethod
+    def _ensure_temp_dir(cls, temp_dir):
+        """Create the temp directory once per process (per absolute path)."""
+        if not temp_dir or not isinstance(temp_dir, str):
+            return
+        path = os.path.abspath(temp_dir)
+        if path in cls._ensured_dirs:
+            return
+        pathlib.Path(temp_dir).mkdir(parents=True, exist_ok=True)
+        cls._ensured_dirs.add(path)
+
+    @classmethod
+    def _load_config(cls, config_path: str, file_exists: bool = True):
         """
-        Load configuration from file, environment variables, and defaults.
+        Resolve configuration from defaults, the config file and environment variables.
 
-        Precedence: Environment Variables > Config File > Default Config
+        Each layer is deep-merged over the one below (Environment Variables > Config File >
+        Default Config), so a partial nested block in the file only replaces the keys it
+        names. DEFAULT_CONFIG itself is never modified.
+
+        :return: (configuration, why the file could not be read or None,
+                  plain/dotted key -> layer it came from)
         """
-        # Start with default config
-        config = self.DEFAULT_CONFIG.copy()
+        config = _thaw(cls.DEFAULT_CONFIG)
+        sources = {key: 'default' for key, _ in _flat_items(config)}
+        error = None
 
         # Try to load from config file
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
+            if file_exists:
+                with open(config_path, 'r') as f:
                     file_config = json.load(f)
-                    config.update(file_config)
-        except (json.JSONDecodeError, PermissionError):
+                if not isinstance(file_config, dict):
+                    raise ValueError(f"expected a JSON object, got {type(file_config).__name__}")
+                config = _deep_merge(config, file_config)
+                for key, _ in _flat_items(file_config):
+                    sources[key] = 'file'
+        except (json.JSONDecodeError, ValueError, PermissionError, FileNotFoundError) as e:
             # Silently fall back to defaults if config is invalid
-            pass
+            error = str(e)
+
+        _validate(config, cls.DEFAULT_CONFIG, sources=sources)
 
         # Override with environment variables
-        config['mode'] = os.environ.get('SECOND_VOICE_MODE', config['mode'])
-        config['stt_provider'] = os.environ.get('SECOND_VOICE_STT_PROVIDER', config['stt_provider'])
-        config['llm_provider'] = os.environ.get('SECOND_VOICE_LLM_PROVIDER', config['llm_provider'])
-
-        # Google Drive environment variable overrides
-        if 'SECOND_VOICE_GOOGLE_PROFILE' in os.environ:
-            config['google_drive']['profile'] = os.environ['SECOND_VOICE_GOOGLE_PROFILE']
-        if 'SECOND_VOICE_GOOGLE_FOLDER' in os.environ:
-            config['google_drive']['folder'] = os.environ['SECOND_VOICE_GOOGLE_FOLDER']
-        if 'SECOND_VOICE_INBOX_DIR' in os.environ:
-            config['google_drive']['inbox_dir'] = os.environ['SECOND_VOICE_INBOX_DIR']
-        if 'SECOND_VOICE_ARCHIVE_DIR' in os.environ:
-            config['google_drive']['archive_dir'] = os.environ['SECOND_VOICE_ARCHIVE_DIR']
-
-        # Ensure temp directory exists and is writable
-        temp_dir = config['temp_dir']
-        pathlib.Path(temp_dir).mkdir(parents=True, exist_ok=True)
+        for variable, key in ENV_OVERRIDES.items():
+            if variable in os.environ:
+                _set_dotted(config, key, os.environ[variable])
+                # The enclosing blocks now carry an environment value too
+                parts = key.split('.')
+                for depth in range(1, len(parts) + 1):
+                    sources['.'.join(parts[:depth])] = f"env:{variable}"
+
+        return config, error, sources
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Frozen file + environment configuration (without values from set())."""
+        return self._snapshot
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Mutable configuration dict (snapshot plus set() values), built on first access."""
+        if self._config is None:
+            self._config = _deep_merge(self._snapshot.to_dict(), self._overrides)
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        self._config = value
+
+    def reload(self) -> bool:
+        """
+        Pick up changes to the config file (or environment) since it was loaded.
+
+        Values from set() are kept on top of the new snapshot. The new snapshot is swapped
+        in as a whole, then listeners are told which keys changed (keys pinned by set()
+        don't count, as their value didn't change). A file that has become unreadable
+        (e.g. saved mid-edit with a JSON error) is ignored until it is fixed.
+
+        :return: True if the configuration was reloaded
+        """
+        with self._reload_lock:
+            snapshot = self.load_snapshot(self.config_path)
+            if snapshot is self._snapshot or snapshot is self._rejected:
+                return False
+            if snapshot.error and not self._snapshot.error:
+                logger.warning(f"Not reloading {self.config_path}, keeping the current settings: {snapshot.error}")
+                self._rejected = snapshot
+                return False
+            before = {key: self.get(key, _MISSING) for key in self._snapshot.diff(snapshot)}
+            self._snapshot = snapshot
+            self._config = None
+            self._provenance = None
+            changed = frozenset(key for key, value in before.items() if self.get(key, _MISSING) != value)
+            self._ensure_temp_dir(self.get('temp_dir'))
+            if changed:
+                logger.info(f"Configuration reloaded: {', '.join(sorted(changed))}")
+                self._notify(changed)
+            return True
+
+    def subscribe(self, callback: Callable[[FrozenSet[str]], None]):
+        """
+        Call callback with the set of changed keys (plain and dotted) after each reload.
+
+        Callbacks run on the thread that reloaded, one at a time; an exception in one is
+        logged and does not stop the others.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[FrozenSet[str]], None]):
+        """Stop calling a subscribed callback."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
 
-        return config
+    def _notify(self, changed: FrozenSet[str]):
+        for callback in list(self._listeners):
+            try:
+                callback(changed)
+            except Exception as e:
+                logger.error(f"Config change listener {callback!r} failed: {e}")
+
+    def watch(self, interval: float = 2.0):
+        """
+        Reload in the background whenever the config file changes.
+
+        For long-running processes without a natural point to call reload(); listeners
+        then run on the watcher thread. Each poll is one stat() of the file.
+
+        :param interval: Seconds between checks
+        """
+        if self._watcher and self._watcher.is_alive():
+            return
+        self._stop_watching.clear()
+
+        def poll():
+            while not self._stop_watching.wait(interval):
+                try:
+                    self.reload()
+                except Exception as e:
+                    logger.error(f"Config reload failed: {e}")
+
+        self._watcher = threading.Thread(target=poll, name='config-watch', daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        """Stop the background watcher started by watch()."""
+        self._stop_watching.set()
+        if self._watcher:
+            self._watcher.join(timeout=1.0)
+            self._watcher = None
 
     def save(self):
         """Save current configuration to config file."""
@@ -112,23 +492,62 @@ class ConfigurationManager:
         Get a configuration value.
         Supports dot notation for nested values (e.g., 'google_drive.profile').
         """
-        if '.' in key:
-            keys = key.split('.')
-            value = self.config
-            for k in keys:
-                if isinstance(value, dict):
-                    value = value.get(k)
-                    if value is None:
-                        return default
-                else:
-                    return default
-            return value
-        return self.config.get(key, default)
+        if self._config is not None:
+            return _lookup(self._config, key, default)
+        root = key.partition('.')[0]
+        if root in self._overrides:
+            return _lookup({root: self._layered(root)}, key, default)
+        return self._snapshot.get(key, default)
 
     def set(self, key, value):
-        """Set a configuration value."""
-        self.config[key] = value
+        """
+        Set a configuration value (the top layer, above the environment).
+
+        Dotted keys set one nested value; a dict is merged into the dict below it.
+        """
+        _set_dotted(self._overrides, key, value)
+        if self._config is not None:
+            _set_dotted(self._config, key, value)
+        self._provenance = None
+
+    def _layered(self, root: str):
+        """A top-level value with set() values merged over the snapshot's."""
+        value = self._overrides[root]
+        below = self._snapshot.data.get(root)
+        if isinstance(value, dict) and isinstance(below, Mapping):
+            return _deep_merge(below, value)
+        return value
+
+    def source(self, key: str) -> Optional[str]:
+        """
+        Layer a value comes from: 'default', 'file', 'env:<VARIABLE>' or 'set' (set(), which
+        carries the CLI flags); None for unknown keys. For a nested block this is the
+        highest layer that touched any of its keys.
+        """
+        return self.provenance().get(key)
+
+    def provenance(self) -> Dict[str, str]:
+        """
+        Every plain and dotted key with the layer its value comes from.
+
+        The file/env part is computed once per snapshot and shared; the set() layer is
+        added per instance and cached until the next set() or reload().
+        """
+        if self._provenance is None:
+            trace = dict(self._snapshot.sources)
+            for key, value in _flat_items(self._overrides):
+                if not isinstance(value, dict):
+                    # A plain value replaces whatever was nested below it
+                    for stale in [k for k in trace if k.startswith(f"{key}.")]:
+                        del trace[stale]
+                trace[key] = 'set'
+            self._provenance = trace
+        return dict(self._provenance)
 
     def __getitem__(self, key):
         """Allow dictionary-style access to config."""
-        return self.config[key]
+        if self._config is not None:
+            return self._config[key]
+        if key in self._overrides:
+            return self._layered(key)
+        return self._snapshot[key]
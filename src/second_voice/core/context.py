@@ -0,0 +1,238 @@
+"""Token-aware conversation context for refinement sessions."""
+
+import logging
+import math
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Context windows (tokens) by model name prefix; overridden by the
+# 'context_windows' config key. Unknown models fall back to DEFAULT_CONTEXT_WINDOW.
+KNOWN_CONTEXT_WINDOWS = {
+    'llama3': 8192,
+    'llama-pro': 4096,
+    'mistral': 32768,
+    'openai/gpt-4': 8192,
+    'openai/gpt-oss': 131072,
+    'meta-llama/llama-3': 131072,
+    'google/gemma-3': 131072,
+    'anthropic/claude': 200000,
+}
+DEFAULT_CONTEXT_WINDOW = 4096
+
+# Average characters per token when no tokenizer is available. Llama-family
+# tokenizers used through Ollama split English a little finer than tiktoken.
+CHARS_PER_TOKEN = {
+    'ollama': 3.5,
+}
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+_WORD = re.compile(r'\S+')
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+@lru_cache(maxsize=None)
+def _tiktoken_encoding(model: str):
+    """Return a tiktoken encoding for model, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model.split('/')[-1])
+    except KeyError:
+        return tiktoken.get_encoding('cl100k_base')
+
+
+class TokenCounter:
+    """
+    Count tokens for a provider/model pair.
+
+    Uses tiktoken for OpenRouter models when it is installed and a
+    characters-per-token estimate otherwise.
+    """
+
+    def __init__(self, provider: str, model: Optional[str] = None):
+        """
+        :param provider: LLM provider name (ollama, openrouter, cline)
+        :param model: Model identifier
+        """
+        self.provider = provider
+        self.model = model or ''
+        self._encoding = _tiktoken_encoding(self.model) if provider == 'openrouter' else None
+        self._chars_per_token = CHARS_PER_TOKEN.get(provider, DEFAULT_CHARS_PER_TOKEN)
+
+    def count(self, text: str) -> int:
+        """Number of tokens in text."""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return math.ceil(len(text) / self._chars_per_token)
+
+    def tail(self, text: str, max_tokens: int) -> str:
+        """
+        Return the longest suffix of text that fits in max_tokens, cut at a word boundary.
+
+        Falls back to a character cut only when the final word alone is too long.
+
+        :param text: Text to trim
+        :param max_tokens: Token limit
+        :return: Trimmed text
+        """
+        if max_tokens <= 0:
+            return ''
+        if self.count(text) <= max_tokens:
+            return text
+
+        starts = [match.start() for match in _WORD.finditer(text)]
+        # Binary search for the earliest word start whose suffix fits
+        low, high = 0, len(starts)
+        while low < high:
+            middle = (low + high) // 2
+            if self.count(text[starts[middle]:]) <= max_tokens:
+                high = middle
+            else:
+                low = middle + 1
+        if low < len(starts):
+            return text[starts[low]:]
+
+        # A single oversized word: keep its tail
+        return text[-int(max_tokens * self._chars_per_token):]
+
+
+def lead_sentence(text: str, max_words: int = 30) -> str:
+    """Extractive summary of one turn: its first sentence, capped at max_words."""
+    text = text.strip()
+    if not text:
+        return ''
+    sentence = _SENTENCE_END.split(text, maxsplit=1)[0]
+    words = sentence.split()
+    if len(words) > max_words:
+        return ' '.join(words[:max_words]) + ' ...'
+    return sentence
+
+
+class ContextManager:
+    """
+    Keep refinement context inside a token budget.
+
+    The last ``keep_turns`` turns are kept verbatim. Older turns are folded into a
+    rolling summary, which is extractive by default or produced by the optional
+    ``summarizer`` callable. :meth:`render` assembles the summary and recent turns
+    without exceeding the budget.
+    """
+
+    def __init__(self, config, provider: str, model: Optional[str] = None,
+                 summarizer: Optional[Callable[[str], str]] = None):
+        """
+        :param config: ConfigurationManager instance or dict
+        :param provider: LLM provider name, for token counting
+        :param model: Model identifier, for token counting and window lookup
+        :param summarizer: Optional callable that condenses text into a summary
+        """
+        self.counter = TokenCounter(provider, model)
+        self.model = model or ''
+        self.keep_turns = max(1, int(config.get('context_keep_turns', 2)))
+        self.summary_tokens = int(config.get('context_summary_tokens', 300))
+        self.budget = self._resolve_budget(config)
+        self.summarizer = summarizer
+
+        self.turns: List[str] = []
+        self.summary = ''
+
+    def _resolve_budget(self, config) -> int:
+        """Configured budget, capped by what the model window can spare for context."""
+        budget = int(config.get('context_token_budget', 2000))
+        windows = dict(KNOWN_CONTEXT_WINDOWS)
+        windows.update(config.get('context_windows') or {})
+
+        window = DEFAULT_CONTEXT_WINDOW
+        # Longest matching prefix wins, so 'openai/gpt-4o' can override 'openai/gpt-4'
+        for prefix in sorted(windows, key=len, reverse=True):
+            if self.model.startswith(prefix):
+                window = windows[prefix]
+                break
+
+        # Leave room for the system prompt, the new input and the response
+        reserve = int(config.get('context_reserve_tokens', 2048))
+        return max(256, min(budget, window - reserve))
+
+    @property
+    def latest(self) -> Optional[str]:
+        """Most recent turn, or None."""
+        return self.turns[-1] if self.turns else None
+
+    def add_turn(self, text: str):
+        """
+        Record a turn and fold anything beyond keep_turns into the summary.
+
+        :param text: Turn content (typically the reviewed output)
+        """
+        if not text:
+            return
+        self.turns.append(text)
+        while len(self.turns) > self.keep_turns:
+            self._fold(self.turns.pop(0))
+
+    def _fold(self, turn: str):
+        """Merge an old turn into the rolling summary."""
+        if self.summarizer:
+            try:
+                combined = f"{self.summary}\n\n{turn}".strip()
+                self.summary = self.counter.tail(self.summarizer(combined).strip(), self.summary_tokens)
+                return
+            except Exception as e:
+                logger.warning(f"Context summarizer failed, using extractive summary: {e}")
+        lead = lead_sentence(turn)
+        self.summary = self.counter.tail(f"{self.summary} {lead}".strip(), self.summary_tokens)
+
+    def fit(self, text: str) -> str:
+        """Trim arbitrary context text to the budget at a word boundary."""
+        return self.counter.tail(text, self.budget)
+
+    def render(self) -> str:
+        """
+        Assemble summary plus recent turns within the budget.
+
+        Recent turns take priority: the newest turn is always included (trimmed if it
+        alone exceeds the budget), older verbatim turns and then the summary are
+        dropped first.
+
+        :return: Context text
+        """
+        remaining = self.budget
+        parts: List[str] = []
+        for turn in reversed(self.turns):
+            cost = self.counter.count(turn)
+            if cost <= remaining:
+                parts.insert(0, turn)
+                remaining -= cost
+            elif not parts:
+                parts.insert(0, self.counter.tail(turn, remaining))
+                remaining = 0
+            else:
+                break
+
+        if self.summary and remaining > 0:
+            summary = self.counter.tail(f"Summary of earlier turns: {self.summary}", remaining)
+            if summary:
+                parts.insert(0, summary)
+
+        return '\n\n'.join(parts)
+
+    def clear(self):
+        """Forget all turns and the summary."""
+        self.turns = []
+        self.summary = ''
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable state."""
+        return {'summary': self.summary, 'turns': list(self.turns)}
+
+    def load_dict(self, data: Dict[str, Any]):
+        """Restore state saved with :meth:`to_dict`."""
+        self.summary = data.get('summary', '') or ''
+        self.turns = list(data.get('turns', []))[-self.keep_turns:]
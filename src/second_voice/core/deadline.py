@@ -0,0 +1,173 @@
+"""Request timeouts and pipeline deadlines."""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+# Longest a cancellable iteration waits before checking its cancel event again
+CANCEL_POLL_INTERVAL = 0.1
+
+
+class Deadline:
+    """Point in time by which a multi-step operation (transcribe + process) must finish."""
+
+    def __init__(self, seconds: Optional[float]):
+        """
+        :param seconds: Time allowed from now; None or 0 for no deadline
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds else None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None without a deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """True once the deadline has passed."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def limit(self, timeout: Optional[float]) -> Optional[float]:
+        """The smaller of timeout and the time remaining (None means no limit)."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+
+class RequestTimeouts:
+    """Connect, read and total limits for one provider request, in seconds (None for no limit)."""
+
+    def __init__(self, connect: Optional[float], read: Optional[float], total: Optional[float]):
+        self.connect = connect
+        self.read = read
+        self.total = total
+
+    def options(self) -> Dict[str, float]:
+        """Keyword arguments passed through to the mellona client."""
+        options = {'timeout': self.total, 'connect_timeout': self.connect, 'read_timeout': self.read}
+        return {key: value for key, value in options.items() if value is not None}
+
+    def __repr__(self) -> str:
+        return f"RequestTimeouts(connect={self.connect}, read={self.read}, total={self.total})"
+
+
+def call_with_timeout(func: Callable[[], Any], timeout: Optional[float], name: str = 'request') -> Any:
+    """
+    Call func, giving up after timeout seconds.
+
+    The call runs on a daemon thread so a stalled request cannot hang the caller (or
+    block interpreter exit); its eventual result is discarded.
+
+    :param func: Callable taking no arguments
+    :param timeout: Seconds allowed, or None for no limit
+    :param name: Label for the error message
+    :raises TimeoutError: If func does not return in time, or no time is left
+    """
+    if timeout is None:
+        return func()
+    if timeout <= 0:
+        raise TimeoutError(f"{name} not started: deadline already passed")
+
+    outcome: Dict[str, Any] = {}
+
+    def run():
+        try:
+            outcome['value'] = func()
+        except BaseException as e:
+            outcome['error'] = e
+
+    worker = threading.Thread(target=run, name=f"{name}-worker", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError(f"{name} timed out after {timeout:g}s")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome.get('value')
+
+
+def iterate_with_timeout(iterable: Iterable[Any], read_timeout: Optional[float],
+                         total_timeout: Optional[float], name: str = 'stream',
+                         cancel: Optional[threading.Event] = None) -> Iterator[Any]:
+    """
+    Yield items from iterable, giving up when the next item takes longer than
+    read_timeout or the whole iteration longer than total_timeout.
+
+    Items are read on a daemon thread, one at a time as the caller asks for them. When
+    the caller stops early or a limit is hit, the thread stops after its current item
+    and closes the iterable.
+
+    :param cancel: Optional event that ends iteration quietly; it is checked every
+                   CANCEL_POLL_INTERVAL seconds while waiting for an item
+    :raises TimeoutError: If a limit is exceeded
+    """
+    if read_timeout is None and total_timeout is None and cancel is None:
+        yield from iterable
+        return
+
+    deadline = Deadline(total_timeout)
+    if deadline.expired():
+        raise TimeoutError(f"{name} not started: deadline already passed")
+
+    items: queue.Queue = queue.Queue()
+    wanted = threading.Semaphore(0)
+    stop = threading.Event()
+    end = object()
+
+    def pump():
+        # Reads one item per request so nothing is pulled from upstream ahead of the caller
+        iterator = iter(iterable)
+        try:
+            while True:
+                wanted.acquire()
+                if stop.is_set():
+                    break
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    items.put((end, None))
+                    break
+                items.put((item, None))
+        except BaseException as e:
+            items.put((end, e))
+        finally:
+            close = getattr(iterator, 'close', None)
+            if callable(close):
+                close()
+
+    threading.Thread(target=pump, name=f"{name}-reader", daemon=True).start()
+    try:
+        while True:
+            wanted.release()
+            read_deadline = Deadline(read_timeout)
+            while True:
+                # Wait in short slices when cancellable, so a stalled stream can still be stopped
+                wait = deadline.limit(read_deadline.remaining())
+                if cancel is not None:
+                    wait = CANCEL_POLL_INTERVAL if wait is None else min(wait, CANCEL_POLL_INTERVAL)
+                try:
+                    item, error = items.get(timeout=wait)
+                    break
+                except queue.Empty:
+                    if cancel is not None and cancel.is_set():
+                        return
+                    if deadline.expired():
+                        raise TimeoutError(f"{name} exceeded its {total_timeout:g}s deadline") from None
+                    if read_deadline.expired():
+                        raise TimeoutError(f"{name} received no data for {read_timeout:g}s") from None
+            if cancel is not None and cancel.is_set():
+                return
+            if error is not None:
+                raise error
+            if item is end:
+                return
+            yield item
+    finally:
+        stop.set()
+        wanted.release()
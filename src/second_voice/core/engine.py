@@ -0,0 +1,98 @@
+"""Lazily constructed engine components."""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from ..utils import profiling
+
+
+def _default_recorder(config):
+    from .recorder import AudioRecorder
+    return AudioRecorder(config)
+
+
+def _default_processor(config):
+    from .processor import AIProcessor
+    return AIProcessor(config)
+
+
+class Engine:
+    """
+    Container for the recorder and processor, each built on first access.
+
+    Pipeline modes that never record (or never call an AI provider) don't pay for
+    opening the audio stack (or resolving the mellona config chain). Built components
+    are kept, so a long-lived process reuses them across runs.
+    """
+
+    def __init__(self, config,
+                 recorder_factory: Optional[Callable[[Any], Any]] = None,
+                 processor_factory: Optional[Callable[[Any], Any]] = None):
+        """
+        :param config: Configuration manager
+        :param recorder_factory: Builds the recorder from config (default: AudioRecorder)
+        :param processor_factory: Builds the processor from config (default: AIProcessor)
+        """
+        self.config = config
+        self._factories: Dict[str, Callable[[Any], Any]] = {
+            'recorder': recorder_factory or _default_recorder,
+            'processor': processor_factory or _default_processor,
+        }
+        self._components: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def get(self, name: str) -> Any:
+        """
+        Return a component, building it on first access.
+
+        :param name: 'recorder' or 'processor'
+        :raises KeyError: For an unknown component
+        """
+        with self._lock:
+            if name not in self._components:
+                with profiling.span(f"engine.{name}"):
+                    self._components[name] = self._factories[name](self.config)
+            return self._components[name]
+
+    @property
+    def recorder(self):
+        """Audio recorder (built on first access)."""
+        return self.get('recorder')
+
+    @property
+    def processor(self):
+        """AI processor (built on first access)."""
+        return self.get('processor')
+
+    def is_built(self, name: str) -> bool:
+        """True if the component has been constructed."""
+        return name in self._components
+
+    def follow_config(self):
+        """Apply every future config reload to the built components (see apply_config)."""
+        subscribe = getattr(self.config, 'subscribe', None)
+        if callable(subscribe):
+            subscribe(self.apply_config)
+
+    def apply_config(self, changed):
+        """
+        Pass reloaded config keys to each built component that supports apply_config().
+
+        Components are updated in place, so warm state (sessions, context) survives;
+        components not built yet read the new values when they are built.
+
+        :param changed: Plain and dotted keys that changed
+        """
+        with self._lock:
+            for component in self._components.values():
+                apply = getattr(component, 'apply_config', None)
+                if callable(apply):
+                    apply(changed)
+
+    def reset(self, name: Optional[str] = None):
+        """Drop a built component (or all) so the next access rebuilds it, e.g. after a config change."""
+        with self._lock:
+            if name is None:
+                self._components.clear()
+            else:
+                self._components.pop(name, None)
@@ -0,0 +1,152 @@
+"""Background processing of queued recordings, with results collected in submission order."""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class PipelineResult:
+    """Outcome of one submitted job: its value, or the exception it raised."""
+
+    def __init__(self, seq: int, item: Any, value: Any = None, error: Optional[BaseException] = None,
+                 elapsed: float = 0.0):
+        """
+        :param seq: Submission number (1 for the first job)
+        :param item: The submitted item
+        :param value: What the work function returned
+        :param error: Exception raised by the work function, if any
+        :param elapsed: Seconds the work function ran
+        """
+        self.seq = seq
+        self.item = item
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        state = 'ok' if self.ok else f"error={self.error!r}"
+        return f"PipelineResult(seq={self.seq}, {state}, elapsed={self.elapsed:.2f})"
+
+
+class RecordingPipeline:
+    """
+    Run submitted jobs one at a time on a background thread.
+
+    The caller keeps recording while earlier recordings are transcribed and processed;
+    finished results are collected in the order they were submitted. A single worker
+    keeps jobs in order and lets each one see the context left by the one before it.
+    """
+
+    def __init__(self, work: Callable[[Any], Any], name: str = 'pipeline'):
+        """
+        :param work: Called on the worker thread with each submitted item
+        :param name: Worker thread name
+        """
+        self._work = work
+        self._name = name
+        self._jobs: 'queue.Queue[Any]' = queue.Queue()
+        self._results: Deque[PipelineResult] = deque()
+        self._finished = threading.Condition()
+        self._submitted = 0
+        self._collected = 0
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, item: Any) -> int:
+        """
+        Queue an item for processing, starting the worker on first use.
+
+        :return: Its submission number
+        """
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._worker.start()
+        self._submitted += 1
+        self._jobs.put((self._submitted, item))
+        return self._submitted
+
+    @property
+    def pending(self) -> int:
+        """Jobs submitted but not yet collected (queued, running or finished)."""
+        return self._submitted - self._collected
+
+    @property
+    def finished(self) -> int:
+        """Finished jobs waiting to be collected."""
+        with self._finished:
+            return len(self._results)
+
+    def ready(self) -> List[PipelineResult]:
+        """Collect every finished result without waiting, oldest first."""
+        with self._finished:
+            results = list(self._results)
+            self._results.clear()
+        self._collected += len(results)
+        return results
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[PipelineResult]:
+        """
+        Collect the next result, waiting for it to finish.
+
+        :param timeout: Seconds to wait (None to wait as long as it takes)
+        :return: The result, or None if nothing is pending or the timeout passed
+        """
+        if not self.pending:
+            return None
+        with self._finished:
+            if not self._finished.wait_for(lambda: self._results, timeout):
+                return None
+            result = self._results.popleft()
+        self._collected += 1
+        return result
+
+    def close(self, cancel: bool = False) -> List[Any]:
+        """
+        Stop the worker.
+
+        :param cancel: Drop queued jobs and return at once instead of finishing them; a
+                       running job is left to complete on its (daemon) thread
+        :return: Items of the jobs that were dropped
+        """
+        dropped = []
+        if cancel:
+            while True:
+                try:
+                    seq, item = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                dropped.append(item)
+                self._submitted -= 1
+        if self._worker is not None:
+            self._jobs.put(_STOP)
+            if not cancel:
+                self._worker.join()
+            self._worker = None
+        return dropped
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is _STOP:
+                return
+            seq, item = job
+            started = time.monotonic()
+            try:
+                result = PipelineResult(seq, item, value=self._work(item))
+            except Exception as e:
+                logger.error(f"Pipeline job {seq} failed: {e}")
+                result = PipelineResult(seq, item, error=e)
+            result.elapsed = time.monotonic() - started
+            with self._finished:
+                self._results.append(result)
+                self._finished.notify_all()
@@ -1,17 +1,86 @@
 import os
 import json
+import inspect
 import logging
-from typing import Optional, Dict, Any
+import threading
+from contextvars import ContextVar, copy_context
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, FrozenSet, Iterator, List, Tuple
 from pathlib import Path
 
 from mellona import SyncMellonaClient, get_config
 
+from .chunking import group_by_tokens, split_segments, split_text
+from .config import ConfigurationManager
+from .context import ContextManager
+from .deadline import Deadline, RequestTimeouts, call_with_timeout, iterate_with_timeout
+from .prompts import PROMPTS, Prompt, cleanup_variant
+from .session import SessionStore
+from .transcription import Transcription
+from ..utils import profiling
 from ..utils.headers import Header, generate_title, infer_project_name
-from ..utils.timestamp import create_whisper_filename
+from ..utils.keywords import DEFAULT_META_KEYWORDS, DEFAULT_PROJECT_KEYWORDS, KeywordMatcher
+from ..utils.timestamp import create_whisper_filename, create_whisper_segments_filename
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _accepted_keywords(func: Callable) -> Optional[FrozenSet[str]]:
+    """
+    Keyword arguments a client method accepts, read once from its signature.
+
+    :param func: The method's underlying function
+    :return: Parameter names, or None if it takes **kwargs or cannot be inspected
+    """
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    if any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    return frozenset(parameter.name for parameter in parameters
+                     if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY))
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Text of one streamed chunk (plain string, or object/dict with text, delta or content)."""
+    if isinstance(chunk, str):
+        return chunk
+    for name in ('text', 'delta', 'content'):
+        value = chunk.get(name) if isinstance(chunk, dict) else getattr(chunk, name, None)
+        if isinstance(value, str):
+            return value
+    return ''
+
+
+# Total seconds allowed per request when <provider>_timeout is not configured
+PROVIDER_TIMEOUTS = {
+    'local_whisper': 300,
+    'groq': 60,
+    'ollama': 300,
+    'openrouter': 60,
+    'cline': 120,
+}
+DEFAULT_CONNECT_TIMEOUT = 10
+
+# Overall deadline for the running transcribe + process pipeline (see pipeline_deadline).
+# Context-local, so pipelines on different threads never see each other's deadline.
+_PIPELINE_DEADLINE: ContextVar[Optional[Deadline]] = ContextVar('pipeline_deadline', default=None)
+
+# Settings the refinement context is built from; the context is rebuilt (keeping its
+# turns) when one of them is reloaded
+CONTEXT_KEYS = frozenset({
+    'llm_provider', 'ollama_model', 'cline_llm_model', 'openrouter_llm_model',
+    'openrouter_fallback_models', 'context_token_budget', 'context_keep_turns',
+    'context_summary_tokens', 'context_summarizer', 'context_windows',
+})
+# Reloaded keys with these suffixes are provider settings read by mellona itself
+MELLONA_KEY_SUFFIXES = ('_url', '_api_key', '_base_url', '_profile')
+
 class AIProcessor:
     """
     Process audio transcription and language model inference.
@@ -31,32 +100,232 @@ class AIProcessor:
 
         # Use mellona config if provided (from CLI), otherwise set up default chain
         mellona_config = config.get('mellona_config')
-        if not mellona_config:
-            # Set up mellona config chain
-            # Includes second_voice settings and mellona config
-            second_voice_config_path = config.config_path if hasattr(config, 'config_path') else os.path.expanduser('~/.config/second_voice/settings.json')
-            mellona_config_path = os.path.expanduser('~/.config/mellona/config.yaml')
-            mellona_config = get_config(config_chain=[
-                second_voice_config_path,
-                mellona_config_path,
-            ])
-
+        self._owns_mellona_config = not mellona_config
         # Store the mellona config for use in API calls
-        self.mellona_config = mellona_config
+        self.mellona_config = mellona_config or self._resolve_mellona_config()
+
+        # Keyword tables are compiled once; override with meta_keywords / project_keywords
+        self._meta_matcher = KeywordMatcher.from_keywords(config.get('meta_keywords') or DEFAULT_META_KEYWORDS)
+        self._project_matcher = KeywordMatcher(config.get('project_keywords') or DEFAULT_PROJECT_KEYWORDS)
+
+        # Segment/word metadata from the most recent transcribe() call
+        self.last_transcription: Optional[Transcription] = None
+
+        # Token-budgeted refinement context (rolling summary + recent turns)
+        summarizer = self._summarize_context if config.get('context_summarizer') == 'llm' else None
+        self.context_manager = ContextManager(config, self.llm_provider, self._llm_model(), summarizer)
+
+        # Append-only session log; 'session_id' resumes an existing session ('last' for the newest)
+        self.session_store = SessionStore(os.path.join(config.get('temp_dir', './tmp'), 'sessions'))
+        self.session_id = self._resume_session(config.get('session_id'))
+
+    def _resolve_mellona_config(self):
+        """Resolve the mellona config chain: second_voice settings, then mellona's own config."""
+        second_voice_config_path = self.config.config_path if hasattr(self.config, 'config_path') else os.path.expanduser('~/.config/second_voice/settings.json')
+        mellona_config_path = os.path.expanduser('~/.config/mellona/config.yaml')
+        return get_config(config_chain=[
+            second_voice_config_path,
+            mellona_config_path,
+        ])
+
+    def apply_config(self, changed):
+        """
+        Bring cached state in line with a reloaded configuration.
+
+        Models, timeouts, prompts and fallback lists are read per request and need nothing
+        here. Only state built from a changed key is rebuilt: providers, keyword tables,
+        the refinement context (keeping its turns), the session store and the mellona
+        config. Everything else, including the session, is kept.
+
+        :param changed: Plain and dotted keys that changed (see ConfigurationManager.subscribe)
+        """
+        changed = set(changed)
+        config = self.config
+        updates: Dict[str, Any] = {}
+
+        if 'stt_provider' in changed:
+            updates['stt_provider'] = config.get('stt_provider', 'local_whisper')
+        if 'llm_provider' in changed:
+            updates['llm_provider'] = config.get('llm_provider', 'ollama')
+        if 'meta_keywords' in changed:
+            updates['_meta_matcher'] = KeywordMatcher.from_keywords(config.get('meta_keywords') or DEFAULT_META_KEYWORDS)
+        if 'project_keywords' in changed:
+            updates['_project_matcher'] = KeywordMatcher(config.get('project_keywords') or DEFAULT_PROJECT_KEYWORDS)
+        if 'temp_dir' in changed:
+            updates['session_store'] = SessionStore(os.path.join(config.get('temp_dir', './tmp'), 'sessions'))
+        if self._owns_mellona_config and any(
+                key.endswith(MELLONA_KEY_SUFFIXES) or key.partition('.')[0] not in ConfigurationManager.DEFAULT_CONFIG
+                for key in changed):
+            updates['mellona_config'] = self._resolve_mellona_config()
+
+        if changed & CONTEXT_KEYS:
+            llm_provider = updates.get('llm_provider', self.llm_provider)
+            summarizer = self._summarize_context if config.get('context_summarizer') == 'llm' else None
+            context_manager = ContextManager(config, llm_provider, self._llm_model(llm_provider), summarizer)
+            context_manager.load_dict(self.context_manager.to_dict())
+            updates['context_manager'] = context_manager
+
+        # Everything is built first, then swapped in together
+        for name, value in updates.items():
+            setattr(self, name, value)
+        if updates:
+            logger.info(f"Applied reloaded settings: {', '.join(sorted(updates))}")
+
+    def _call_with_options(self, method, options: Dict[str, Any], *args, **kwargs):
+        """
+        Call a mellona client method, passing only the optional keyword arguments it accepts.
+
+        Older mellona releases reject keyword arguments they don't know about. The
+        method's signature is checked before the call and each unsupported option is
+        left out; the request itself is sent once and never retried.
+
+        :param method: Bound client method (e.g. client.transcribe)
+        :param options: Optional keyword arguments, passed where supported
+        :return: Method result
+        """
+        accepted = _accepted_keywords(getattr(method, '__func__', method)) if options else None
+        if accepted is not None:
+            unsupported = sorted(set(options) - accepted)
+            if unsupported:
+                logger.debug(f"Client call does not accept {unsupported}; leaving them out")
+                options = {name: value for name, value in options.items() if name in accepted}
+        return method(*args, **kwargs, **options)
+
+    def _timeouts(self, provider: str) -> RequestTimeouts:
+        """
+        Connect, read and total limits for one request to a provider.
+
+        ``<provider>_timeout`` bounds the whole request, ``<provider>_connect_timeout``
+        (default 10s) connection setup and ``<provider>_read_timeout`` (default: the
+        total) the wait for each chunk of the response. Inside pipeline_deadline() the
+        total is cut to the time the pipeline has left.
+
+        :param provider: 'local_whisper', 'groq', 'ollama', 'openrouter' or 'cline'
+        :return: RequestTimeouts in seconds (None for no limit)
+        """
+        total = self.config.get(f'{provider}_timeout', PROVIDER_TIMEOUTS.get(provider))
+        deadline = _PIPELINE_DEADLINE.get()
+        if deadline is not None:
+            total = deadline.limit(total)
+        connect = self.config.get(f'{provider}_connect_timeout', DEFAULT_CONNECT_TIMEOUT)
+        read = self.config.get(f'{provider}_read_timeout') or total
+        if total is not None:
+            connect = min(connect, total) if connect is not None else total
+            read = min(read, total)
+        return RequestTimeouts(connect, read, total)
+
+    def _request(self, timeout_key: str, method_name: str, options: Dict[str, Any], *args, **kwargs):
+        """
+        Call a mellona client method under a provider's timeouts.
+
+        The limits are passed to mellona (where its signature accepts them) and the
+        total is also enforced here, so a backend that ignores them cannot stall the
+        pipeline. The request runs on its own client, opened and closed by the thread
+        that makes the call, so a request abandoned on timeout never sees its client
+        closed underneath it.
+
+        :param timeout_key: Provider whose timeouts apply (see _timeouts)
+        :param method_name: Client method to call (e.g. 'chat')
+        :param options: Optional keyword arguments (see _call_with_options)
+        :raises TimeoutError: If the request does not finish in time
+        """
+        timeouts = self._timeouts(timeout_key)
+        logger.debug(f"{timeout_key} request limits: {timeouts}")
+
+        def call():
+            with SyncMellonaClient() as client:
+                return self._call_with_options(getattr(client, method_name),
+                                               dict(options, **timeouts.options()), *args, **kwargs)
+
+        with profiling.span(f"request.{timeout_key}"):
+            return call_with_timeout(call, timeouts.total, f"{timeout_key} request")
+
+    def _deadline_passed(self) -> bool:
+        """True when the running pipeline is out of time."""
+        deadline = _PIPELINE_DEADLINE.get()
+        return deadline is not None and deadline.expired()
+
+    @contextmanager
+    def pipeline_deadline(self, seconds: Optional[float] = None) -> Iterator[Deadline]:
+        """
+        Bound every provider request made inside the block by one overall deadline.
+
+        Used around transcribe + process so worst-case latency is predictable in
+        unattended runs. A nested block cannot extend an outer deadline. The deadline
+        applies to the current thread (context) only.
+
+        :param seconds: Time allowed; defaults to pipeline_timeout (None or 0: no deadline)
+        """
+        previous = _PIPELINE_DEADLINE.get()
+        deadline = Deadline(self.config.get('pipeline_timeout') if seconds is None else seconds)
+        if previous is not None and previous.expires_at is not None and (
+                deadline.expires_at is None or previous.expires_at < deadline.expires_at):
+            deadline = previous
+        token = _PIPELINE_DEADLINE.set(deadline)
+        try:
+            yield deadline
+        finally:
+            _PIPELINE_DEADLINE.reset(token)
+
+    def _cache_options(self, profile: str) -> Dict[str, Any]:
+        """
+        Provider prompt-caching options for a chat call.
+
+        Ollama keeps the model (and its KV cache of the shared prompt prefix) loaded for
+        ``ollama_keep_alive``. OpenRouter needs nothing here: most models cache stable
+        prefixes automatically, and models that need explicit cache_control markers on
+        message content parts cannot get them until mellona exposes content parts.
+        Disabled with ``prompt_cache: false``.
+
+        :param profile: mellona profile ('ollama' or 'openrouter')
+        :return: Keyword arguments for client.chat
+        """
+        if not self.config.get('prompt_cache', True):
+            return {}
+        if profile == 'ollama':
+            return {'keep_alive': self.config.get('ollama_keep_alive', '30m')}
+        return {}
+
+    def _transcription_options(self) -> Dict[str, Any]:
+        """
+        Build verbose response options for STT requests.
+
+        Controlled by the ``stt_timestamps`` config key: 'word' (default) requests
+        segment and word timestamps, 'segment' requests segments only, 'none' asks
+        for plain text.
+
+        :return: Keyword arguments for client.transcribe
+        """
+        granularity = self.config.get('stt_timestamps', 'word')
+        if granularity == 'none':
+            return {}
+        granularities = ['segment', 'word'] if granularity == 'word' else ['segment']
+        return {
+            'response_format': 'verbose_json',
+            'timestamp_granularities': granularities,
+        }
+
+    def _llm_model(self, provider: Optional[str] = None) -> str:
+        """Primary model for an LLM provider (default: the configured one)."""
+        provider = provider or self.llm_provider
+        if provider == 'openrouter':
+            models = self._openrouter_models()
+            return models[0] if models else ''
+        if provider == 'cline':
+            return self.config.get('cline_llm_model', 'default-model')
+        return self.config.get('ollama_model', 'llama3')
 
     def _detect_meta_operation(self, text: str) -> bool:
         """
         Detect if user is asking for a transformation of their own text.
 
-        Returns True if keywords indicating meta-operations are detected:
-        outline, summarize, reorder, rearrange, list, bullets, organize
+        Returns True if a meta-operation keyword occurs as a whole word
+        (default: outline, summarize, reorder, rearrange, list, bullets, organize).
 
         :param text: User input text
         :return: True if meta-operation keywords detected
         """
-        keywords = {'outline', 'summarize', 'reorder', 'rearrange', 'list', 'bullets', 'organize'}
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in keywords)
+        return self._meta_matcher.search(text)
 
     def transcribe(self, audio_path: str, recording_timestamp: Optional[str] = None) -> Optional[str]:
         """
@@ -66,21 +335,41 @@ class AIProcessor:
         :param recording_timestamp: Optional timestamp from recording for matching whisper file
         :return: Transcribed text or None if transcription fails
         """
+        transcription = self.transcribe_verbose(audio_path, recording_timestamp)
+        self.last_transcription = transcription
+        return transcription.text if transcription else None
+
+    def transcribe_verbose(self, audio_path: str,
+                           recording_timestamp: Optional[str] = None) -> Optional[Transcription]:
+        """
+        Transcribe audio and return the text with its segment metadata.
+
+        Unlike transcribe(), this does not touch last_transcription, so it is safe to
+        call from several threads at once.
+
+        :param audio_path: Path to the audio file
+        :param recording_timestamp: Optional timestamp from recording for matching whisper file
+        :return: Transcription or None if transcription fails
+        """
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        if self.stt_provider == 'groq':
-            transcript = self._transcribe_groq(audio_path)
-        elif self.stt_provider == 'local_whisper':
-            transcript = self._transcribe_local_whisper(audio_path)
-        else:
-            raise ValueError(f"Unsupported STT provider: {self.stt_provider}")
+        with profiling.span(f"stt.{self.stt_provider}", audio=audio_path):
+            if self.stt_provider == 'groq':
+                transcription = self._transcribe_groq(audio_path)
+            elif self.stt_provider == 'local_whisper':
+                transcription = self._transcribe_local_whisper(audio_path)
+            else:
+                raise ValueError(f"Unsupported STT provider: {self.stt_provider}")
 
         # Save whisper output for recovery
-        if transcript and recording_timestamp:
-            self._save_whisper_output(transcript, recording_timestamp)
+        if transcription and transcription.text and recording_timestamp:
+            with profiling.span("stt.save"):
+                self._save_whisper_output(transcription.text, recording_timestamp)
+                if transcription.has_segments:
+                    self._save_whisper_segments(transcription, recording_timestamp)
 
-        return transcript
+        return transcription
 
     def _save_whisper_output(self, transcript: str, recording_timestamp: str):
         """Save whisper output to file for recovery.
@@ -102,52 +391,75 @@ class AIProcessor:
             if self.config.get('debug'):
                 print(f"Debug: Failed to save whisper output: {e}")
 
+    def _save_whisper_segments(self, transcription: Transcription, recording_timestamp: str):
+        """Save segment and word timestamps next to the whisper recovery file.
+
+        :param transcription: Transcription with segment metadata
+        :param recording_timestamp: Timestamp from recording for matching
+        """
+        temp_dir = self.config.get('temp_dir', './tmp')
+        segments_path = create_whisper_segments_filename(temp_dir, recording_timestamp)
+        try:
+            transcription.save(segments_path)
+            logger.info(f"Whisper segments saved: {segments_path}")
+        except Exception as e:
+            logger.warning(f"Could not save whisper segments: {e}")
+
     def process_with_headers_and_fallback(self, transcript: str, recording_path: Optional[str] = None,
-                                          context: Optional[str] = None) -> str:
+                                          context: Optional[str] = None,
+                                          on_token: Optional[Callable[[str], None]] = None,
+                                          cancel: Optional[threading.Event] = None) -> str:
         """Process transcript with header injection and fallback on LLM failure.
 
         :param transcript: Raw whisper output
         :param recording_path: Path to recording (for source header)
         :param context: Session context
+        :param on_token: Optional callback; when given, output is streamed to it as it arrives
+        :param cancel: Optional event that stops streaming early, keeping the partial output
         :return: LLM output with headers or fallback transcript
         """
-        # Parse existing headers if present
-        existing_header = Header.from_string(transcript)
-
-        if not existing_header:
-            # Build new header
-            source = Path(recording_path).name if recording_path else "unknown"
-            title = generate_title(transcript)
-            project = infer_project_name(transcript)
-
-            header = Header(
-                source=source,
-                status="Awaiting transformation",
-                title=title,
-                project=project
-            )
-        else:
-            header = existing_header
+        with profiling.span("headers.build"):
+            # Parse existing headers if present (only the leading header block is read)
+            existing_header, body_offset = Header.parse(transcript)
+
+            if not existing_header:
+                # Build new header
+                source = Path(recording_path).name if recording_path else "unknown"
+                title = generate_title(transcript)
+                project = infer_project_name(transcript, self._project_matcher)
+
+                header = Header(
+                    source=source,
+                    status="Awaiting transformation",
+                    title=title,
+                    project=project
+                )
+            else:
+                header = existing_header
 
-        # Prepend header to input
-        header_text = header.to_string(include_title=False, include_project=False)
-        augmented_transcript = f"{header_text}\n\n{transcript}"
+            # Prepend header to input, replacing the transcript's own header block if it had one
+            header_text = header.to_string(include_title=False, include_project=False)
+            augmented_transcript = f"{header_text}\n\n{transcript[body_offset:]}"
 
         try:
             # Process with LLM
-            result = self.process_text(augmented_transcript, context)
+            if on_token is None:
+                result = self.process_text(augmented_transcript, context)
+            else:
+                result = self._collect_stream(augmented_transcript, context, on_token, cancel)
 
             # Ensure output has headers
-            output_header = Header.from_string(result)
-            if not output_header:
-                # Inject headers into output
-                result_header = Header(
-                    source=f"second-voice from {header.source}",
-                    status="Awaiting ingest",
-                    title=generate_title(result),
-                    project=infer_project_name(result)
-                )
-                result = f"{result_header.to_string(True, True)}\n\n{result}"
+            with profiling.span("headers.inject"):
+                output_header, _ = Header.parse(result)
+                if not output_header:
+                    # Inject headers into output
+                    result_header = Header(
+                        source=f"second-voice from {header.source}",
+                        status="Awaiting ingest",
+                        title=generate_title(result),
+                        project=infer_project_name(result, self._project_matcher)
+                    )
+                    result = f"{result_header.to_string(True, True)}\n\n{result}"
 
             return result
         except Exception as e:
@@ -163,34 +475,36 @@ class AIProcessor:
             )
             return fallback_msg
 
-    def _transcribe_local_whisper(self, audio_path: str) -> Optional[str]:
+    def _transcribe_local_whisper(self, audio_path: str) -> Optional[Transcription]:
         """
         Transcribe audio using Local Whisper service via mellona.
 
         :param audio_path: Path to the audio file
-        :return: Transcribed text or None
+        :return: Transcription (text plus any segment metadata) or None
         """
         try:
             logger.debug(f"Opening audio file: {audio_path}")
             file_size = os.path.getsize(audio_path)
             logger.debug(f"Audio file size: {file_size} bytes")
 
-            with SyncMellonaClient() as client:
-                logger.debug(f"Sending transcription request to local_whisper provider via mellona")
-                response = client.transcribe(audio_path, provider="local_whisper")
-                logger.debug(f"Transcription successful, text length: {len(response.text) if response.text else 0}")
-                return response.text
+            logger.debug(f"Sending transcription request to local_whisper provider via mellona")
+            response = self._request(
+                'local_whisper', 'transcribe', self._transcription_options(),
+                audio_path, provider="local_whisper"
+            )
+            logger.debug(f"Transcription successful, text length: {len(response.text) if response.text else 0}")
+            return Transcription.from_response(response)
         except Exception as e:
             logger.error(f"Local Whisper transcription error: {type(e).__name__}: {e}")
             print(f"Local Whisper transcription error: {type(e).__name__}: {e}")
             return None
 
-    def _transcribe_groq(self, audio_path: str) -> Optional[str]:
+    def _transcribe_groq(self, audio_path: str) -> Optional[Transcription]:
         """
         Transcribe audio using Groq Whisper API via mellona.
 
         :param audio_path: Path to the audio file
-        :return: Transcribed text or None
+        :return: Transcription (text plus any segment metadata) or None
         """
         model = self.config.get('groq_stt_model', 'whisper-large-v3')
         logger.debug(f"Groq transcription - model: {model}")
@@ -199,11 +513,13 @@ class AIProcessor:
             file_size = os.path.getsize(audio_path)
             logger.debug(f"Opening audio file: {audio_path} ({file_size} bytes)")
 
-            with SyncMellonaClient() as client:
-                logger.debug(f"Sending transcription request to Groq provider via mellona")
-                response = client.transcribe(audio_path, provider="groq", model=model)
-                logger.debug(f"Groq transcription successful, text length: {len(response.text) if response.text else 0}")
-                return response.text
+            logger.debug(f"Sending transcription request to Groq provider via mellona")
+            response = self._request(
+                'groq', 'transcribe', self._transcription_options(),
+                audio_path, provider="groq", model=model
+            )
+            logger.debug(f"Groq transcription successful, text length: {len(response.text) if response.text else 0}")
+            return Transcription.from_response(response)
         except Exception as e:
             logger.error(f"Groq transcription error: {type(e).__name__}: {e}")
             print(f"Transcription error: {e}")
@@ -217,15 +533,156 @@ class AIProcessor:
         :param context: Optional previous conversation context
         :return: LLM processed output
         """
-        if self.llm_provider == 'openrouter':
-            return self._process_openrouter(text, context)
-        elif self.llm_provider == 'ollama':
-            return self._process_ollama(text, context)
-        elif self.llm_provider == 'cline':
-            return self._process_cline(text, context)
-        else:
+        context = self._prepare_context(context)
+        with profiling.span(f"llm.{self.llm_provider}"):
+            if self.llm_provider == 'openrouter':
+                return self._process_openrouter(text, context)
+            elif self.llm_provider == 'ollama':
+                return self._process_ollama(text, context)
+            elif self.llm_provider == 'cline':
+                return self._process_cline(text, context)
+            else:
+                raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
+
+    def stream_text(self, text: str, context: Optional[str] = None,
+                    cancel: Optional[threading.Event] = None) -> Iterator[str]:
+        """
+        Process text through the LLM, yielding output chunks as they arrive.
+
+        Ollama and OpenRouter responses are streamed; Cline has no streaming output and
+        yields its full result once. OpenRouter falls back to the next model only while
+        nothing has been yielded yet. Setting ``cancel`` stops iteration within a fraction
+        of a second, even while waiting on a stalled chunk, and closes the client, which
+        aborts the upstream request.
+
+        :param text: User input/instruction
+        :param context: Optional previous conversation context
+        :param cancel: Optional event that stops generation
+        :return: Iterator of text chunks
+        """
+        context = self._prepare_context(context)
+        if self.llm_provider == 'cline':
+            yield self._process_cline(text, context)
+            return
+        if self.llm_provider not in ('ollama', 'openrouter'):
             raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
 
+        profile = self.llm_provider
+        system_prompt, prompt = self._cleanup_request(text, context, profile)
+        models = self._openrouter_models() if profile == 'openrouter' else [self._llm_model()]
+        if not models:
+            raise RuntimeError("No fallback models configured")
+
+        last_error = None
+        for model_index, model in enumerate(models):
+            started = False
+            try:
+                timeouts = self._timeouts(profile)
+                with SyncMellonaClient() as client:
+                    # The read timeout bounds the wait for each chunk (including the first),
+                    # the total the whole response
+                    model_kwargs = {'model': model} if profile == 'openrouter' else {}
+                    chunks = iterate_with_timeout(
+                        self._stream_chat(
+                            client, dict(self._cache_options(profile), **timeouts.options()),
+                            prompt=prompt,
+                            system=system_prompt,
+                            profile=profile,
+                            **model_kwargs
+                        ),
+                        timeouts.read, timeouts.total, f"{profile} stream", cancel
+                    )
+                    try:
+                        for chunk in chunks:
+                            started = True
+                            yield chunk
+                    finally:
+                        chunks.close()
+                if cancel is not None and cancel.is_set():
+                    logger.info(f"{profile} streaming cancelled by user")
+                return
+            except Exception as e:
+                if started or self._deadline_passed():
+                    raise
+                last_error = f"Error with model {model}: {type(e).__name__}: {e}"
+                logger.warning(last_error)
+
+        raise RuntimeError(f"All {len(models)} {profile} models failed. Last error: {last_error}")
+
+    def _stream_chat(self, client, options: Dict[str, Any], **kwargs) -> Iterator[str]:
+        """
+        Start a streaming chat call and yield its text chunks.
+
+        Uses ``client.stream_chat`` when the installed mellona provides it, otherwise
+        ``client.chat(stream=True)``. Releases without streaming return a complete
+        response, which is yielded as a single chunk.
+        """
+        stream_chat = getattr(client, 'stream_chat', None)
+        if callable(stream_chat):
+            result = self._call_with_options(stream_chat, options, **kwargs)
+        else:
+            result = self._call_with_options(client.chat, dict(options, stream=True), **kwargs)
+
+        text = getattr(result, 'text', None)
+        if isinstance(text, str):
+            yield text
+            return
+        try:
+            for chunk in result:
+                piece = _chunk_text(chunk)
+                if piece:
+                    yield piece
+        finally:
+            # Closing the upstream iterator drops the HTTP response on early exit
+            close = getattr(result, 'close', None)
+            if callable(close):
+                close()
+
+    def _collect_stream(self, text: str, context: Optional[str], on_token: Callable[[str], None],
+                        cancel: Optional[threading.Event] = None) -> str:
+        """Stream output to on_token and return the full (or partial, if cancelled) text."""
+        pieces: List[str] = []
+        with profiling.span(f"llm.{self.llm_provider}.stream"):
+            for chunk in self.stream_text(text, context, cancel):
+                pieces.append(chunk)
+                on_token(chunk)
+        return ''.join(pieces)
+
+    def _openrouter_models(self) -> List[str]:
+        """OpenRouter fallback chain with the user-configured model first."""
+        fallback_models = list(self.config.get('openrouter_fallback_models', []) or [])
+        user_model = self.config.get('openrouter_llm_model', self.config.get('llm_model'))
+        if user_model and user_model not in fallback_models:
+            fallback_models = [user_model] + fallback_models
+        return fallback_models
+
+    def _prompt(self, name: str) -> Prompt:
+        """
+        Look up a registry prompt, honouring versions pinned in the prompt_versions config.
+
+        :param name: Registry name
+        :return: Prompt
+        """
+        version = (self.config.get('prompt_versions') or {}).get(name)
+        try:
+            return PROMPTS.get(name, version)
+        except KeyError as e:
+            logger.warning(f"{e}; using the latest version")
+            return PROMPTS.get(name)
+
+    def _cleanup_request(self, text: str, context: Optional[str], profile: str) -> Tuple[str, str]:
+        """
+        Build the cleanup system prompt and user prompt for a chat call.
+
+        :param text: User input/instruction
+        :param context: Optional (already budgeted) context
+        :param profile: Provider layout: 'ollama', 'openrouter' or 'cline'
+        :return: (system_prompt, prompt)
+        """
+        # Meta-operation variants carry the hint after the stable prefix (system prompt, context)
+        variant = self._prompt(cleanup_variant(profile, bool(context), self._detect_meta_operation(text)))
+        return self._prompt('cleanup.system').text, variant.render(text=text, context=context)
+
     def _process_cline(self, text: str, context: Optional[str] = None) -> str:
         """
         Process text using Cline CLI provider.
@@ -238,35 +695,13 @@ class AIProcessor:
         import shlex
 
         model = self.config.get('cline_llm_model', 'default-model')
-        timeout = self.config.get('cline_timeout', 120)
+        timeout = self._timeouts('cline').total
         api_key = os.environ.get('CLINE_API_KEY', '')
 
         logger.debug(f"Cline CLI config - model: {model}, timeout: {timeout}s")
 
-        # Build system prompt for cleanup operations
-        system_prompt = (
-            "You are a speech cleanup assistant. Your job is to clean up transcribed speech by:\n"
-            "1. Removing stutters and repeated phrases\n"
-            "2. Consolidating similar ideas into coherent statements\n"
-            "3. Fixing grammar and improving sentence structure\n"
-            "4. Maintaining the original meaning and intent\n\n"
-            "IMPORTANT: Do NOT answer questions or provide new information. Only clean up the language.\n\n"
-            "OUTPUT FORMAT: Output ONLY the cleaned text. No preamble, no introduction, no quotation marks. "
-            "Just the cleaned speech itself."
-        )
-
-        # Check for meta-operations (outline, summarize, etc.)
-        if self._detect_meta_operation(text):
-            system_prompt += (
-                "\n\nEXCEPTION: If the user's text contains a request to transform their own words "
-                "(keywords: outline, summarize, reorder, rearrange, list, bullets, organize), "
-                "perform that transformation instead. Still output only the result, no preamble."
-            )
-
-        # Build the input with system prompt prepended
-        full_input = f"{system_prompt}\n\nUser's transcribed speech:\n{text}"
-        if context:
-            full_input = f"{system_prompt}\n\nPrevious Context:\n{context}\n\nUser's transcribed speech:\n{text}"
+        # The cline layout already includes the system prompt
+        _, full_input = self._cleanup_request(text, context, 'cline')
 
         # Prepare the full CLI command
         cmd_parts = [
@@ -319,48 +754,24 @@ class AIProcessor:
         :return: LLM processed output
         """
         model = self.config.get('ollama_model', 'llama3')
-        timeout = self.config.get('ollama_timeout', 300)
+        timeout = self._timeouts('ollama').total
 
         logger.debug(f"Ollama config - model: {model}, timeout: {timeout}s")
 
-        # Build system prompt for cleanup operations
-        system_prompt = (
-            "You are a speech cleanup assistant. Your job is to clean up transcribed speech by:\n"
-            "1. Removing stutters and repeated phrases\n"
-            "2. Consolidating similar ideas into coherent statements\n"
-            "3. Fixing grammar and improving sentence structure\n"
-            "4. Maintaining the original meaning and intent\n\n"
-            "IMPORTANT: Do NOT answer questions or provide new information. Only clean up the language.\n\n"
-            "OUTPUT FORMAT: Output ONLY the cleaned text. No preamble, no introduction, no quotation marks. "
-            "Just the cleaned speech itself."
-        )
-
-        # Check for meta-operations (outline, summarize, etc.)
-        if self._detect_meta_operation(text):
-            system_prompt += (
-                "\nEXCEPTION: If the user's text contains a request to transform their own words "
-                "(keywords: outline, summarize, reorder, rearrange, list, bullets, organize), "
-                "perform that transformation instead. Still output only the result, no preamble.\n"
-            )
-
-        # Build the full prompt with context if provided
-        if context:
-            prompt = f"Previous Context:\n{context}\n\nUser's transcribed speech:\n{text}"
-        else:
-            prompt = f"User's transcribed speech:\n{text}"
+        system_prompt, prompt = self._cleanup_request(text, context, 'ollama')
 
         try:
             logger.debug(f"Sending request to Ollama via mellona")
 
-            with SyncMellonaClient() as client:
-                response = client.chat(
-                    prompt=prompt,
-                    system=system_prompt,
-                    profile='ollama'
-                )
+            response = self._request(
+                'ollama', 'chat', self._cache_options('ollama'),
+                prompt=prompt,
+                system=system_prompt,
+                profile='ollama'
+            )
 
-                logger.debug(f"Ollama processing successful, response length: {len(response.text) if response.text else 0}")
-                return response.text
+            logger.debug(f"Ollama processing successful, response length: {len(response.text) if response.text else 0}")
+            return response.text
 
         except Exception as e:
             error_msg = f"Ollama processing error: {type(e).__name__}: {e}"
@@ -376,47 +787,18 @@ class AIProcessor:
         :param context: Optional previous conversation context
         :return: LLM processed output
         """
-        timeout = self.config.get('openrouter_timeout', 60)
+        timeout = self._timeouts('openrouter').total
 
-        # Get fallback models from config
-        fallback_models = self.config.get('openrouter_fallback_models', [])
+        # User-configured model first, then the fallback chain
+        fallback_models = self._openrouter_models()
         if not fallback_models:
             logger.error("No fallback models configured")
             return "Error: No fallback models configured"
 
-        # Get user-configured model and add to front if specified
-        user_model = self.config.get('openrouter_llm_model', self.config.get('llm_model'))
-        if user_model and user_model not in fallback_models:
-            fallback_models = [user_model] + fallback_models
-
         model = fallback_models[0]
         logger.debug(f"OpenRouter LLM config - primary model: {model}, timeout: {timeout}s, fallback chain: {len(fallback_models)} models")
 
-        # Build system prompt for cleanup operations
-        system_prompt = (
-            "You are a speech cleanup assistant. Your job is to clean up transcribed speech by:\n"
-            "1. Removing stutters and repeated phrases\n"
-            "2. Consolidating similar ideas into coherent statements\n"
-            "3. Fixing grammar and improving sentence structure\n"
-            "4. Maintaining the original meaning and intent\n\n"
-            "IMPORTANT: Do NOT answer questions or provide new information. Only clean up the language.\n\n"
-            "OUTPUT FORMAT: Output ONLY the cleaned text. No preamble, no introduction, no quotation marks. "
-            "Just the cleaned speech itself."
-        )
-
-        # Check for meta-operations (outline, summarize, etc.)
-        if self._detect_meta_operation(text):
-            system_prompt += (
-                "\n\nEXCEPTION: If the user's text contains a request to transform their own words "
-                "(keywords: outline, summarize, reorder, rearrange, list, bullets, organize), "
-                "perform that transformation instead. Still output only the result, no preamble."
-            )
-
-        # Build full input with context if provided
-        if context:
-            full_text = f"Previous conversation context: {context}\n\n{text}"
-        else:
-            full_text = text
+        system_prompt, full_text = self._cleanup_request(text, context, 'openrouter')
 
         # Try each model in the fallback chain
         last_error = None
@@ -424,29 +806,30 @@ class AIProcessor:
             try:
                 logger.debug(f"Attempting OpenRouter request with model {model_index + 1}/{len(fallback_models)}: {model}")
 
-                with SyncMellonaClient() as client:
-                    response = client.chat(
-                        prompt=full_text,
-                        system=system_prompt,
-                        profile='openrouter'
-                    )
+                response = self._request(
+                    'openrouter', 'chat', self._cache_options('openrouter'),
+                    prompt=full_text,
+                    system=system_prompt,
+                    profile='openrouter',
+                    model=model
+                )
 
-                    logger.info(f"OpenRouter processing successful with model: {model} (attempt {model_index + 1}/{len(fallback_models)})")
-                    logger.debug(f"Response length: {len(response.text) if response.text else 0}")
+                logger.info(f"OpenRouter processing successful with model: {model} (attempt {model_index + 1}/{len(fallback_models)})")
+                logger.debug(f"Response length: {len(response.text) if response.text else 0}")
 
-                    # Success - print fallback notice if we didn't use the first model
-                    if model_index > 0:
-                        print(f"Note: Used fallback model {model} after {model_index} failure(s)")
+                # Success - print fallback notice if we didn't use the first model
+                if model_index > 0:
+                    print(f"Note: Used fallback model {model} after {model_index} failure(s)")
 
-                    return response.text
+                return response.text
 
             except Exception as e:
                 error_msg = f"Error with model {model}: {type(e).__name__}: {e}"
                 logger.warning(error_msg)
                 last_error = error_msg
 
-                # If this is the last model, don't try more
-                if model_index >= len(fallback_models) - 1:
+                # If this is the last model, or the pipeline is out of time, don't try more
+                if model_index >= len(fallback_models) - 1 or self._deadline_passed():
                     break
 
                 # Try next model
@@ -471,36 +854,18 @@ class AIProcessor:
         :param project: Optional project name for metadata
         :return: Structured markdown document with headers and formatting
         """
-        # Build document system prompt
-        system_prompt = """You are a document structuring assistant.
-The user has spoken freely about a topic or ideas.
-
-Your job is to:
-1. Extract the main topic (becomes document title)
-2. Identify 3-5 key sections or themes
-3. List specific points under each section as bullet points
-4. Organize logically (chronologically, by importance, or by theme)
-5. Clean up grammar and remove speech artifacts (ums, ahs, stutters)
-6. Keep the user's original meaning and intent intact
-
-OUTPUT FORMAT:
-- Use markdown formatting
-- Start with # Title (one H1)
-- Use ## Section Headers for each topic (H2)
-- Use - bullet points for details
-- Use paragraphs when topic needs explanation
-- No metadata, no preamble, just the document
-
-IMPORTANT: Output ONLY the markdown document.
-Do not include explanations or instructions.
-The document should be ready to save immediately."""
-
-        # Prepare augmented input with system prompt
-        full_input = f"{system_prompt}\n\nSpoken content to structure:\n{transcript}"
-
         try:
-            # Process with LLM using document prompt (not cleanup prompt)
-            result = self._process_with_document_prompt(full_input)
+            # Process with LLM using document prompt (not cleanup prompt); it is sent as the
+            # system prompt so the provider can cache it across documents
+            max_tokens = int(self.config.get('document_chunk_tokens', 3000))
+            with profiling.span(f"llm.{self.llm_provider}.document"):
+                if self.context_manager.counter.count(transcript) > max_tokens:
+                    result = self._map_reduce_document(transcript, max_tokens)
+                else:
+                    result = self._process_with_document_prompt(
+                        self._prompt('document.user').render(transcript=transcript),
+                        system=self._prompt('document.system').text
+                    )
 
             if not result:
                 logger.error("Document processing returned empty result")
@@ -509,7 +874,7 @@ The document should be ready to save immediately."""
             # Inject metadata headers
             source = Path(recording_path).name if recording_path else "voice-input"
             title = generate_title(result)
-            inferred_project = project or infer_project_name(result)
+            inferred_project = project or infer_project_name(result, self._project_matcher)
 
             header = Header(
                 source=source,
@@ -535,54 +900,117 @@ The document should be ready to save immediately."""
             )
             return fallback_msg
 
-    def _process_with_document_prompt(self, text: str) -> str:
+    def _map_reduce_document(self, transcript: str, max_tokens: int) -> str:
+        """
+        Structure a long transcript by outlining chunks in parallel, then merging the outlines.
+
+        Chunks follow STT segment boundaries when the transcript came from the last
+        transcribe() call, otherwise sentence boundaries. Outlines that together still
+        exceed max_tokens are merged in groups until they fit the final pass.
+
+        :param transcript: Raw transcribed text
+        :param max_tokens: Token limit per request
+        :return: Structured document output
+        """
+        counter = self.context_manager.counter
+        transcription = self.last_transcription
+        if transcription and transcription.has_segments and transcription.text.strip() == transcript.strip():
+            chunks = split_segments(transcription.segments, max_tokens, counter)
+        else:
+            chunks = split_text(transcript, max_tokens, counter)
+        logger.info(f"Document mode: structuring {len(chunks)} chunks of up to {max_tokens} tokens")
+
+        map_user = self._prompt('document.map.user')
+        map_system = self._prompt('document.map.system').text
+        outlines = self._map_document_prompts([
+            (map_user.render(index=index + 1, total=len(chunks), chunk=chunk), map_system)
+            for index, chunk in enumerate(chunks)
+        ])
+
+        while len(outlines) > 1 and counter.count('\n\n'.join(outlines)) > max_tokens:
+            groups = group_by_tokens(outlines, max_tokens, counter, separator='\n\n')
+            if len(groups) == len(outlines):
+                break  # every outline is already at the limit; merging cannot shrink further
+            logger.info(f"Document mode: merging {len(outlines)} outlines into {len(groups)}")
+            outlines = self._map_document_prompts([
+                ('\n\n'.join(group), self._prompt('document.merge.system').text) for group in groups
+            ])
+
+        combined = '\n\n'.join(outlines)
+        return self._process_with_document_prompt(
+            self._prompt('document.reduce.user').render(outlines=combined),
+            system=self._prompt('document.reduce.system').text
+        )
+
+    def _map_document_prompts(self, requests: List[Tuple[str, str]]) -> List[str]:
+        """
+        Run (text, system) document requests concurrently, preserving order.
+
+        Concurrency is capped by document_concurrency. Each request runs in a copy of
+        the caller's context, so it stays under the caller's pipeline deadline. Empty
+        results are dropped; any failure propagates so the caller can fall back to the
+        raw transcript.
+        """
+        workers = max(1, min(int(self.config.get('document_concurrency', 4)), len(requests)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='document') as pool:
+            futures = [
+                pool.submit(copy_context().run, self._process_with_document_prompt, text, system=system)
+                for text, system in requests
+            ]
+            results = [future.result() for future in futures]
+        return [result.strip() for result in results if result and result.strip()]
+
+    def _process_with_document_prompt(self, text: str, system: Optional[str] = None) -> str:
         """
         Process text through LLM with document structuring prompt.
 
         Routes to appropriate LLM provider configured in self.llm_provider.
 
-        :param text: Full input including system prompt and content
+        :param text: Content to process (or full input when no system prompt is given)
+        :param system: Optional system prompt, sent separately so providers can cache it
         :return: Structured document output
         """
         if self.llm_provider == 'openrouter':
-            return self._process_openrouter_document(text)
+            return self._process_openrouter_document(text, system)
         elif self.llm_provider == 'ollama':
-            return self._process_ollama_document(text)
+            return self._process_ollama_document(text, system)
         elif self.llm_provider == 'cline':
-            return self._process_cline_document(text)
+            return self._process_cline_document(text, system)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
 
-    def _process_ollama_document(self, text: str) -> str:
+    def _process_ollama_document(self, text: str, system: Optional[str] = None) -> str:
         """Process document using local Ollama instance via mellona."""
         model = self.config.get('ollama_model', 'llama3')
-        timeout = self.config.get('ollama_timeout', 300)
+        timeout = self._timeouts('ollama').total
 
         logger.debug(f"Ollama document processing - model: {model}, timeout: {timeout}s")
 
         try:
             logger.debug(f"Sending document request to Ollama via mellona")
 
-            with SyncMellonaClient() as client:
-                response = client.chat(
-                    prompt=text,
-                    profile='ollama'
-                )
+            kwargs = {'system': system} if system else {}
+            response = self._request(
+                'ollama', 'chat', self._cache_options('ollama'),
+                prompt=text,
+                profile='ollama',
+                **kwargs
+            )
 
-                logger.debug(f"Ollama document processing successful, response length: {len(response.text) if response.text else 0}")
-                return response.text
+            logger.debug(f"Ollama document processing successful, response length: {len(response.text) if response.text else 0}")
+            return response.text
 
         except Exception as e:
             logger.error(f"Ollama document processing error: {type(e).__name__}: {e}")
             raise
 
-    def _process_cline_document(self, text: str) -> str:
+    def _process_cline_document(self, text: str, system: Optional[str] = None) -> str:
         """Process document using Cline CLI provider."""
         import subprocess
         import shlex
 
         model = self.config.get('cline_llm_model', 'default-model')
-        timeout = self.config.get('cline_timeout', 120)
+        timeout = self._timeouts('cline').total
         api_key = os.environ.get('CLINE_API_KEY', '')
 
         logger.debug(f"Cline CLI document processing - model: {model}, timeout: {timeout}s")
@@ -595,7 +1023,8 @@ The document should be ready to save immediately."""
         if api_key:
             cmd_parts.extend(['--api-key', api_key])
 
-        cmd_parts.extend(['--input', text])
+        full_input = f"{system}\n\n{text}" if system else text
+        cmd_parts.extend(['--input', full_input])
 
         try:
             logger.debug(f"Running Cline CLI command for document processing")
@@ -623,21 +1052,17 @@ The document should be ready to save immediately."""
             logger.error(f"Cline document processing error: {type(e).__name__}: {e}")
             raise
 
-    def _process_openrouter_document(self, text: str) -> str:
+    def _process_openrouter_document(self, text: str, system: Optional[str] = None) -> str:
         """Process document using OpenRouter with fallback models via mellona."""
-        timeout = self.config.get('openrouter_timeout', 60)
+        timeout = self._timeouts('openrouter').total
 
-        # Get fallback models from config
-        fallback_models = self.config.get('openrouter_fallback_models', [])
+        # User-configured model first, then the fallback chain
+        fallback_models = self._openrouter_models()
         if not fallback_models:
             error_msg = "No fallback models configured"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
-        user_model = self.config.get('openrouter_llm_model', self.config.get('llm_model'))
-        if user_model and user_model not in fallback_models:
-            fallback_models = [user_model] + fallback_models
-
         logger.debug(f"OpenRouter document processing - primary model: {fallback_models[0]}, fallback chain: {len(fallback_models)} models")
 
         last_error = None
@@ -645,21 +1070,24 @@ The document should be ready to save immediately."""
             try:
                 logger.debug(f"Attempting OpenRouter document request with model {model_index + 1}/{len(fallback_models)}: {model}")
 
-                with SyncMellonaClient() as client:
-                    response = client.chat(
-                        prompt=text,
-                        profile='openrouter'
-                    )
+                kwargs = {'system': system} if system else {}
+                response = self._request(
+                    'openrouter', 'chat', self._cache_options('openrouter'),
+                    prompt=text,
+                    profile='openrouter',
+                    model=model,
+                    **kwargs
+                )
 
-                    logger.info(f"OpenRouter document processing successful with model: {model} (attempt {model_index + 1}/{len(fallback_models)})")
-                    return response.text
+                logger.info(f"OpenRouter document processing successful with model: {model} (attempt {model_index + 1}/{len(fallback_models)})")
+                return response.text
 
             except Exception as e:
                 error_msg = f"Error with model {model}: {type(e).__name__}: {e}"
                 logger.warning(error_msg)
                 last_error = error_msg
 
-                if model_index >= len(fallback_models) - 1:
+                if model_index >= len(fallback_models) - 1 or self._deadline_passed():
                     break
                 continue
 
@@ -667,36 +1095,114 @@ The document should be ready to save immediately."""
         logger.error(error_summary)
         raise RuntimeError(error_summary)
 
-    def save_context(self, context: str, max_context_length: int = 1000):
+    def _prepare_context(self, context: Optional[str]) -> Optional[str]:
         """
-        Save context to a temporary file in the configured temp directory.
+        Fit context to the token budget before it is sent to the LLM.
+
+        When context is the most recently saved turn, the rolling summary and recent
+        turns are rendered instead; any other text is trimmed at a word boundary.
 
-        :param context: Context text to save
-        :param max_context_length: Maximum length of context to retain
+        :param context: Context passed by the caller
+        :return: Budgeted context or None
         """
-        temp_dir = self.config.get('temp_dir', './tmp')
-        context_path = os.path.join(temp_dir, 'tmp-context.txt')
-        
-        # Truncate context if needed
-        truncated_context = context[-max_context_length:]
-        
-        with open(context_path, 'w') as f:
-            f.write(truncated_context)
+        if not context:
+            return None
+        if context == self.context_manager.latest:
+            return self.context_manager.render()
+        return self.context_manager.fit(context)
+
+    def _summarize_context(self, text: str) -> str:
+        """Condense earlier turns with the configured LLM (context_summarizer: llm)."""
+        prompt = self._prompt('context.summary').render(text=text)
+        return self._process_with_document_prompt(prompt)
+
+    def _resume_session(self, session_id: Optional[str]) -> str:
+        """
+        Pick the session to log to and restore its context state.
+
+        :param session_id: Existing session id, 'last' for the newest session, or None
+        :return: Session id to use
+        """
+        if session_id == 'last':
+            session_id = self.session_store.latest_session()
+        if not session_id:
+            return self.session_store.new_session_id()
+
+        record = self.session_store.last(session_id)
+        if record and isinstance(record.get('state'), dict):
+            self.context_manager.load_dict(record['state'])
+            logger.info(f"Resumed session {session_id}")
+        return session_id
+
+    def _stt_model(self) -> Optional[str]:
+        """STT model recorded in the session log."""
+        if self.stt_provider == 'groq':
+            return self.config.get('groq_stt_model', 'whisper-large-v3')
+        return None
+
+    def _append_session(self, record: Dict[str, Any], context: str):
+        """Append a record carrying the current context and resumable state."""
+        record['context'] = context
+        record['state'] = self.context_manager.to_dict()
+        try:
+            self.session_store.append(self.session_id, record)
+        except OSError as e:
+            logger.warning(f"Could not write session log: {e}")
+
+    def record_turn(self, transcript: str, output: str,
+                    timings: Optional[Dict[str, float]] = None) -> str:
+        """
+        Log a completed turn and make its output the context for the next one.
+
+        :param transcript: Transcribed speech for the turn
+        :param output: Final (reviewed) output
+        :param timings: Optional stage durations in seconds, e.g. {'transcribe': 1.2}
+        :return: Budgeted context for the next turn
+        """
+        self.context_manager.add_turn(output)
+        context = self.context_manager.render()
+        self._append_session({
+            'type': 'turn',
+            'transcript': transcript,
+            'output': output,
+            'timings': timings or {},
+            'stt_provider': self.stt_provider,
+            'stt_model': self._stt_model(),
+            'llm_provider': self.llm_provider,
+            'llm_model': self._llm_model(),
+            'prompt_hash': self._prompt('cleanup.system').hash,
+        }, context)
+        return context
+
+    def save_context(self, context: str, max_context_length: Optional[int] = None):
+        """
+        Record context in the session log.
+
+        :param context: Context text to save; empty clears the session context
+        :param max_context_length: Optional hard character limit, bypassing the token budget
+        """
+        if not context:
+            self.context_manager.clear()
+            self._append_session({'type': 'clear'}, '')
+            return
+
+        if max_context_length is not None:
+            saved_context = context[-max_context_length:]
+        else:
+            self.context_manager.add_turn(context)
+            saved_context = self.context_manager.render()
+        self._append_session({'type': 'context'}, saved_context)
 
     def load_context(self) -> Optional[str]:
         """
-        Load the most recent context from temporary files.
+        Load the most recent context of the current session.
 
         :return: Loaded context or None
         """
-        temp_dir = self.config.get('temp_dir', './tmp')
-        context_path = os.path.join(temp_dir, 'tmp-context.txt')
-        
-        try:
-            with open(context_path, 'r') as f:
-                return f.read()
-        except FileNotFoundError:
+        record = self.session_store.last(self.session_id)
+        if record is None:
             return None
+        return record.get('context')
 
     def clear_context(self):
         """
@@ -0,0 +1,224 @@
+"""Versioned prompt registry.
+
+All LLM prompts live here. They are built once at import time, and every variant a call
+can need (provider layout, with or without context, with or without the meta-operation
+hint) is precomputed, so a call only fills in its text. Each prompt has a stable hash
+that caching layers and benchmarks can key on.
+"""
+
+import hashlib
+import string
+from typing import Dict, List, Optional
+
+DEFAULT_VERSION = 'v1'
+
+
+class Prompt:
+    """A named, versioned prompt template."""
+
+    def __init__(self, name: str, version: str, template: str):
+        """
+        :param name: Registry name, e.g. 'cleanup.system'
+        :param version: Version label, e.g. 'v1'
+        :param template: Prompt text with optional str.format fields
+        """
+        self.name = name
+        self.version = version
+        self.template = template
+        self.fields = tuple(field for _, field, _, _ in string.Formatter().parse(template) if field)
+        self.hash = hashlib.sha256(f"{name}@{version}\n{template}".encode('utf-8')).hexdigest()[:12]
+
+    @property
+    def text(self) -> str:
+        """Template text (for prompts without fields)."""
+        return self.template
+
+    def render(self, **values) -> str:
+        """
+        Fill in the template fields.
+
+        :param values: Field values; extra keys are ignored
+        :return: Prompt text
+        """
+        if not self.fields:
+            return self.template
+        return self.template.format(**{field: values.get(field, '') for field in self.fields})
+
+    def __repr__(self) -> str:
+        return f"Prompt({self.name!r}, {self.version!r}, hash={self.hash!r})"
+
+
+class PromptRegistry:
+    """Lookup of prompts by name and version; the last registered version is the default."""
+
+    def __init__(self):
+        self._prompts: Dict[str, Dict[str, Prompt]] = {}
+
+    def register(self, prompt: Prompt):
+        """Add a prompt version."""
+        self._prompts.setdefault(prompt.name, {})[prompt.version] = prompt
+
+    def get(self, name: str, version: Optional[str] = None) -> Prompt:
+        """
+        Return a prompt.
+
+        :param name: Registry name
+        :param version: Version label; defaults to the latest registered version
+        :raises KeyError: If the name or version is unknown
+        """
+        versions = self._prompts.get(name)
+        if not versions:
+            raise KeyError(f"Unknown prompt: {name}")
+        if version is None:
+            return versions[next(reversed(versions))]
+        if version not in versions:
+            raise KeyError(f"Unknown version {version!r} of prompt {name} (have: {', '.join(versions)})")
+        return versions[version]
+
+    def names(self) -> List[str]:
+        """All registered prompt names."""
+        return sorted(self._prompts)
+
+    def versions(self, name: str) -> List[str]:
+        """Registered versions of a prompt, oldest first."""
+        return list(self._prompts.get(name, {}))
+
+    def hashes(self) -> Dict[str, str]:
+        """Hash of the latest version of every prompt."""
+        return {name: self.get(name).hash for name in self.names()}
+
+
+def cleanup_variant(profile: str, context: bool, meta: bool) -> str:
+    """Registry name of the cleanup user prompt for a provider layout and call shape."""
+    name = f"cleanup.user.{profile}"
+    if context:
+        name += '.context'
+    if meta:
+        name += '.meta'
+    return name
+
+
+CLEANUP_SYSTEM = (
+    "You are a speech cleanup assistant. Your job is to clean up transcribed speech by:\n"
+    "1. Removing stutters and repeated phrases\n"
+    "2. Consolidating similar ideas into coherent statements\n"
+    "3. Fixing grammar and improving sentence structure\n"
+    "4. Maintaining the original meaning and intent\n\n"
+    "IMPORTANT: Do NOT answer questions or provide new information. Only clean up the language.\n\n"
+    "OUTPUT FORMAT: Output ONLY the cleaned text. No preamble, no introduction, no quotation marks. "
+    "Just the cleaned speech itself."
+)
+
+# Added to the user message (not the system prompt) when a meta-operation is detected,
+# so the system prompt stays byte-identical across calls and provider prompt caches hit.
+META_OPERATION_HINT = (
+    "Note: this request asks to transform the user's own words "
+    "(keywords: outline, summarize, reorder, rearrange, list, bullets, organize). "
+    "Perform that transformation instead of a plain cleanup. Still output only the result, no preamble."
+)
+
+# User-message layouts per provider: (without context, with context). '{system}' is
+# replaced by the system prompt for providers that take a single input (Cline).
+CLEANUP_LAYOUTS = {
+    'ollama': (
+        "User's transcribed speech:\n{text}",
+        "Previous Context:\n{context}\n\nUser's transcribed speech:\n{text}",
+    ),
+    'openrouter': (
+        "{text}",
+        "Previous conversation context: {context}\n\n{text}",
+    ),
+    'cline': (
+        "{system}\n\nUser's transcribed speech:\n{text}",
+        "{system}\n\nPrevious Context:\n{context}\n\nUser's transcribed speech:\n{text}",
+    ),
+}
+
+DOCUMENT_SYSTEM = """You are a document structuring assistant.
+The user has spoken freely about a topic or ideas.
+
+Your job is to:
+1. Extract the main topic (becomes document title)
+2. Identify 3-5 key sections or themes
+3. List specific points under each section as bullet points
+4. Organize logically (chronologically, by importance, or by theme)
+5. Clean up grammar and remove speech artifacts (ums, ahs, stutters)
+6. Keep the user's original meaning and intent intact
+
+OUTPUT FORMAT:
+- Use markdown formatting
+- Start with # Title (one H1)
+- Use ## Section Headers for each topic (H2)
+- Use - bullet points for details
+- Use paragraphs when topic needs explanation
+- No metadata, no preamble, just the document
+
+IMPORTANT: Output ONLY the markdown document.
+Do not include explanations or instructions.
+The document should be ready to save immediately."""
+
+DOCUMENT_MAP_SYSTEM = (
+    "You are a document structuring assistant working on one part of a long dictation.\n"
+    "Outline this part in markdown: ## headers for its topics and - bullet points for specific points.\n"
+    "Clean up grammar and speech artifacts and keep the speaker's meaning. "
+    "Do not add a title, preamble or closing remarks. Output ONLY the outline."
+)
+
+DOCUMENT_MERGE_SYSTEM = (
+    "You are merging consecutive partial outlines of one long dictation.\n"
+    "Combine them into a single outline in the same markdown form (## headers, - bullet points), "
+    "merging duplicate sections and keeping every specific point in order. Output ONLY the merged outline."
+)
+
+DOCUMENT_REDUCE_NOTE = (
+    "The input is a sequence of section outlines made from consecutive parts of one long dictation, "
+    "not raw speech. Merge them into a single document: one title, sections combined across parts, "
+    "no repeated points."
+)
+
+CONTEXT_SUMMARY = (
+    "Summarize the following earlier drafts in a few sentences. Keep names, "
+    "decisions and open items. Output only the summary.\n\n"
+    "{text}"
+)
+
+
+def _literal(text: str) -> str:
+    """Escape text for embedding in a str.format template."""
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+def load_prompts(version: str = DEFAULT_VERSION) -> PromptRegistry:
+    """
+    Build the registry with every prompt and precomputed cleanup variant.
+
+    :param version: Version label for this prompt set
+    :return: PromptRegistry
+    """
+    registry = PromptRegistry()
+
+    def add(name: str, template: str):
+        registry.register(Prompt(name, version, template))
+
+    add('cleanup.system', CLEANUP_SYSTEM)
+    add('cleanup.meta_hint', META_OPERATION_HINT)
+    meta_text = f"{_literal(META_OPERATION_HINT)}\n\n{{text}}"
+    for profile, layouts in CLEANUP_LAYOUTS.items():
+        for context, layout in enumerate(layouts):
+            layout = layout.replace('{system}', _literal(CLEANUP_SYSTEM))
+            add(cleanup_variant(profile, bool(context), meta=False), layout)
+            add(cleanup_variant(profile, bool(context), meta=True), layout.replace('{text}', meta_text))
+
+    add('document.system', DOCUMENT_SYSTEM)
+    add('document.user', "Spoken content to structure:\n{transcript}")
+    add('document.map.system', DOCUMENT_MAP_SYSTEM)
+    add('document.map.user', "Part {index} of {total}:\n{chunk}")
+    add('document.merge.system', DOCUMENT_MERGE_SYSTEM)
+    add('document.reduce.system', f"{DOCUMENT_SYSTEM}\n\n{DOCUMENT_REDUCE_NOTE}")
+    add('document.reduce.user', "Section outlines, in order:\n{outlines}")
+    add('context.summary', CONTEXT_SUMMARY)
+    return registry
+
+
+# Loaded once at startup
+PROMPTS = load_prompts()
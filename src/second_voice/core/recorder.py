@@ -6,8 +6,10 @@ import time
 import threading
 import logging
 from pathlib import Path
+from typing import Iterator
 
 from ..audio.aac_handler import AACHandler
+from ..utils import profiling
 from ..utils.timestamp import create_recording_filename, create_whisper_filename, extract_timestamp_from_filename
 
 logger = logging.getLogger(__name__)
@@ -26,22 +28,53 @@ class AudioRecorder:
         :param config: Configuration dictionary with audio settings
         """
         self.config = config
-        self._audio_config = config.get('audio_config', {})
+        self._load_settings()
+
+        # Recording state
+        self._recording = False
+        self._settings_changed = False
+        self._audio_data = []
+        self._record_thread = None
+        self._current_amplitude = 0.0
+
+        # Level events: the audio callback publishes a new RMS level level_rate times a
+        # second and wakes anyone waiting in levels()
+        self._level_ready = threading.Condition()
+        self.level_seq = 0
+        self._level_interval = 0
+        self._frames_until_level = 0
+
+    def _load_settings(self):
+        """Read the audio parameters and temp directory from config."""
+        self._audio_config = self.config.get('audio_config', {})
 
         # Default audio recording parameters
         self.sample_rate = self._audio_config.get('sample_rate', 16000)
         self.channels = self._audio_config.get('channels', 1)
         self.device = self._audio_config.get('device', None)
+        # VU level events per second (0 disables metering)
+        self.level_rate = self._audio_config.get('level_rate', 20)
 
         # Temporary audio storage
-        self.temp_dir = config.get('temp_dir', './tmp')
+        self.temp_dir = self.config.get('temp_dir', './tmp')
         os.makedirs(self.temp_dir, exist_ok=True)
 
-        # Recording state
-        self._recording = False
-        self._audio_data = []
-        self._record_thread = None
-        self._current_amplitude = 0.0
+    def apply_config(self, changed):
+        """
+        Pick up reloaded audio settings.
+
+        A recording in progress keeps the settings it started with (its file is written
+        at its own sample rate); the new ones apply from the next recording.
+
+        :param changed: Plain and dotted keys that changed (see ConfigurationManager.subscribe)
+        """
+        if not any(key == 'temp_dir' or key.partition('.')[0] == 'audio_config' for key in changed):
+            return
+        if self._recording:
+            self._settings_changed = True
+            return
+        self._load_settings()
+        logger.info(f"Applied reloaded audio settings: {self.sample_rate}Hz, {self.channels}ch, device {self.device}")
 
     def get_amplitude(self) -> float:
         """
@@ -51,6 +84,35 @@ class AudioRecorder:
         """
         return self._current_amplitude
 
+    def _publish_level(self, level: float):
+        """Record a new level and wake the threads waiting in levels()."""
+        with self._level_ready:
+            self._current_amplitude = level
+            self.level_seq += 1
+            self._level_ready.notify_all()
+
+    def _wake_level_waiters(self):
+        with self._level_ready:
+            self._level_ready.notify_all()
+
+    def levels(self, timeout: float = 0.5) -> Iterator[float]:
+        """
+        Yield each new level (0.0 to 1.0) while recording, blocking until it arrives.
+
+        Ends when recording stops. Levels arrive level_rate times a second; a consumer
+        that falls behind skips to the newest one.
+
+        :param timeout: Longest single wait, so a stalled device can't block forever
+        """
+        seen = self.level_seq
+        while self._recording:
+            with self._level_ready:
+                self._level_ready.wait_for(lambda: self.level_seq != seen or not self._recording, timeout)
+                if self.level_seq == seen:
+                    continue
+                seen, level = self.level_seq, self._current_amplitude
+            yield level
+
     def _calculate_rms(self, audio_data):
         """
         Calculates Root Mean Square (RMS) amplitude from NumPy array.
@@ -88,6 +150,9 @@ class AudioRecorder:
         self._recording = True
         self._audio_data = []
         temp_path = self._create_temp_audio_path()
+        # Frames between level events (the RMS is only computed that often)
+        self._level_interval = max(1, int(self.sample_rate / self.level_rate)) if self.level_rate else 0
+        self._frames_until_level = 0
 
         def callback(indata, frames, time, status):
             """Callback function to handle recording."""
@@ -95,7 +160,11 @@ class AudioRecorder:
                 print(f"Recording status: {status}")
             if self._recording:
                 self._audio_data.append(indata.copy())
-                self._current_amplitude = self._calculate_rms(indata)
+                if self._level_interval:
+                    self._frames_until_level -= frames
+                    if self._frames_until_level <= 0:
+                        self._frames_until_level += self._level_interval
+                        self._publish_level(self._calculate_rms(indata))
 
         try:
             # Start the stream
@@ -116,6 +185,7 @@ class AudioRecorder:
         except Exception as e:
             print(f"Error during recording: {e}")
             self._recording = False
+            self._wake_level_waiters()
             return None
 
     def stop_recording(self):
@@ -133,18 +203,23 @@ class AudioRecorder:
             return None
 
         self._recording = False
+        self._wake_level_waiters()
+        sample_rate = self.sample_rate
+        temp_path = self._create_temp_audio_path()
+        if self._settings_changed:
+            # Settings reloaded while recording take effect now
+            self._settings_changed = False
+            self._load_settings()
 
         # Concatenate recorded audio data
         if not self._audio_data:
             return None
 
-        audio_data = np.concatenate(self._audio_data, axis=0)
-
-        # Create temporary file path
-        temp_path = self._create_temp_audio_path()
+        with profiling.span("recording.write", chunks=len(self._audio_data)):
+            audio_data = np.concatenate(self._audio_data, axis=0)
 
-        # Save audio to file
-        sf.write(temp_path, audio_data, self.sample_rate)
+            # Save audio to file
+            sf.write(temp_path, audio_data, sample_rate)
 
         return temp_path
 
@@ -167,7 +242,8 @@ class AudioRecorder:
             if AACHandler.is_aac_file(file_path):
                 logger.info("soundfile couldn't read AAC, attempting conversion...")
                 try:
-                    wav_path = AACHandler.convert_to_wav(file_path)
+                    with profiling.span("audio.convert_aac"):
+                        wav_path = AACHandler.convert_to_wav(file_path)
                     audio_data, sample_rate = sf.read(wav_path)
                     # Clean up temp WAV
                     try:
@@ -200,15 +276,17 @@ class AudioRecorder:
         # If input is AAC, convert it
         if AACHandler.is_aac_file(file_path):
             wav_path = create_recording_filename(self.temp_dir, format="wav")
-            audio_data, sr = self.read_audio_with_aac_fallback(file_path)
-            sf.write(wav_path, audio_data, sr)
+            with profiling.span("audio.import", format=input_format):
+                audio_data, sr = self.read_audio_with_aac_fallback(file_path)
+                sf.write(wav_path, audio_data, sr)
             logger.info(f"Processed AAC file: {file_path} -> {wav_path}")
             return wav_path, timestamp, input_format
         else:
             # Copy/save existing file with timestamp
             wav_path = create_recording_filename(self.temp_dir, format="wav")
-            audio_data, sr = self.read_audio_with_aac_fallback(file_path)
-            sf.write(wav_path, audio_data, sr)
+            with profiling.span("audio.import", format=input_format):
+                audio_data, sr = self.read_audio_with_aac_fallback(file_path)
+                sf.write(wav_path, audio_data, sr)
             logger.info(f"Processed audio file: {file_path} -> {wav_path}")
             return wav_path, timestamp, input_format
 
@@ -0,0 +1,127 @@
+"""Append-only session log for refinement sessions."""
+
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..utils.timestamp import get_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per step when scanning a session file backwards for its last record
+_TAIL_BLOCK = 8192
+
+
+class SessionStore:
+    """
+    Store session history as one JSON Lines file per session.
+
+    Each call to :meth:`append` writes a single line to ``<directory>/<session_id>.jsonl``,
+    so recording a turn never rewrites earlier history. The file name is the session
+    index: looking up a session opens only its own file, and :meth:`last` reads from the
+    end of that file instead of scanning it.
+    """
+
+    def __init__(self, directory: str):
+        """
+        :param directory: Directory holding the session files (created on first append)
+        """
+        self.directory = directory
+
+    @staticmethod
+    def new_session_id() -> str:
+        """Create a sortable, unique session id."""
+        return f"{get_timestamp()}_{uuid.uuid4().hex[:6]}"
+
+    def path(self, session_id: str) -> str:
+        """Path of a session's log file."""
+        if not session_id or os.sep in session_id or session_id.startswith('.'):
+            raise ValueError(f"Invalid session id: {session_id!r}")
+        return os.path.join(self.directory, f"{session_id}.jsonl")
+
+    def append(self, session_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append a record to a session.
+
+        :param session_id: Session identifier
+        :param record: JSON-serializable record; ``session`` and ``time`` are added
+        :return: The record as written
+        """
+        entry = {'session': session_id, 'time': time.time()}
+        entry.update(record)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path(session_id), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        return entry
+
+    def records(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a session's records in order, for replay or inspection.
+
+        Lines that fail to parse (e.g. a write cut short by a crash) are skipped.
+
+        :param session_id: Session identifier
+        """
+        try:
+            f = open(self.path(session_id), 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt record {session_id}:{line_number}")
+
+    def last(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the most recent valid record of a session without reading the whole file.
+
+        :param session_id: Session identifier
+        :return: Record dictionary, or None if the session has no records
+        """
+        try:
+            f = open(self.path(session_id), 'rb')
+        except FileNotFoundError:
+            return None
+
+        with f:
+            position = f.seek(0, os.SEEK_END)
+            buffer = b''
+            while position > 0:
+                step = min(_TAIL_BLOCK, position)
+                position -= step
+                f.seek(position)
+                buffer = f.read(step) + buffer
+                lines = buffer.split(b'\n')
+                # The first piece may be a partial line unless we reached the start
+                complete = lines if position == 0 else lines[1:]
+                for line in reversed(complete):
+                    if not line.strip():
+                        continue
+                    try:
+                        return json.loads(line.decode('utf-8'))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                buffer = lines[0] if position > 0 else b''
+        return None
+
+    def sessions(self) -> List[str]:
+        """All session ids, oldest first."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(name[:-len('.jsonl')] for name in names if name.endswith('.jsonl'))
+
+    def latest_session(self) -> Optional[str]:
+        """Most recently written session id, or None."""
+        sessions = self.sessions()
+        if not sessions:
+            return None
+        return max(sessions, key=lambda session_id: os.path.getmtime(self.path(session_id)))
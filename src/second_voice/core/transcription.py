@@ -0,0 +1,162 @@
+"""Structured transcription results with segment and word timing."""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Per-segment fields carried over from OpenAI-style verbose_json responses
+SEGMENT_FIELDS = ('id', 'start', 'end', 'text', 'avg_logprob', 'no_speech_prob', 'compression_ratio')
+WORD_FIELDS = ('word', 'start', 'end', 'probability')
+
+
+def _field(obj: Any, name: str) -> Any:
+    """Read a field from either a mapping or an attribute-style object."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _normalize_words(words: Any) -> List[Dict[str, Any]]:
+    if not isinstance(words, (list, tuple)):
+        return []
+    return [{name: _field(word, name) for name in WORD_FIELDS} for word in words]
+
+
+def _normalize_segments(segments: Any) -> List[Dict[str, Any]]:
+    if not isinstance(segments, (list, tuple)):
+        return []
+
+    normalized = []
+    for segment in segments:
+        entry = {name: _field(segment, name) for name in SEGMENT_FIELDS}
+        if isinstance(entry['text'], str):
+            entry['text'] = entry['text'].strip()
+        words = _normalize_words(_field(segment, 'words'))
+        if words:
+            entry['words'] = words
+        normalized.append(entry)
+    return normalized
+
+
+class Transcription:
+    """
+    Transcribed text plus the timing metadata returned by verbose STT responses.
+
+    Segments follow the OpenAI ``verbose_json`` layout: each has ``start``/``end``
+    offsets in seconds, ``text``, ``avg_logprob``, ``no_speech_prob`` and, when word
+    timestamps were requested, a ``words`` list. Providers that only return text
+    produce a Transcription with no segments.
+    """
+
+    def __init__(self, text: str, segments: Optional[List[Dict[str, Any]]] = None,
+                 language: Optional[str] = None, duration: Optional[float] = None):
+        """
+        Initialize a transcription result.
+
+        :param text: Full transcribed text
+        :param segments: Normalized segment dictionaries
+        :param language: Detected or requested language code
+        :param duration: Audio duration in seconds
+        """
+        self.text = text
+        self.segments = segments or []
+        self.language = language
+        self.duration = duration
+
+    @classmethod
+    def from_response(cls, response: Any) -> 'Transcription':
+        """
+        Build a Transcription from a provider response.
+
+        Accepts response objects exposing ``text``/``segments`` attributes, a ``raw``
+        verbose_json payload, or the payload dictionary itself.
+
+        :param response: Provider transcription response
+        :return: Transcription instance
+        """
+        payload = response
+        raw = _field(response, 'raw')
+        if isinstance(raw, dict) and 'segments' in raw:
+            payload = raw
+
+        text = _field(response, 'text')
+        if not isinstance(text, str):
+            text = _field(payload, 'text')
+        if not isinstance(text, str):
+            text = ''
+
+        language = _field(payload, 'language')
+        duration = _field(payload, 'duration')
+
+        return cls(
+            text=text,
+            segments=_normalize_segments(_field(payload, 'segments')),
+            language=language if isinstance(language, str) else None,
+            duration=float(duration) if isinstance(duration, (int, float)) else None,
+        )
+
+    @property
+    def has_segments(self) -> bool:
+        """True when segment-level timing is available."""
+        return bool(self.segments)
+
+    @property
+    def words(self) -> List[Dict[str, Any]]:
+        """All word timestamps across segments, in order."""
+        return [word for segment in self.segments for word in segment.get('words', [])]
+
+    def slice(self, start: float, end: float) -> 'Transcription':
+        """
+        Return the portion of the transcription overlapping an audio window.
+
+        :param start: Window start in seconds
+        :param end: Window end in seconds
+        :return: Transcription containing only the overlapping segments
+        """
+        segments = [
+            segment for segment in self.segments
+            if segment.get('end') is not None and segment.get('start') is not None
+            and segment['end'] > start and segment['start'] < end
+        ]
+        text = ' '.join(segment['text'] for segment in segments if segment.get('text'))
+        return Transcription(text, segments, self.language, self.duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a verbose_json-compatible dictionary."""
+        return {
+            'text': self.text,
+            'language': self.language,
+            'duration': self.duration,
+            'segments': self.segments,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Transcription':
+        """Deserialize from :meth:`to_dict` output."""
+        return cls.from_response(data)
+
+    def save(self, path: str):
+        """
+        Write the transcription as JSON.
+
+        :param path: Destination file path
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['Transcription']:
+        """
+        Load a transcription saved with :meth:`save`.
+
+        :param path: Source file path
+        :return: Transcription, or None if the file is missing or invalid
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not load transcription from {path}: {e}")
+            return None
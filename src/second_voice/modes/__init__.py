@@ -1,18 +1,34 @@
+import importlib
 import os
 import sys
 
 from .menu_mode import MenuMode
 
-# Optional imports with graceful degradation
-try:
-    from .tui_mode import TUIMode
-except ImportError:
-    TUIMode = None
+# Optional modes pull in rich / tkinter, so they are imported on first use;
+# a mode whose dependencies are missing resolves to None (graceful degradation)
+_OPTIONAL_MODES = {
+    'TUIMode': '.tui_mode',
+    'GUIMode': '.gui_mode',
+}
 
-try:
-    from .gui_mode import GUIMode
-except ImportError:
-    GUIMode = None
+
+def _mode_class(name):
+    """Return an optional mode class, importing it on first use (None if unavailable)."""
+    if name in globals():
+        return globals()[name]
+    try:
+        mode_class = getattr(importlib.import_module(_OPTIONAL_MODES[name], __name__), name)
+    except ImportError:
+        mode_class = None
+    globals()[name] = mode_class
+    return mode_class
+
+
+def __getattr__(name):
+    """Resolve TUIMode / GUIMode lazily (PEP 562)."""
+    if name in _OPTIONAL_MODES:
+        return _mode_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def supports_gui():
     """Check if GUI (Tkinter) is available."""
@@ -50,11 +66,11 @@ def detect_mode(config):
         return config.get('mode')
 
     # Check for GUI capability
-    if os.environ.get('DISPLAY') and supports_gui() and GUIMode:
+    if os.environ.get('DISPLAY') and supports_gui() and _mode_class('GUIMode'):
         return 'gui'
 
     # Check for TUI capability
-    if sys.stdout.isatty() and supports_tui() and TUIMode:
+    if sys.stdout.isatty() and supports_tui() and _mode_class('TUIMode'):
         return 'tui'
 
     # Default to menu mode (always available)
@@ -71,12 +87,13 @@ def get_mode(mode_name, config, recorder, processor):
     :return: Instantiated mode object
     """
     mode_mapping = {
-        'menu': MenuMode,
-        'tui': TUIMode,
-        'gui': GUIMode
+        'menu': lambda: MenuMode,
+        'tui': lambda: _mode_class('TUIMode'),
+        'gui': lambda: _mode_class('GUIMode')
     }
 
-    if mode_name not in mode_mapping or mode_mapping[mode_name] is None:
+    mode_class = mode_mapping[mode_name]() if mode_name in mode_mapping else None
+    if mode_class is None:
         raise ValueError(f"Mode {mode_name} not supported or missing dependencies.")
 
-    return mode_mapping[mode_name](config, recorder, processor)
+    return mode_class(config, recorder, processor)
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 import os
 import tempfile
 
+from ..utils import profiling
+
 class BaseMode(ABC):
     """
     Abstract base class defining the interface for different interaction modes.
@@ -24,6 +26,20 @@ class BaseMode(ABC):
         self.temp_dir = os.path.join(config.get('temp_dir', './tmp'), 'mode_tmp')
         os.makedirs(self.temp_dir, exist_ok=True)
 
+    def refresh_config(self) -> bool:
+        """
+        Reload the config file if it changed (cheap: one stat()), unless hot_reload is off.
+
+        Modes call this between recordings, so changes never land mid-pipeline; listeners
+        (see Engine.follow_config) update the recorder and processor.
+
+        :return: True if new settings were loaded
+        """
+        reload = getattr(self.config, 'reload', None)
+        if not callable(reload) or not self.config.get('hot_reload', True):
+            return False
+        return reload() is True
+
     def _create_temp_file(self, prefix='second_voice_', suffix='.md'):
         """
         Create a safe temporary file in the mode's temp directory.
@@ -50,8 +66,9 @@ class BaseMode(ABC):
         if not editor:
             editor = os.environ.get('EDITOR', 'nano')
 
-        # Run editor
-        os.system(f'{editor} {file_path}')
+        # Run editor (the span covers the time the user spends editing)
+        with profiling.span("editor", editor=editor):
+            os.system(f'{editor} {file_path}')
 
         # Read edited contents
         with open(file_path, 'r') as f:
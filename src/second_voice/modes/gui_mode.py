@@ -1,11 +1,16 @@
 import tkinter as tk
 from tkinter import messagebox
+import queue
 import subprocess
 import urllib.parse
 import threading
 import os
 from .base import BaseMode
 
+# How often the Tk loop picks up chunks streamed by the worker thread
+STREAM_POLL_MS = 50
+
+
 class GUIMode(BaseMode):
     """
     GUI Mode implementation using Tkinter.
@@ -17,6 +22,14 @@ class GUIMode(BaseMode):
         self.root = None
         self.is_recording = False
         self.last_output = ""
+        self._cancel = threading.Event()
+        # True from submit until the response has been reviewed; record/submit are ignored
+        self._busy = False
+        # Chunks handed from the streaming worker to the Tk loop
+        self._stream_queue: queue.Queue = queue.Queue()
+        # Pending meter redraw and the level it last drew
+        self._vu_job = None
+        self._vu_seq = None
         self.buffer_file = os.path.join(self.config.get('vault_path', os.path.expanduser("~/Documents/Obsidian/VoiceInbox")), ".review_buffer.md")
         
         # Ensure vault path exists if we are going to use it
@@ -61,7 +74,7 @@ class GUIMode(BaseMode):
         """Start the GUI main loop."""
         self.root = tk.Tk()
         self.root.title("Second Voice (Recursive Mode)")
-        self.root.geometry("400x350")
+        self.root.geometry("400x450")
         
         self._build_ui()
         self.root.mainloop()
@@ -79,6 +92,10 @@ class GUIMode(BaseMode):
         self.context_indicator = tk.Label(self.root, text="Context: Empty", fg="gray")
         self.context_indicator.pack()
 
+        # Live preview of streamed output (Escape stops generation)
+        self.output_preview = tk.Text(self.root, height=5, width=48, wrap=tk.WORD, state=tk.DISABLED)
+        self.output_preview.pack(pady=5)
+
         self.btn_rec = tk.Button(self.root, text="Start Recording (Space)", command=self.toggle, width=30)
         self.btn_rec.pack(pady=10)
         
@@ -89,13 +106,23 @@ class GUIMode(BaseMode):
         self.btn_clear.pack(pady=5)
 
         self.root.bind("<space>", lambda e: self.toggle())
+        self.root.bind("<Escape>", lambda e: self._cancel.set())
         self.root.bind("<Return>", lambda e: self.submit() if self.btn_sub['state'] == 'normal' else None)
         
-        # Start update loop
-        self._update_vu()
-
     def _update_vu(self):
-        if self.is_recording:
+        """
+        Redraw the meter when the recorder has published a new level.
+
+        Tk must be driven from its own thread, so this runs on the Tk loop, only while
+        recording and at the recorder's level rate.
+        """
+        self._vu_job = None
+        if not self.is_recording:
+            self.vu_canvas.coords(self.vu_bar, 0, 0, 0, 40)
+            return
+
+        if self.recorder.level_seq != self._vu_seq:
+            self._vu_seq = self.recorder.level_seq
             amp = self.recorder.get_amplitude()
             self.vu_canvas.coords(self.vu_bar, 0, 0, int(amp * 300), 40)
             # Color transition based on amplitude
@@ -105,10 +132,68 @@ class GUIMode(BaseMode):
                 self.vu_canvas.itemconfig(self.vu_bar, fill="yellow")
             else:
                 self.vu_canvas.itemconfig(self.vu_bar, fill="green")
-        else:
-            self.vu_canvas.coords(self.vu_bar, 0, 0, 0, 40)
-            
-        self.root.after(50, self._update_vu)
+
+        level_rate = self.recorder.level_rate or 20
+        self._vu_job = self.root.after(max(10, int(1000 / level_rate)), self._update_vu)
+
+    def _stream_response(self, text: str, on_done):
+        """
+        Process text, showing output in the preview as it streams in.
+
+        The stream is consumed on a worker thread, so Escape cancels it even while it is
+        waiting for a chunk; chunks reach the widgets through the Tk loop (see
+        _drain_stream). Returns at once; on_done gets the full (or partial) output, or
+        the exception that ended the stream.
+
+        :param text: Transcribed text
+        :param on_done: Called on the Tk loop as on_done(output, error)
+        """
+        if not self.config.get('stream_output', True):
+            try:
+                output = self.processor.process_text(text, context=self.last_output)
+            except Exception as e:
+                on_done(None, e)
+            else:
+                on_done(output, None)
+            return
+
+        self._cancel = threading.Event()
+        self._stream_queue = queue.Queue()
+        self.output_preview.config(state=tk.NORMAL)
+        self.output_preview.delete('1.0', tk.END)
+
+        def consume(cancel, chunks, context):
+            error = None
+            try:
+                for chunk in self.processor.stream_text(text, context, cancel):
+                    chunks.put(chunk)
+            except Exception as e:
+                error = e
+            chunks.put((None, error))
+
+        threading.Thread(target=consume, args=(self._cancel, self._stream_queue, self.last_output),
+                         name='gui-stream', daemon=True).start()
+        self.root.after(STREAM_POLL_MS, self._drain_stream, [], on_done)
+
+    def _drain_stream(self, pieces, on_done):
+        """Show chunks the worker has streamed so far; finish once it is done (runs on the Tk loop)."""
+        while True:
+            try:
+                item = self._stream_queue.get_nowait()
+            except queue.Empty:
+                self.root.after(STREAM_POLL_MS, self._drain_stream, pieces, on_done)
+                return
+            if isinstance(item, tuple):
+                break
+            pieces.append(item)
+            self.output_preview.insert(tk.END, item)
+            self.output_preview.see(tk.END)
+
+        self.output_preview.config(state=tk.DISABLED)
+        _, error = item
+        if error is None and self._cancel.is_set():
+            self.show_status("Generation stopped; keeping partial output.")
+        on_done(''.join(pieces) if error is None else None, error)
 
     def clear_context(self):
         self.last_output = ""
@@ -116,11 +201,18 @@ class GUIMode(BaseMode):
         self.context_indicator.config(text="Context: Empty", fg="gray")
 
     def toggle(self):
+        if self._busy:
+            return
         if not self.is_recording:
             self.is_recording = True
             self.btn_rec.config(text="Stop (Space)", fg="red")
             self.btn_sub.config(state=tk.DISABLED)
+            self.refresh_config()
             self.start_recording()
+            if self._vu_job:
+                self.root.after_cancel(self._vu_job)
+            self._vu_seq = None
+            self._update_vu()
             self.show_status("Recording...")
         else:
             self.is_recording = False
@@ -130,27 +222,37 @@ class GUIMode(BaseMode):
             self.show_status("Recording stopped. Ready to process.")
 
     def submit(self):
+        if self._busy:
+            return
         if not hasattr(self, 'audio_file') or not self.audio_file:
             messagebox.showerror("Error", "No audio recorded")
             return
 
         self.show_status("⌛ Processing Iteration...")
-        
-        # Run processing in a separate thread to avoid freezing UI
-        # But Tkinter is not thread-safe, so we need to be careful. 
-        # For simplicity in this port, we'll keep it synchronous or use simple update() calls.
-        
+        # Record and submit stay off until the response has been reviewed
+        self._busy = True
+        self.btn_rec.config(state=tk.DISABLED)
+        self.btn_sub.config(state=tk.DISABLED)
+
         try:
             # 1. Transcribe
             self.show_status("Transcribing...")
             text = self.processor.transcribe(self.audio_file)
             print(f"User: {text}")
 
-            # 2. Process with LLM
+            # 2. Process with LLM (streamed on a worker thread; _review continues)
             self.show_status("Thinking...")
-            
-            response = self.processor.process_text(text, context=self.last_output)
-            
+            self._stream_response(text, self._review)
+
+        except Exception as e:
+            self._review(None, e)
+
+    def _review(self, response, error):
+        """Review the processed response and make it the next round's context."""
+        try:
+            if error is not None:
+                raise error
+
             # 3. Review
             self.last_output = self.review_output(response)
             print(self.last_output)
@@ -162,3 +264,7 @@ class GUIMode(BaseMode):
         except Exception as e:
             messagebox.showerror("Error", str(e))
             self.show_status("Error occurred")
+        finally:
+            self._busy = False
+            self.btn_rec.config(state=tk.NORMAL)
+            self.btn_sub.config(state=tk.NORMAL)
@@ -2,9 +2,13 @@ import os
 import time
 import signal
 import sys
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
 
 from .base import BaseMode
+from ..core.pipeline import RecordingPipeline
+from ..utils.keypress import cancel_on_keypress
 
 class MenuMode(BaseMode):
     """
@@ -25,6 +29,17 @@ class MenuMode(BaseMode):
         # Capture original signal handler
         self._original_sigint = signal.getsignal(signal.SIGINT)
 
+        # Recordings transcribed and processed in the background (see menu_pipeline)
+        self._pipeline = RecordingPipeline(self._background_job, name='menu-pipeline')
+        # Audio of submitted recordings not yet presented, by job id
+        self._queued: Dict[int, str] = {}
+        self._job_ids = 0
+        # (job id, output) the next queued recording uses as context
+        self._latest_output: Tuple[int, Optional[str]] = (0, None)
+        # Held by the worker for a whole job and by the menu for context/session updates,
+        # so the two threads never use the processor at the same time
+        self._processor_lock = threading.Lock()
+
     def start_recording(self) -> Optional[str]:
         """
         Start audio recording with a text countdown and VU meter.
@@ -41,21 +56,22 @@ class MenuMode(BaseMode):
             
             self.recorder.start_recording()
             
-            while True:
-                amp = self.recorder.get_amplitude()
+            # Redraw on each level event; the loop only ends early if recording fails
+            for amp in self.recorder.levels():
                 bar_len = min(int(amp * 50), 10)
                 vu_bar = "#" * bar_len + "-" * (10 - bar_len)
                 sys.stdout.write(f"\rLevel: [{vu_bar}] ")
                 sys.stdout.flush()
-                time.sleep(0.1)
                 
         except KeyboardInterrupt:
-            audio_path = self.recorder.stop_recording()
-            print("\nRecording stopped.")
+            pass
             
         finally:
             # Restore original signal handler
             signal.signal(signal.SIGINT, self._original_sigint)
+
+        audio_path = self.recorder.stop_recording()
+        print("\nRecording stopped.")
         
         if audio_path:
             self.show_status(f"✓ Recorded audio: {os.path.basename(audio_path)}")
@@ -107,6 +123,232 @@ class MenuMode(BaseMode):
         """
         print(message)
 
+    def _process(self, transcription: str, recording_path: str, context: Optional[str],
+                 stream: bool = True) -> str:
+        """
+        Run LLM processing, printing output as it streams in.
+
+        Any keypress stops generation and keeps the partial output for review.
+
+        :param transcription: Transcribed text
+        :param recording_path: Path of the source recording (for headers)
+        :param context: Previous context
+        :param stream: Stream output to the terminal (disabled by stream_output: false)
+        :return: Processed output
+        """
+        if not (stream and self.config.get('stream_output', True)):
+            return self.processor.process_with_headers_and_fallback(
+                transcription,
+                recording_path=recording_path,
+                context=context
+            )
+
+        def on_token(chunk: str):
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+
+        self.show_status("(press any key to stop generation)")
+        with cancel_on_keypress() as cancel:
+            output = self.processor.process_with_headers_and_fallback(
+                transcription,
+                recording_path=recording_path,
+                context=context,
+                on_token=on_token,
+                cancel=cancel
+            )
+        print()
+        if cancel.is_set():
+            self.show_status("⏹ Generation stopped; keeping partial output.")
+        return output
+
+    def _transcribe_and_process(self, audio_path: str, recording_timestamp: str,
+                                context: Optional[str], stream: bool = True, quiet: bool = False):
+        """
+        Transcribe a recording and process it, within the pipeline deadline.
+
+        :param audio_path: Recording to transcribe
+        :param recording_timestamp: Timestamp for the whisper recovery file
+        :param context: Previous context
+        :param stream: Stream output to the terminal
+        :param quiet: Print nothing (background processing; implies no streaming)
+        :return: (transcription, output, timings); output is None if transcription failed
+        """
+        with self.processor.pipeline_deadline():
+            started = time.monotonic()
+            transcription = self.processor.transcribe(audio_path, recording_timestamp)
+            timings = {'transcribe': time.monotonic() - started}
+            if not transcription:
+                return transcription, None, timings
+
+            if not quiet:
+                self.show_transcription(transcription)
+                # Process with LLM
+                self.show_status("⌛ Processing...")
+            started = time.monotonic()
+            output = self._process(transcription, audio_path, context, stream=stream and not quiet)
+            timings['process'] = time.monotonic() - started
+        return transcription, output, timings
+
+    def _pipelined(self) -> bool:
+        """
+        True if recordings are processed in the background while the user keeps recording.
+
+        Opt-in: background results are shown only when the menu returns, without streaming.
+        """
+        return bool(self.config.get('menu_pipeline', False))
+
+    def _submit(self, audio_path: str, recording_timestamp: str, context: Optional[str]):
+        """Queue a recording for background transcription and processing."""
+        if not self._pipeline.pending:
+            # Nothing in flight: the recording follows on from the reviewed context
+            self._latest_output = (self._latest_output[0], context)
+        self._job_ids += 1
+        self._queued[self._job_ids] = audio_path
+        self._pipeline.submit({'id': self._job_ids, 'audio_path': audio_path,
+                               'timestamp': recording_timestamp})
+
+    @contextmanager
+    def _processor_access(self):
+        """Use the processor from the menu, waiting for a running background job first."""
+        if not self._processor_lock.acquire(blocking=False):
+            self.show_status("⌛ Waiting for background processing...")
+            self._processor_lock.acquire()
+        try:
+            yield self.processor
+        finally:
+            self._processor_lock.release()
+
+    def _background_job(self, job: Dict[str, Any]):
+        """Transcribe and process one queued recording (runs on the pipeline's worker thread)."""
+        with self._processor_lock:
+            transcription, output, timings = self._transcribe_and_process(
+                job['audio_path'], job['timestamp'], self._latest_output[1], quiet=True
+            )
+        if transcription:
+            # Until it is reviewed, the next queued recording follows on from this output
+            self._latest_output = (job['id'], output)
+        return transcription, output, timings
+
+    def _present_finished(self, context: Optional[str], cli_output_file: Optional[str],
+                          output_file: Optional[str], wait: bool = False):
+        """
+        Present background results that have finished, in the order they were recorded.
+
+        :param wait: Also wait for recordings still being processed
+        :return: (context, output_file) after reviewing them
+        """
+        while True:
+            results = self._pipeline.ready()
+            if not results and wait and self._pipeline.pending:
+                result = self._pipeline.wait()
+                results = [result] if result else []
+            if not results:
+                return context, output_file
+
+            for result in results:
+                job = result.item
+                audio_path, recording_timestamp = job['audio_path'], job['timestamp']
+                self._queued.pop(job['id'], None)
+                self.show_status(f"\n📼 Recording {job['id']} ({os.path.basename(audio_path)}) "
+                                 f"processed in {result.elapsed:.1f}s")
+                try:
+                    if not result.ok:
+                        raise result.error
+                    transcription, output, timings = result.value
+                    if transcription:
+                        self.show_transcription(transcription)
+                    context, saved = self._present_result(
+                        audio_path, recording_timestamp, transcription, output, timings,
+                        context, cli_output_file
+                    )
+                    output_file = saved or output_file
+                except Exception as e:
+                    self._keep_failed_recording(audio_path, recording_timestamp, e)
+                    continue
+                if self._latest_output[0] == job['id']:
+                    # No later recording has used this output yet; give it the reviewed text
+                    self._latest_output = (job['id'], context)
+
+    def _present_result(self, audio_path: str, recording_timestamp: str, transcription: Optional[str],
+                        output: Optional[str], timings: Dict[str, float], context: Optional[str],
+                        cli_output_file: Optional[str]):
+        """
+        Save, review and log one processed recording, then delete its audio.
+
+        :return: (new context, cli_output_file if it was written, else None)
+        """
+        saved = None
+        if not transcription:
+            # Transcription failed - keep files for debugging
+            from ..utils.timestamp import create_whisper_filename
+            print(f"⚠️ Transcription failed - keeping audio file: {audio_path}")
+            whisper_file = create_whisper_filename(self.processor.config.get('temp_dir', './tmp'), recording_timestamp)
+            if os.path.exists(whisper_file):
+                print(f"⚠️ Kept whisper output: {whisper_file}")
+            return context, saved
+
+        # Save to CLI output file if specified
+        if cli_output_file:
+            try:
+                os.makedirs(os.path.dirname(cli_output_file) or '.', exist_ok=True)
+                with open(cli_output_file, 'w', encoding='utf-8') as f:
+                    f.write(output)
+                print(f"✓ Output saved: {cli_output_file}")
+                saved = cli_output_file
+            except Exception as e:
+                print(f"Warning: Could not save output file: {e}")
+
+        # Skip editor if --no-edit flag is set
+        if self.config.get('no_edit'):
+            if not cli_output_file:
+                print(f"📋 Output: {output}")
+            # Update context even without editing
+            context = output
+            with self._processor_access() as processor:
+                processor.record_turn(transcription, output, timings)
+        else:
+            # Review output
+            started = time.monotonic()
+            edited_output = self.review_output(output, context)
+            timings['review'] = time.monotonic() - started
+
+            # Update context
+            context = edited_output
+            with self._processor_access() as processor:
+                processor.record_turn(transcription, edited_output, timings)
+
+            # Update CLI output file with edited content if specified
+            if cli_output_file:
+                try:
+                    with open(cli_output_file, 'w', encoding='utf-8') as f:
+                        f.write(edited_output)
+                    print(f"✓ Output updated: {cli_output_file}")
+                except Exception as e:
+                    print(f"Warning: Could not update output file: {e}")
+
+        # Clean up temporary audio file (but protect user-provided input files)
+        input_file = self.config.get('input_file')
+        if not self.config.get('keep_files'):
+            if audio_path != input_file:
+                os.unlink(audio_path)
+        return context, saved
+
+    def _keep_failed_recording(self, audio_path: str, recording_timestamp: str, error: Exception):
+        """Report a processing failure, keeping the recording (and whisper output) for debugging."""
+        from ..utils.timestamp import create_whisper_filename
+        print(f"⚠️ Error during processing: {error}")
+        print(f"⚠️ Kept audio file for debugging: {audio_path}")
+        whisper_file = create_whisper_filename(self.processor.config.get('temp_dir', './tmp'), recording_timestamp)
+        if os.path.exists(whisper_file):
+            print(f"⚠️ Kept whisper output: {whisper_file}")
+
+    def _abandon_pipeline(self):
+        """Stop background processing on exit, listing the recordings that were not presented."""
+        self._pipeline.close(cancel=True)
+        for audio_path in self._queued.values():
+            print(f"⚠️ Kept unprocessed recording: {audio_path}")
+        self._queued.clear()
+
     def _display_menu(self):
         """
         Display the main menu.
@@ -117,6 +359,9 @@ class MenuMode(BaseMode):
         print("[2] Show context")
         print("[3] Clear context")
         print("[4] Quit")
+        if self._pipeline.pending:
+            print(f"⌛ {self._pipeline.pending} recording(s) processing "
+                  f"(press Enter to review finished ones)")
 
     def _save_output_for_google_drive(self, output: str, audio_path: str) -> Optional[str]:
         """Save output .md file to inbox directory with timestamp from audio file.
@@ -205,19 +450,12 @@ class MenuMode(BaseMode):
                 # Generate timestamp for external file to ensure transcription is saved
                 from ..utils.timestamp import get_timestamp
                 file_timestamp = get_timestamp()
-                transcription = self.processor.transcribe(input_file, file_timestamp)
+                transcription, output, timings = self._transcribe_and_process(
+                    input_file, file_timestamp, context,
+                    stream=not self.config.get('no_edit')
+                )
 
                 if transcription:
-                    self.show_transcription(transcription)
-
-                    # Process with LLM
-                    self.show_status("⌛ Processing...")
-                    output = self.processor.process_with_headers_and_fallback(
-                        transcription,
-                        recording_path=input_file,
-                        context=context
-                    )
-
                     # Determine where to save output
                     # Priority: CLI --output-file > Google Drive inbox > None
                     if cli_output_file:
@@ -240,15 +478,18 @@ class MenuMode(BaseMode):
                     if self.config.get('no_edit'):
                         if not output_file:
                             print(f"📋 Output: {output}")
+                        self.processor.record_turn(transcription, output, timings)
                         self.cleanup()
                         return output_file
 
                     # Review output
+                    started = time.monotonic()
                     edited_output = self.review_output(output, context)
+                    timings['review'] = time.monotonic() - started
 
                     # Update context
                     context = edited_output
-                    self.processor.save_context(context)
+                    self.processor.record_turn(transcription, edited_output, timings)
 
                     # Update output file with edited content if file was specified
                     if output_file:
@@ -276,89 +517,48 @@ class MenuMode(BaseMode):
 
         while True:
             try:
+                context, output_file = self._present_finished(context, cli_output_file, output_file)
+                if not self._pipeline.pending:
+                    # Settings change only between jobs, never under a running one
+                    self.refresh_config()
                 self._display_menu()
                 choice = input("Choice: ").strip()
 
+                if not choice and self._pipeline.pending:
+                    continue  # Enter refreshes while recordings are being processed
+
                 if choice == '1':  # Record
                     audio_path = self.start_recording()
                     if audio_path:
                         # Generate timestamp for whisper file tracking
-                        from ..utils.timestamp import get_timestamp, create_whisper_filename
+                        from ..utils.timestamp import get_timestamp
                         recording_timestamp = get_timestamp()
 
+                        if self._pipelined():
+                            # Transcribe and process in the background; keep dictating
+                            self._submit(audio_path, recording_timestamp, context)
+                            self.show_status("⌛ Queued for transcription; results are shown as they finish.")
+                            continue
+
                         # Transcribe
                         self.show_status("⌛ Transcribing...")
                         try:
-                            transcription = self.processor.transcribe(audio_path, recording_timestamp)
-
-                            if transcription:
-                                self.show_transcription(transcription)
-
-                                # Process with LLM
-                                self.show_status("⌛ Processing...")
-                                output = self.processor.process_with_headers_and_fallback(
-                                    transcription,
-                                    recording_path=audio_path,
-                                    context=context
-                                )
-
-                                # Save to CLI output file if specified
-                                if cli_output_file:
-                                    try:
-                                        os.makedirs(os.path.dirname(cli_output_file) or '.', exist_ok=True)
-                                        with open(cli_output_file, 'w', encoding='utf-8') as f:
-                                            f.write(output)
-                                        print(f"✓ Output saved: {cli_output_file}")
-                                        output_file = cli_output_file
-                                    except Exception as e:
-                                        print(f"Warning: Could not save output file: {e}")
-
-                                # Skip editor if --no-edit flag is set
-                                if self.config.get('no_edit'):
-                                    if not cli_output_file:
-                                        print(f"📋 Output: {output}")
-                                    # Update context even without editing
-                                    context = output
-                                    self.processor.save_context(context)
-                                else:
-                                    # Review output
-                                    edited_output = self.review_output(output, context)
-
-                                    # Update context
-                                    context = edited_output
-                                    self.processor.save_context(context)
-
-                                    # Update CLI output file with edited content if specified
-                                    if cli_output_file:
-                                        try:
-                                            with open(cli_output_file, 'w', encoding='utf-8') as f:
-                                                f.write(edited_output)
-                                            print(f"✓ Output updated: {cli_output_file}")
-                                        except Exception as e:
-                                            print(f"Warning: Could not update output file: {e}")
-
-                                # Clean up temporary audio file (but protect user-provided input files)
-                                input_file = self.config.get('input_file')
-                                if not self.config.get('keep_files'):
-                                    if audio_path != input_file:
-                                        os.unlink(audio_path)
-                            else:
-                                # Transcription failed - keep files for debugging
-                                print(f"⚠️ Transcription failed - keeping audio file: {audio_path}")
-                                whisper_file = create_whisper_filename(self.processor.config.get('temp_dir', './tmp'), recording_timestamp)
-                                if os.path.exists(whisper_file):
-                                    print(f"⚠️ Kept whisper output: {whisper_file}")
+                            transcription, output, timings = self._transcribe_and_process(
+                                audio_path, recording_timestamp, context
+                            )
+                            context, saved = self._present_result(
+                                audio_path, recording_timestamp, transcription, output, timings,
+                                context, cli_output_file
+                            )
+                            output_file = saved or output_file
                         except Exception as e:
-                            # Processing failed - keep files for debugging
-                            print(f"⚠️ Error during processing: {e}")
-                            print(f"⚠️ Kept audio file for debugging: {audio_path}")
-                            whisper_file = create_whisper_filename(self.processor.config.get('temp_dir', './tmp'), recording_timestamp)
-                            if os.path.exists(whisper_file):
-                                print(f"⚠️ Kept whisper output: {whisper_file}")
+                            self._keep_failed_recording(audio_path, recording_timestamp, e)
 
                 elif choice == '2':  # Show context
-                    current_context = context or self.processor.load_context()
+                    with self._processor_access() as processor:
+                        current_context = processor.load_context() or context
                     if current_context:
+                        print(f"Session {self.processor.session_id}")
                         print(f"Current Context ({len(current_context)} chars):")
                         print(current_context)
                     else:
@@ -366,10 +566,16 @@ class MenuMode(BaseMode):
 
                 elif choice == '3':  # Clear context
                     context = None
-                    self.processor.save_context('')
+                    self._latest_output = (self._latest_output[0], None)
+                    with self._processor_access() as processor:
+                        processor.save_context('')
                     print("Context cleared.")
 
                 elif choice == '4':  # Quit
+                    if self._pipeline.pending:
+                        self.show_status(f"⌛ Waiting for {self._pipeline.pending} recording(s) to finish...")
+                        context, output_file = self._present_finished(context, cli_output_file, output_file,
+                                                                      wait=True)
                     self.cleanup()
                     break
 
@@ -378,10 +584,12 @@ class MenuMode(BaseMode):
 
             except KeyboardInterrupt:
                 print("\nExiting...")
+                self._abandon_pipeline()
                 self.cleanup()
                 break
             except Exception as e:
                 print(f"An error occurred: {e}")
 
         # Restore resources
+        self._pipeline.close()
         self.cleanup()
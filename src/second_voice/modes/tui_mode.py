@@ -13,6 +13,7 @@ except ImportError:
     rich = None
 
 from .base import BaseMode
+from ..utils.keypress import cancel_on_keypress
 
 class TUIMode(BaseMode):
     """
@@ -71,23 +72,21 @@ class TUIMode(BaseMode):
             
             self.recorder.start_recording()
             
-            # Use Live display for VU meter
-            while True:
-                amp = self.recorder.get_amplitude()
+            # Use Live display for VU meter, redrawn on each level event
+            for amp in self.recorder.levels():
                 bar_len = int(amp * 20)
                 vu_bar = "█" * bar_len + "░" * (20 - bar_len)
                 self.show_status(f"🎤 Recording: [{vu_bar}] (Ctrl+C to stop)")
-                time.sleep(0.1)
                 
         except KeyboardInterrupt:
-            audio_path = self.recorder.stop_recording()
-            return audio_path
+            pass
 
-            
         finally:
             # Restore original signal handler
             signal.signal(signal.SIGINT, original_sigint)
 
+        return self.recorder.stop_recording()
+
 
     def show_transcription(self, text: str):
         """
@@ -130,6 +129,27 @@ class TUIMode(BaseMode):
         
         return edited_text
 
+    def stream_output(self, text: str, context: Optional[str] = None) -> str:
+        """
+        Process text, rendering the output pane as chunks arrive.
+
+        Any keypress stops generation and keeps the partial output.
+
+        :param text: Transcribed text
+        :param context: Optional previous context
+        :return: Processed output
+        """
+        pieces = []
+        with cancel_on_keypress() as cancel:
+            for chunk in self.processor.stream_text(text, context, cancel):
+                pieces.append(chunk)
+                self.layout["output"].update(
+                    Panel(Text(''.join(pieces)), title="Processing... (any key to stop)")
+                )
+        if cancel.is_set():
+            self.show_status("⏹ Generation stopped; keeping partial output.")
+        return ''.join(pieces)
+
     def show_status(self, message: str):
         """
         Update status pane.
@@ -149,7 +169,6 @@ class TUIMode(BaseMode):
         Main TUI workflow using Live display.
         """
         from rich.live import Live
-        import time
 
         context = None
         self.show_status("Ready")
@@ -166,6 +185,7 @@ class TUIMode(BaseMode):
                     # with visual updates.
                     
                     audio_path = None
+                    self.refresh_config()
                     
                     # Handle input file for first run if provided
                     if first_run and input_file and os.path.exists(input_file):
@@ -191,7 +211,10 @@ class TUIMode(BaseMode):
                             
                             # Process with LLM
                             self.show_status("⌛ Processing...")
-                            output = self.processor.process_text(transcription, context)
+                            if self.config.get('stream_output', True):
+                                output = self.stream_output(transcription, context)
+                            else:
+                                output = self.processor.process_text(transcription, context)
                             
                             # Review output
                             # Note: review_output might break the Live display if it launches an editor
@@ -8,6 +8,7 @@ from typing import Optional
 from datetime import datetime
 
 from .drive_client import DriveClient
+from ..utils import profiling
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +47,9 @@ class GoogleDriveProvider:
         """
         self.config = config
         self.keep_remote = keep_remote
-        self.drive_client = DriveClient(config)
+        # DriveClient authenticates on construction (token refresh or OAuth flow)
+        with profiling.span("drive.auth"):
+            self.drive_client = DriveClient(config)
         self.inbox_dir = Path(config.get('google_drive.inbox_dir', 'dev_notes/inbox'))
         self.archive_dir = Path(config.get('google_drive.archive_dir', 'dev_notes/inbox-archive'))
 
@@ -69,7 +72,8 @@ class GoogleDriveProvider:
         folder_path = self.config.get('google_drive.folder', '/Voice Recordings')
         logger.info(f"Fetching earliest file from {folder_path}")
 
-        file_metadata = self.drive_client.get_earliest_file(folder_path)
+        with profiling.span("drive.list", folder=folder_path):
+            file_metadata = self.drive_client.get_earliest_file(folder_path)
         if not file_metadata:
             logger.info("No files found in Google Drive folder")
             return None
@@ -96,7 +100,8 @@ class GoogleDriveProvider:
         inbox_path = self._ensure_unique_filename(inbox_path)
 
         logger.info(f"Downloading to inbox: {inbox_path}")
-        success = self.drive_client.download_file(file_id, inbox_path)
+        with profiling.span("drive.download", file=original_name):
+            success = self.drive_client.download_file(file_id, inbox_path)
         if not success:
             logger.error("Failed to download file from Google Drive")
             return None
@@ -104,7 +109,8 @@ class GoogleDriveProvider:
         # Delete remote file unless keep_remote is set
         if not self.keep_remote:
             logger.info(f"Deleting remote file: {original_name}")
-            self.drive_client.delete_file(file_id)
+            with profiling.span("drive.delete"):
+                self.drive_client.delete_file(file_id)
 
         # Move from inbox to archive
         archive_path = self.archive_dir / inbox_path.name
@@ -4,6 +4,17 @@ from datetime import datetime
 from typing import Optional, Tuple
 import re
 
+from .keywords import DEFAULT_PROJECT_KEYWORDS, KeywordMatcher
+
+_DEFAULT_PROJECT_MATCHER = KeywordMatcher(DEFAULT_PROJECT_KEYWORDS)
+
+# One header field line, e.g. "**Source**: x" or "**Date:** y", including its line break
+_HEADER_LINE = re.compile(
+    r'[ \t]*\*\*(Source|Date|Status|Title|Project)(?:\*\*:|:\*\*)[ \t]*([^\r\n]*)(?:\r?\n|\Z)',
+    re.IGNORECASE,
+)
+_BLANK_LINES = re.compile(r'(?:[ \t]*\r?\n)*')
+
 
 class Header:
     """Metadata header for audio/transcript tracking."""
@@ -34,6 +45,40 @@ class Header:
 
         return "\n".join(lines)
 
+    @staticmethod
+    def parse(text: str) -> Tuple[Optional['Header'], int]:
+        """Parse the leading header block in a single pass.
+
+        Only the header lines at the top of the text are examined (after any
+        leading blank lines); parsing stops at the first line that is not a
+        header field, so the body is never scanned.
+
+        Returns:
+            (header, body_offset): Header or None if the block has no Source
+            field, and the offset in text where the body starts (0 without a
+            header), so text[body_offset:] is the body.
+        """
+        pos = _BLANK_LINES.match(text).end()
+        fields = {}
+        while True:
+            match = _HEADER_LINE.match(text, pos)
+            if not match:
+                break
+            fields.setdefault(match.group(1).lower(), match.group(2).strip())
+            pos = match.end()
+
+        if 'source' not in fields:
+            return None, 0  # No valid header found
+
+        header = Header(
+            source=fields['source'],
+            date=fields.get('date'),
+            status=fields.get('status', "Awaiting transformation"),
+            title=fields.get('title'),
+            project=fields.get('project'),
+        )
+        return header, _BLANK_LINES.match(text, pos).end()
+
     @staticmethod
     def from_string(text: str) -> Optional['Header']:
         """Parse header from markdown text.
@@ -41,54 +86,20 @@ class Header:
         Returns:
             Header object or None if no valid header found
         """
-        patterns = {
-            'source': r'\*\*Source\*\*:\s*(.+)',
-            'date': r'\*\*Date:\*\*\s*(.+)',
-            'status': r'\*\*Status:\*\*\s*(.+)',
-            'title': r'\*\*Title:\*\*\s*(.+)',
-            'project': r'\*\*Project:\*\*\s*(.+)',
-        }
-
-        matches = {}
-        for key, pattern in patterns.items():
-            match = re.search(pattern, text, re.MULTILINE)
-            if match:
-                matches[key] = match.group(1).strip()
-
-        if 'source' not in matches:
-            return None  # No valid header found
-
-        return Header(
-            source=matches.get('source'),
-            date=matches.get('date'),
-            status=matches.get('status', "Awaiting transformation"),
-            title=matches.get('title'),
-            project=matches.get('project'),
-        )
+        return Header.parse(text)[0]
 
 
-def infer_project_name(text: str) -> str:
+def infer_project_name(text: str, matcher: Optional[KeywordMatcher] = None) -> str:
     """Infer project name from content.
 
-    Simple heuristic: look for common project keywords.
+    Simple heuristic: look for common project keywords (whole words).
     Falls back to "unknown" if no match found.
+
+    Args:
+        text: Content to inspect
+        matcher: Project keyword matcher; defaults to DEFAULT_PROJECT_KEYWORDS
     """
-    text_lower = text.lower()
-
-    # Common project keywords (customize for your environment)
-    keywords = {
-        'second-voice': ['voice', 'audio', 'transcript', 'whisper'],
-        'docs': ['document', 'markdown', 'readme', 'manual'],
-        'api': ['endpoint', 'rest', 'http', 'request', 'response'],
-        'ui': ['button', 'interface', 'design', 'component', 'react'],
-        'database': ['query', 'sql', 'database', 'table', 'schema'],
-    }
-
-    for project, keywords_list in keywords.items():
-        if any(kw in text_lower for kw in keywords_list):
-            return project
-
-    return "unknown"
+    return (matcher or _DEFAULT_PROJECT_MATCHER).first(text) or "unknown"
 
 
 def generate_title(text: str, max_length: int = 60) -> str:
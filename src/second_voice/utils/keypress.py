@@ -0,0 +1,56 @@
+"""Terminal keypress watching for cancelling long-running operations."""
+
+import os
+import select
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, TextIO
+
+
+@contextmanager
+def cancel_on_keypress(stream: Optional[TextIO] = None) -> Iterator[threading.Event]:
+    """
+    Yield an event that is set when any key is pressed.
+
+    The terminal is put in cbreak mode for the duration so single keys are seen
+    without Enter, and restored afterwards. When stdin is not a POSIX terminal
+    (pipes, tests, Windows) the event is never set.
+
+    :param stream: Input stream to watch (defaults to sys.stdin)
+    """
+    cancel = threading.Event()
+    stream = stream or sys.stdin
+
+    try:
+        import termios
+        import tty
+        fd = stream.fileno()
+        interactive = os.isatty(fd)
+    except (ImportError, AttributeError, OSError, ValueError):
+        interactive = False
+
+    if not interactive:
+        yield cancel
+        return
+
+    saved = termios.tcgetattr(fd)
+    done = threading.Event()
+
+    def watch():
+        while not done.is_set():
+            ready, _, _ = select.select([fd], [], [], 0.1)
+            if ready:
+                os.read(fd, 1)
+                cancel.set()
+                return
+
+    tty.setcbreak(fd)
+    watcher = threading.Thread(target=watch, name='keypress-watcher', daemon=True)
+    watcher.start()
+    try:
+        yield cancel
+    finally:
+        done.set()
+        watcher.join(timeout=0.5)
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
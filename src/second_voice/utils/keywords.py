@@ -0,0 +1,100 @@
+"""Whole-word keyword matching for text heuristics."""
+
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Keywords that mark a request to transform the user's own words (outline, summarize, ...)
+DEFAULT_META_KEYWORDS = [
+    'outline*', 'summari*', 'reorder*', 'rearrange*', 'list', 'lists', 'bullet*',
+    'organize', 'organise', 'organized', 'organised', 'reorganize', 'reorganise',
+]
+
+# Project inference table; earlier projects win when several match
+DEFAULT_PROJECT_KEYWORDS = {
+    'second-voice': ['voice', 'audio', 'transcript*', 'whisper'],
+    'docs': ['document*', 'markdown', 'readme', 'manual*'],
+    'api': ['endpoint*', 'rest', 'http', 'request*', 'response*'],
+    'ui': ['button*', 'interface*', 'design*', 'component*', 'react'],
+    'database': ['query', 'queries', 'sql', 'database*', 'table*', 'schema*'],
+}
+
+
+def _keyword_pattern(keyword: str) -> str:
+    """Regex for one keyword: a trailing '*' matches any word ending, spaces any whitespace."""
+    wildcard = keyword.endswith('*')
+    words = keyword.rstrip('*').split()
+    pattern = r'\s+'.join(re.escape(word) for word in words)
+    return pattern + r'\w*' if wildcard else pattern
+
+
+class KeywordMatcher:
+    """
+    Match whole-word keywords against text with one compiled regex.
+
+    The table maps a label to its keywords; label order is priority order. Keywords
+    are case-insensitive and only match at word boundaries, so 'list' does not match
+    inside 'realistic'. A trailing '*' accepts word endings ('transcript*' matches
+    'transcription').
+    """
+
+    def __init__(self, table: Mapping[str, Iterable[str]]):
+        """
+        :param table: Mapping of label to keywords
+        """
+        self.labels: List[str] = list(table)
+        self._groups: Dict[str, Tuple[int, str]] = {}
+        alternatives = []
+        seen = set()
+        for priority, (label, keywords) in enumerate(table.items()):
+            for keyword in keywords:
+                keyword = keyword.strip().lower()
+                if not keyword or keyword in seen:
+                    continue
+                seen.add(keyword)
+                group = f"k{len(alternatives)}"
+                self._groups[group] = (priority, label)
+                alternatives.append((keyword, f"(?P<{group}>{_keyword_pattern(keyword)})"))
+
+        # Longest keywords first so multi-word and longer keywords win over their prefixes
+        alternatives.sort(key=lambda item: len(item[0].rstrip('*')), reverse=True)
+        self._regex = (
+            re.compile(r'(?<!\w)(?:' + '|'.join(pattern for _, pattern in alternatives) + r')(?!\w)',
+                       re.IGNORECASE)
+            if alternatives else None
+        )
+
+    @classmethod
+    def from_keywords(cls, keywords: Iterable[str], label: str = 'match') -> 'KeywordMatcher':
+        """Build a matcher for a flat keyword list."""
+        return cls({label: list(keywords)})
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in text (stops at the first match)."""
+        return bool(self._regex and text and self._regex.search(text))
+
+    def first(self, text: str) -> Optional[str]:
+        """
+        Highest-priority label with a keyword in text.
+
+        Scans the text once and stops early when the top-priority label is found.
+
+        :param text: Text to scan
+        :return: Label, or None if nothing matched
+        """
+        if not self._regex or not text:
+            return None
+        best: Optional[Tuple[int, str]] = None
+        for match in self._regex.finditer(text):
+            found = self._groups[match.lastgroup]
+            if best is None or found[0] < best[0]:
+                best = found
+                if best[0] == 0:
+                    break
+        return best[1] if best else None
+
+    def matches(self, text: str) -> List[str]:
+        """All labels with a keyword in text, in priority order."""
+        if not self._regex or not text:
+            return []
+        found = {self._groups[match.lastgroup] for match in self._regex.finditer(text)}
+        return [label for _, label in sorted(found)]
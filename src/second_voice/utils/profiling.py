@@ -0,0 +1,158 @@
+"""Lightweight span timing for --profile.
+
+Spans are recorded only while profiling is enabled; otherwise span() costs a flag check.
+At exit the spans are printed as a per-stage breakdown and can be written as a Chrome
+trace (open in chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+_enabled = False
+_lock = threading.Lock()
+_spans: List[Dict[str, Any]] = []
+
+
+def enable():
+    """Start recording spans."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording spans."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """True while spans are being recorded."""
+    return _enabled
+
+
+def reset():
+    """Discard recorded spans."""
+    with _lock:
+        _spans.clear()
+
+
+def add_span(name: str, start: float, end: float, **args):
+    """
+    Record a span measured elsewhere (e.g. before profiling was switched on).
+
+    :param name: Stage name, dotted by component (e.g. 'llm.ollama')
+    :param start: time.perf_counter() at the start
+    :param end: time.perf_counter() at the end
+    :param args: Extra details shown in the trace
+    """
+    if not _enabled:
+        return
+    thread = threading.current_thread()
+    with _lock:
+        _spans.append({
+            'name': name,
+            'start': start,
+            'duration': end - start,
+            'thread': thread.ident,
+            'thread_name': thread.name,
+            'args': args,
+        })
+
+
+@contextmanager
+def span(name: str, **args) -> Iterator[None]:
+    """
+    Time the enclosed block as one stage.
+
+    :param name: Stage name, dotted by component (e.g. 'stt.local_whisper')
+    :param args: Extra details shown in the trace
+    """
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_span(name, start, time.perf_counter(), **args)
+
+
+def spans() -> List[Dict[str, Any]]:
+    """Copy of the recorded spans, in order of completion."""
+    with _lock:
+        return list(_spans)
+
+
+def report() -> str:
+    """
+    Per-stage breakdown: calls, total and mean time per span name, slowest first.
+
+    Stages nest (an LLM request inside processing), so totals overlap and are not summed.
+    """
+    stages: Dict[str, List[float]] = {}
+    for recorded in spans():
+        stages.setdefault(recorded['name'], []).append(recorded['duration'])
+    if not stages:
+        return "No profile spans recorded."
+
+    width = max(len(name) for name in stages)
+    lines = [f"{'stage':<{width}}  {'calls':>5}  {'total ms':>10}  {'mean ms':>10}"]
+    for name, durations in sorted(stages.items(), key=lambda item: -sum(item[1])):
+        total = sum(durations) * 1000
+        lines.append(f"{name:<{width}}  {len(durations):>5}  {total:>10.1f}  {total / len(durations):>10.1f}")
+    return "\n".join(lines)
+
+
+def chrome_trace() -> Dict[str, Any]:
+    """Recorded spans as a Chrome trace-event document (complete 'X' events, microseconds)."""
+    recorded_spans = spans()
+    # Timestamps are relative to the earliest span (imports start before this module loads)
+    origin = min((recorded['start'] for recorded in recorded_spans), default=0.0)
+    pid = os.getpid()
+    events = []
+    threads = {}
+    for recorded in recorded_spans:
+        threads.setdefault(recorded['thread'], recorded['thread_name'])
+        events.append({
+            'name': recorded['name'],
+            'cat': recorded['name'].split('.', 1)[0],
+            'ph': 'X',
+            'ts': round((recorded['start'] - origin) * 1e6, 1),
+            'dur': round(recorded['duration'] * 1e6, 1),
+            'pid': pid,
+            'tid': recorded['thread'],
+            'args': {key: str(value) for key, value in recorded['args'].items()},
+        })
+    for tid, thread_name in threads.items():
+        events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                       'args': {'name': thread_name}})
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def write_chrome_trace(path: str):
+    """Write the Chrome trace JSON to path."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(chrome_trace(), f)
+
+
+def finish(trace_path: Optional[str] = None, stream: Optional[TextIO] = None):
+    """
+    Print the breakdown (to stderr by default) and optionally write the Chrome trace.
+
+    :param trace_path: Where to write the trace JSON, if given
+    :param stream: Output stream for the breakdown
+    """
+    stream = stream or sys.stderr
+    print("\nProfile (per stage):", file=stream)
+    print(report(), file=stream)
+    if trace_path:
+        try:
+            write_chrome_trace(trace_path)
+            print(f"Chrome trace written: {trace_path}", file=stream)
+        except OSError as e:
+            print(f"Could not write Chrome trace: {e}", file=stream)
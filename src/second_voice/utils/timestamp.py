@@ -41,6 +41,24 @@ def create_whisper_filename(tmp_dir: str, timestamp: str) -> str:
     return os.path.join(tmp_dir, filename)
 
 
+def create_whisper_segments_filename(tmp_dir: str, timestamp: str) -> str:
+    """Create timestamped whisper segment metadata filename.
+
+    Stored next to the plain-text whisper output so later stages can work on
+    segment or word slices without re-transcribing.
+
+    Args:
+        tmp_dir: Temporary directory path
+        timestamp: Recording timestamp (for matching)
+
+    Returns:
+        str: Full path to whisper segment metadata file
+        Example: /tmp/whisper-2026-01-26_14-30-45.json
+    """
+    filename = f"whisper-{timestamp}.json"
+    return os.path.join(tmp_dir, filename)
+
+
 def extract_timestamp_from_filename(filename: str) -> str:
     """Extract timestamp from recording filename.
 
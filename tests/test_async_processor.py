@@ -0,0 +1,115 @@
+"""Tests for the asyncio AIProcessor front end."""
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.second_voice.core.async_processor import AsyncAIProcessor
+from src.second_voice.core.transcription import Transcription
+
+
+def make_processor(**config):
+    """AsyncAIProcessor around a mocked AIProcessor."""
+    processor = mock.MagicMock()
+    processor.stt_provider = 'local_whisper'
+    processor.llm_provider = 'ollama'
+    return AsyncAIProcessor(config, processor=processor), processor
+
+
+def test_transcribe_and_process():
+    """Awaitable calls run the blocking processor methods."""
+    async_processor, processor = make_processor()
+    processor.transcribe_verbose.return_value = Transcription('hello there')
+    processor.process_text.return_value = 'Hello there.'
+
+    async def run():
+        async with async_processor:
+            text = await async_processor.transcribe('a.wav')
+            return text, await async_processor.process(text, 'ctx')
+
+    assert asyncio.run(run()) == ('hello there', 'Hello there.')
+    processor.process_text.assert_called_once_with('hello there', 'ctx')
+
+
+def test_timeout_is_enforced():
+    """A stalled call raises TimeoutError after the per-call timeout."""
+    async_processor, processor = make_processor()
+    release = threading.Event()
+    processor.process_text.side_effect = lambda *args: release.wait(5)
+
+    async def run():
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            await async_processor.process('text', timeout=0.1)
+        return time.monotonic() - start
+
+    try:
+        assert asyncio.run(run()) < 2
+    finally:
+        release.set()
+        async_processor.close()
+
+
+def test_default_timeout_comes_from_provider_config():
+    """Without an explicit timeout, the provider's configured timeout applies."""
+    async_processor, _ = make_processor(ollama_timeout=7, process_timeout=None)
+
+    assert async_processor._timeout('process_timeout', {'ollama': ('ollama_timeout', 300)}, 'ollama', None) == 7
+    assert async_processor._timeout('process_timeout', {}, 'ollama', 2) == 2
+    async_processor.close()
+
+
+def test_concurrency_limit():
+    """No more than async_llm_concurrency requests run at once."""
+    async_processor, processor = make_processor(async_llm_concurrency=2)
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def slow(text, context):
+        with lock:
+            running.append(text)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(text)
+        return text.upper()
+
+    processor.process_text.side_effect = slow
+
+    async def run():
+        async with async_processor:
+            return await asyncio.gather(*(async_processor.process(f"t{i}") for i in range(6)))
+
+    assert asyncio.run(run()) == [f"T{i}" for i in range(6)]
+    assert max(peak) == 2
+
+
+def test_stream_stops_provider_when_consumer_leaves():
+    """Breaking out of stream() sets the cancel event passed to stream_text."""
+    async_processor, processor = make_processor()
+    seen = {}
+
+    def stream_text(text, context=None, cancel=None):
+        seen['cancel'] = cancel
+        for chunk in ['one ', 'two ', 'three']:
+            if cancel.is_set():
+                return
+            yield chunk
+            time.sleep(0.01)
+
+    processor.stream_text.side_effect = stream_text
+
+    async def run():
+        chunks = []
+        async with async_processor:
+            async for chunk in async_processor.stream('text'):
+                chunks.append(chunk)
+                break
+        return chunks
+
+    assert asyncio.run(run()) == ['one ']
+    assert seen['cancel'].is_set()
@@ -0,0 +1,123 @@
+"""Tests for the benchmark stand-in servers and harness."""
+
+import json
+import os
+import sys
+import time
+import urllib.request
+
+from benchmarks.harness import (ROOT, compare, latest_results, measure_command, percentile, run_process,
+                                save_results, summarize)
+from benchmarks.servers import OllamaStub, WhisperStub
+
+
+def _post(url, payload, content_type='application/json'):
+    request = urllib.request.Request(url, data=payload, headers={'Content-Type': content_type})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.read()
+
+
+def test_whisper_stub_returns_verbose_json():
+    """The transcription endpoint answers with text and segments, after the configured latency."""
+    with WhisperStub(transcript="one two three", latency=0.05) as whisper:
+        started = time.perf_counter()
+        body = json.loads(_post(whisper.transcriptions_url, b'--x\r\n\r\naudio\r\n--x--',
+                                'multipart/form-data; boundary=x'))
+        elapsed = time.perf_counter() - started
+
+        assert body['text'] == "one two three"
+        assert body['segments'][0]['text'].strip() == "one two three"
+        assert elapsed >= 0.05
+        assert whisper.request_count == 1
+
+
+def test_ollama_stub_streams_ndjson_chunks():
+    """/api/generate streams one JSON line per token, then a done line."""
+    with OllamaStub(tokens=5) as ollama:
+        streamed = _post(f"{ollama.url}/api/generate", json.dumps({'model': 'm', 'prompt': 'hi'}).encode())
+        whole = json.loads(_post(f"{ollama.url}/api/chat",
+                                 json.dumps({'model': 'm', 'messages': [], 'stream': False}).encode()))
+
+    lines = [json.loads(line) for line in streamed.decode().splitlines()]
+    assert len(lines) == 6
+    assert lines[-1]['done'] is True
+    assert ''.join(line['response'] for line in lines) == whole['message']['content']
+
+
+def test_percentiles_and_summary():
+    latencies = [0.01 * i for i in range(1, 101)]
+
+    assert percentile(latencies, 50) == 0.505
+    summary = summarize(latencies, wall_time=2.0)
+    assert summary['iterations'] == 100
+    assert summary['throughput_per_s'] == 50.0
+    assert summary['p99_ms'] == 990.1
+
+
+def test_compare_flags_regressions_only_beyond_threshold():
+    baseline = {'cli.translate_only': {'p50_ms': 100.0, 'p99_ms': 200.0, 'throughput_per_s': 10.0}}
+    current = {'cli.translate_only': {'p50_ms': 110.0, 'p99_ms': 300.0, 'throughput_per_s': 7.0},
+               'cli.new': {'p50_ms': 1.0}}
+
+    regressions = compare(current, baseline, threshold=0.2)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith('cli.translate_only: p99_ms')
+    assert 'throughput_per_s' in regressions[1]
+
+
+def test_measure_command_and_stored_results(tmp_path):
+    """Each run is timed with its own peak RSS; the newest stored file is found for comparison."""
+    metrics = measure_command(lambda i: [sys.executable, '-c', 'pass'], iterations=2, warmup=0)
+
+    assert metrics['iterations'] == 2
+    assert metrics['max_rss_kb'] > 0
+
+    path = save_results('pipeline', {'iterations': 2}, {'cli.noop': metrics}, str(tmp_path))
+    assert latest_results('pipeline', str(tmp_path)) == path
+    assert json.loads(open(path).read())['scenarios']['cli.noop']['iterations'] == 2
+
+
+def test_synthetic_input_stream_feeds_whole_blocks():
+    """The synthetic stream splits the requested audio into blocksize callbacks."""
+    from benchmarks.bench_audio import SyntheticInputStream
+
+    frames = []
+    stream = SyntheticInputStream(16000, channels=1, callback=lambda data, n, t, s: frames.append(n),
+                                  blocksize=1024)
+
+    assert stream.feed(0.5) == 8
+    assert sum(frames) == 8000
+    assert frames[-1] == 8000 - 7 * 1024
+
+
+def test_audio_worker_reports_capture_and_stop(tmp_path):
+    """A capture case reports both steps, with one retained block per callback."""
+    case = {'kind': 'capture', 'rate': 16000, 'duration': 1, 'blocksize': 1000, 'work_dir': str(tmp_path)}
+
+    stdout, _, _ = run_process([sys.executable, '-m', 'benchmarks.bench_audio', '--worker', json.dumps(case)],
+                                cwd=ROOT)
+    rows = json.loads(stdout)
+
+    assert rows['capture']['callbacks'] == 16
+    assert rows['capture']['live_blocks'] >= 16
+    assert rows['stop_recording']['wall_ms'] > 0
+
+
+def test_in_process_scenarios_run_isolated_and_must_reach_stand_ins(monkeypatch):
+    """In-process scenarios share the CLI environment; one that never hit a stand-in is not kept."""
+    from benchmarks import bench_pipeline
+    seen = []
+
+    def scenarios(settings_path, audio_path):
+        seen.append(dict(os.environ))
+        return {'processor.process': lambda i: seen.append(dict(os.environ))}
+
+    monkeypatch.setattr(bench_pipeline, 'processor_scenarios', scenarios)
+    monkeypatch.setenv('OPENROUTER_API_KEY', 'real-key')
+    args = bench_pipeline.parse_args(['--scenarios', 'processor.process', '--iterations', '1', '--warmup', '0'])
+
+    assert bench_pipeline.run(args) == {}
+    assert seen and all(env['HOME'].endswith('home') and 'OPENROUTER_API_KEY' not in env for env in seen)
+    assert seen[0]['OLLAMA_HOST'].startswith('http://')
+    assert os.environ['OPENROUTER_API_KEY'] == 'real-key'
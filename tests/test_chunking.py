@@ -0,0 +1,45 @@
+"""Tests for transcript chunking."""
+
+from src.second_voice.core.chunking import group_by_tokens, split_segments, split_text
+from src.second_voice.core.context import TokenCounter
+
+COUNTER = TokenCounter('cline')  # 4 chars per token
+
+
+def test_split_text_at_sentence_boundaries():
+    """Chunks end at sentence boundaries and keep every sentence in order."""
+    sentences = [f"Sentence number {i} is here." for i in range(20)]
+    text = ' '.join(sentences)
+
+    chunks = split_text(text, 30, COUNTER)
+
+    assert len(chunks) > 1
+    assert all(chunk.endswith('.') for chunk in chunks)
+    assert ' '.join(chunks) == text
+
+
+def test_split_text_breaks_long_sentences_between_words():
+    """A sentence over the limit is split on whitespace."""
+    text = ' '.join(['word'] * 200)
+
+    chunks = split_text(text, 20, COUNTER)
+
+    assert all(COUNTER.count(chunk) <= 20 for chunk in chunks)
+    assert ' '.join(chunks) == text
+
+
+def test_split_segments_groups_segment_text():
+    """Segments are packed whole, never split mid-segment."""
+    segments = [{'text': f" Segment {i} text."} for i in range(10)] + [{'text': None}]
+
+    chunks = split_segments(segments, 10, COUNTER)
+
+    assert chunks[0] == 'Segment 0 text. Segment 1 text.'
+    assert ' '.join(chunks).count('Segment') == 10
+
+
+def test_group_by_tokens_keeps_oversized_piece_alone():
+    """A single piece above the limit forms its own group."""
+    groups = group_by_tokens(['a' * 8, 'b' * 100, 'c' * 8, 'd' * 8], 5, COUNTER)
+
+    assert groups == [['a' * 8], ['b' * 100], ['c' * 8, 'd' * 8]]
@@ -8,7 +8,7 @@ import pytest
 from pathlib import Path
 from unittest import mock
 
-from second_voice.core.config import ConfigurationManager
+from second_voice.core.config import ConfigSnapshot, ConfigurationManager
 
 
 class TestConfigurationDefaults:
@@ -249,6 +249,7 @@ class TestTempDirectoryCreation:
     def test_temp_dir_created_on_init(self, temp_dir):
         """Temporary directory is created during initialization."""
         temp_location = temp_dir / "tmp"
+        ConfigurationManager.clear_cache()
 
         with mock.patch("os.path.exists", return_value=False):
             with mock.patch("pathlib.Path.mkdir") as mock_mkdir:
@@ -295,15 +296,230 @@ class TestDefaultConfigPath:
 class TestConfigurationMerging:
     """Test how configurations from different sources merge."""
 
-    def test_nested_config_replaces_defaults(self, temp_dir):
-        """Nested objects from file completely replace defaults (not deep merge)."""
+    def test_nested_config_merges_with_defaults(self, temp_dir):
+        """Nested objects from file are deep-merged over the defaults."""
         config_file = temp_dir / "config.json"
         config_file.write_text('{"audio_config": {"sample_rate": 48000}}')
 
         with mock.patch("pathlib.Path.mkdir"):
             config = ConfigurationManager(config_path=str(config_file))
 
-        # File value replaces defaults entirely
+        # File value replaces only the keys it names
         audio_config = config.get("audio_config")
         assert audio_config["sample_rate"] == 48000
-        assert "channels" not in audio_config  # Default was replaced
+        assert audio_config["channels"] == 1  # Default kept
+
+    def test_env_override_does_not_touch_defaults(self, temp_dir):
+        """Nested env overrides layer over a partial file block without mutating DEFAULT_CONFIG."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"google_drive": {"profile": "work"}}')
+
+        with mock.patch.dict(os.environ, {"SECOND_VOICE_GOOGLE_FOLDER": "/Notes"}):
+            config = ConfigurationManager(config_path=str(config_file))
+
+        assert config.get("google_drive.profile") == "work"
+        assert config.get("google_drive.folder") == "/Notes"
+        assert config.get("google_drive.inbox_dir") == "dev_notes/inbox"
+        assert ConfigurationManager.DEFAULT_CONFIG["google_drive"]["folder"] == "/Voice Recordings"
+        with pytest.raises(TypeError):
+            ConfigurationManager.DEFAULT_CONFIG["google_drive"]["folder"] = "/elsewhere"
+
+    def test_set_layers_over_nested_values(self, temp_dir):
+        """set() is the top layer: dotted keys and dicts merge, per instance."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"google_drive": {"profile": "work"}}')
+        config = ConfigurationManager(config_path=str(config_file))
+        other = ConfigurationManager(config_path=str(config_file))
+
+        config.set("google_drive.folder", "/Cli")
+        config.set("audio_config", {"channels": 2})
+
+        assert config.get("google_drive") == {"profile": "work", "folder": "/Cli",
+                                              "inbox_dir": "dev_notes/inbox",
+                                              "archive_dir": "dev_notes/inbox-archive"}
+        assert config["audio_config"]["sample_rate"] == 16000
+        assert config.config["audio_config"] == {"sample_rate": 16000, "channels": 2, "device": None,
+                                                 "level_rate": 20}
+        assert other.get("google_drive.folder") == "/Voice Recordings"
+        assert other.get("audio_config.channels") == 1
+
+    def test_provenance_trace(self, temp_dir):
+        """Each key reports the layer its value came from."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"audio_config": {"sample_rate": 48000}, "context_token_budget": "lots"}')
+
+        with mock.patch.dict(os.environ, {"SECOND_VOICE_MODE": "tui", "SECOND_VOICE_GOOGLE_FOLDER": "abc"}):
+            config = ConfigurationManager(config_path=str(config_file))
+        config.set("debug", True)
+
+        assert config.source("audio_config") == "file"
+        assert config.source("audio_config.sample_rate") == "file"
+        assert config.source("google_drive") == "env:SECOND_VOICE_GOOGLE_FOLDER"
+        assert config.source("google_drive.folder") == "env:SECOND_VOICE_GOOGLE_FOLDER"
+        assert config.source("google_drive.profile") == "default"
+        assert config.source("audio_config.channels") == "default"
+        assert config.source("context_token_budget") == "default"  # invalid file value replaced
+        assert config.source("mode") == "env:SECOND_VOICE_MODE"
+        assert config.source("debug") == "set"
+        assert config.source("unknown") is None
+        assert config.snapshot.sources.get("debug") is None
+
+
+class TestConfigSnapshot:
+    """Test the cached, frozen configuration snapshot."""
+
+    def test_snapshot_reused_until_file_changes(self, temp_dir):
+        """Instances share one parsed snapshot until the file's mtime/size changes."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"ollama_model": "a"}')
+
+        first = ConfigurationManager(config_path=str(config_file))
+        with mock.patch("json.load") as mock_load:
+            second = ConfigurationManager(config_path=str(config_file))
+        mock_load.assert_not_called()
+        assert second.snapshot is first.snapshot
+
+        config_file.write_text('{"ollama_model": "bb"}')
+        assert first.reload() is True
+        assert first.get("ollama_model") == "bb"
+        assert first.reload() is False
+
+    def test_dotted_lookup_and_frozen_values(self, temp_dir):
+        """Dotted keys are pre-flattened and snapshot values are read-only."""
+        with mock.patch("pathlib.Path.mkdir"):
+            config = ConfigurationManager(config_path=str(temp_dir / "missing.json"))
+
+        assert config.get("google_drive.folder") == "/Voice Recordings"
+        assert config.get("google_drive.nonexistent", "x") == "x"
+        assert config.get("audio_config.device", "default") == "default"
+        with pytest.raises(TypeError):
+            config.get("google_drive")["folder"] = "/elsewhere"
+        assert isinstance(config.get("openrouter_fallback_models"), tuple)
+
+    def test_set_values_layer_over_snapshot(self, temp_dir):
+        """set() doesn't touch the shared snapshot, and survives reload()."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"mode": "menu"}')
+        config = ConfigurationManager(config_path=str(config_file))
+        other = ConfigurationManager(config_path=str(config_file))
+
+        config.set("mode", "tui")
+        config_file.write_text('{"mode": "gui", "debug": true}')
+        config.reload()
+
+        assert config.get("mode") == "tui"
+        assert config.get("debug") is True
+        assert other.get("mode") == "menu"
+        assert config.snapshot.get("mode") == "gui"
+
+    def test_invalid_types_fall_back_to_defaults(self, temp_dir):
+        """Values of the wrong type are replaced by the default when the file is loaded."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"context_token_budget": "lots", "stream_output": 1, '
+                               '"pipeline_timeout": 30, "audio_config": {"sample_rate": "fast"}}')
+
+        config = ConfigurationManager(config_path=str(config_file))
+
+        assert config.get("context_token_budget") == 2000
+        assert config.get("stream_output") is True
+        assert config.get("pipeline_timeout") == 30
+        assert config.get("audio_config.sample_rate") == 16000
+
+    def test_temp_dir_created_once(self, temp_dir):
+        """The temp directory is created by the first load, not by every instance."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text(json.dumps({"temp_dir": str(temp_dir / "work")}))
+
+        ConfigurationManager(config_path=str(config_file))
+        with mock.patch("pathlib.Path.mkdir") as mock_mkdir:
+            ConfigurationManager(config_path=str(config_file))
+
+        assert (temp_dir / "work").is_dir()
+        mock_mkdir.assert_not_called()
+
+    def test_snapshot_flattens_nested_keys(self):
+        snapshot = ConfigSnapshot({"a": {"b": {"c": 1}, "n": None}, "top": None})
+
+        assert snapshot.get("a.b.c") == 1
+        assert snapshot.get("a.n", "d") == "d"
+        assert snapshot.get("top", "d") is None
+        assert snapshot.to_dict() == {"a": {"b": {"c": 1}, "n": None}, "top": None}
+
+
+class TestHotReload:
+    """Test change notification on reload."""
+
+    def test_listeners_get_changed_keys(self, temp_dir):
+        """Subscribers are told which plain and dotted keys changed."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"ollama_model": "a", "audio_config": {"sample_rate": 16000}}')
+        config = ConfigurationManager(config_path=str(config_file))
+        seen = []
+        config.subscribe(seen.append)
+
+        config_file.write_text('{"ollama_model": "bb", "audio_config": {"sample_rate": 48000}}')
+        assert config.reload() is True
+
+        assert seen == [frozenset({"ollama_model", "audio_config", "audio_config.sample_rate"})]
+        assert config.get("audio_config.sample_rate") == 48000
+
+    def test_keys_pinned_by_set_are_not_reported(self, temp_dir):
+        """A key overridden with set() keeps its value, so it isn't a change."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"mode": "menu", "ollama_model": "a"}')
+        config = ConfigurationManager(config_path=str(config_file))
+        config.set("mode", "tui")
+        seen = []
+        config.subscribe(seen.append)
+
+        config_file.write_text('{"mode": "gui", "ollama_model": "a", "debug": true}')
+        config.reload()
+
+        assert seen == [frozenset({"debug"})]
+
+    def test_unreadable_file_keeps_current_settings(self, temp_dir):
+        """A file saved with a JSON error is ignored until it is fixed."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"ollama_model": "a"}')
+        config = ConfigurationManager(config_path=str(config_file))
+        listener = mock.MagicMock()
+        config.subscribe(listener)
+
+        config_file.write_text('{"ollama_model": ')
+        assert config.reload() is False
+        assert config.get("ollama_model") == "a"
+
+        config_file.write_text('{"ollama_model": "fixed"}')
+        assert config.reload() is True
+        listener.assert_called_once_with(frozenset({"ollama_model"}))
+
+    def test_failing_listener_does_not_stop_others(self, temp_dir):
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"ollama_model": "a"}')
+        config = ConfigurationManager(config_path=str(config_file))
+        listener = mock.MagicMock()
+        config.subscribe(mock.MagicMock(side_effect=RuntimeError("boom")))
+        config.subscribe(listener)
+
+        config_file.write_text('{"ollama_model": "bb"}')
+        config.reload()
+
+        listener.assert_called_once()
+
+    def test_watch_reloads_in_background(self, temp_dir):
+        """watch() polls the file and notifies from its own thread."""
+        import threading
+
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"ollama_model": "a"}')
+        config = ConfigurationManager(config_path=str(config_file))
+        changed = threading.Event()
+        config.subscribe(lambda keys: changed.set())
+
+        config.watch(interval=0.01)
+        try:
+            config_file.write_text('{"ollama_model": "bb"}')
+            assert changed.wait(timeout=5)
+        finally:
+            config.stop_watching()
+        assert config.get("ollama_model") == "bb"
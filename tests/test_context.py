@@ -0,0 +1,107 @@
+"""Tests for the token-budgeted context manager."""
+
+from src.second_voice.core.context import ContextManager, TokenCounter, lead_sentence
+
+
+def make_manager(**overrides):
+    config = {'context_token_budget': 300, 'context_keep_turns': 2}
+    config.update(overrides)
+    return ContextManager(config, 'ollama', 'llama3')
+
+
+class TestTokenCounter:
+
+    def test_heuristic_count_by_provider(self):
+        """Ollama models are estimated at a finer chars-per-token ratio."""
+        text = 'x' * 70
+        assert TokenCounter('ollama', 'llama3').count(text) == 20
+        assert TokenCounter('cline', 'default-model').count(text) == 18
+        assert TokenCounter('ollama').count('') == 0
+
+    def test_tail_cuts_at_word_boundary(self):
+        """Trimmed context starts at a whole word and fits the limit."""
+        counter = TokenCounter('cline')
+        text = ' '.join(f'word{i}' for i in range(100))
+
+        tail = counter.tail(text, 20)
+
+        assert counter.count(tail) <= 20
+        assert tail.startswith('word')
+        assert text.endswith(tail)
+        assert text[len(text) - len(tail) - 1] == ' '
+
+    def test_tail_single_long_word(self):
+        """A single oversized word falls back to a character cut."""
+        tail = TokenCounter('cline').tail('A' * 2000, 10)
+        assert tail == 'A' * 40
+
+
+class TestContextManager:
+
+    def test_budget_capped_by_model_window(self):
+        """Budget never exceeds the model window minus the response reserve."""
+        manager = make_manager(context_token_budget=100000)
+        assert manager.budget == 8192 - 2048
+
+        manager = make_manager(context_token_budget=100000, context_windows={'llama3': 4096})
+        assert manager.budget == 4096 - 2048
+
+    def test_old_turns_fold_into_summary(self):
+        """Turns beyond keep_turns are summarized by their lead sentence."""
+        manager = make_manager()
+        manager.add_turn('First draft about the budget. Lots of detail here.')
+        manager.add_turn('Second draft.')
+        manager.add_turn('Third draft.')
+
+        assert manager.turns == ['Second draft.', 'Third draft.']
+        assert manager.summary == 'First draft about the budget.'
+
+        rendered = manager.render()
+        assert rendered.startswith('Summary of earlier turns: First draft about the budget.')
+        assert rendered.endswith('Second draft.\n\nThird draft.')
+
+    def test_render_fits_budget(self):
+        """Rendered context stays within budget and keeps the newest turn."""
+        manager = make_manager(context_token_budget=50)
+        manager.add_turn(' '.join(['older'] * 100))
+        manager.add_turn(' '.join(['newest'] * 100))
+
+        rendered = manager.render()
+
+        assert manager.counter.count(rendered) <= manager.budget
+        assert 'older' not in rendered
+        assert rendered.endswith('newest')
+
+    def test_custom_summarizer_and_failure_fallback(self):
+        """A summarizer replaces the extractive summary; failures fall back to it."""
+        manager = ContextManager({'context_keep_turns': 1}, 'ollama', summarizer=lambda text: 'SUMMARY')
+        manager.add_turn('One. More.')
+        manager.add_turn('Two.')
+        assert manager.summary == 'SUMMARY'
+
+        def broken(text):
+            raise RuntimeError('offline')
+
+        manager = ContextManager({'context_keep_turns': 1}, 'ollama', summarizer=broken)
+        manager.add_turn('One. More.')
+        manager.add_turn('Two.')
+        assert manager.summary == 'One.'
+
+    def test_round_trip_and_clear(self):
+        """State survives to_dict/load_dict and clear() empties it."""
+        manager = make_manager()
+        for turn in ('a.', 'b.', 'c.'):
+            manager.add_turn(turn)
+
+        restored = make_manager()
+        restored.load_dict(manager.to_dict())
+        assert restored.render() == manager.render()
+
+        restored.clear()
+        assert restored.render() == ''
+        assert restored.latest is None
+
+
+def test_lead_sentence_caps_words():
+    """Long first sentences are truncated."""
+    assert lead_sentence(' '.join(['w'] * 40), max_words=5) == 'w w w w w ...'
@@ -0,0 +1,106 @@
+"""Tests for request timeouts and pipeline deadlines."""
+
+import threading
+import time
+
+import pytest
+
+from src.second_voice.core.deadline import (
+    Deadline, RequestTimeouts, call_with_timeout, iterate_with_timeout
+)
+
+
+def test_deadline_limit():
+    """limit() returns the smaller of a timeout and the time remaining."""
+    assert Deadline(None).limit(5) == 5
+    assert Deadline(None).remaining() is None
+    deadline = Deadline(1)
+    assert deadline.limit(10) <= 1
+    assert deadline.limit(0.5) == 0.5
+    assert deadline.limit(None) <= 1
+    assert not deadline.expired()
+
+
+def test_request_timeouts_options_skip_unset_limits():
+    """Only configured limits are passed to the client."""
+    assert RequestTimeouts(10, None, 60).options() == {'timeout': 60, 'connect_timeout': 10}
+
+
+def test_call_with_timeout_gives_up_on_stalled_call():
+    """A call that never returns raises TimeoutError after the timeout."""
+    release = threading.Event()
+    started = time.monotonic()
+
+    with pytest.raises(TimeoutError):
+        call_with_timeout(lambda: release.wait(5), 0.1, 'stalled')
+
+    assert time.monotonic() - started < 2
+    release.set()
+
+
+def test_call_with_timeout_returns_result_and_propagates_errors():
+    """Results and exceptions of calls that finish in time pass through."""
+    assert call_with_timeout(lambda: 42, 1) == 42
+    with pytest.raises(ValueError):
+        call_with_timeout(lambda: int('x'), 1)
+    with pytest.raises(TimeoutError):
+        call_with_timeout(lambda: 42, 0)
+
+
+def test_iterate_with_timeout_read_limit():
+    """A stream that stops sending data fails after the read timeout."""
+    release = threading.Event()
+
+    def chunks():
+        yield 'first'
+        release.wait(5)
+        yield 'late'
+
+    received = []
+    with pytest.raises(TimeoutError, match='no data'):
+        for chunk in iterate_with_timeout(chunks(), 0.1, None):
+            received.append(chunk)
+
+    assert received == ['first']
+    release.set()
+
+
+def test_iterate_with_timeout_total_limit():
+    """A steady but slow stream fails at the total deadline."""
+    def chunks():
+        while True:
+            time.sleep(0.02)
+            yield 'x'
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError, match='deadline'):
+        for _ in iterate_with_timeout(chunks(), 1, 0.2):
+            pass
+
+    assert time.monotonic() - started < 1
+
+
+def test_iterate_with_timeout_cancel_while_stalled():
+    """Cancelling stops a stream that is waiting for its next chunk, then closes it."""
+    release = threading.Event()
+    cancel = threading.Event()
+    closed = threading.Event()
+
+    def chunks():
+        try:
+            yield 'first'
+            release.wait(5)
+            yield 'late'
+        finally:
+            closed.set()
+
+    received = []
+    threading.Timer(0.1, cancel.set).start()
+    started = time.monotonic()
+    for chunk in iterate_with_timeout(chunks(), None, None, cancel=cancel):
+        received.append(chunk)
+
+    assert received == ['first']
+    assert time.monotonic() - started < 1
+    release.set()
+    assert closed.wait(5)
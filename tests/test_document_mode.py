@@ -127,15 +127,15 @@ class TestDocumentProcessing:
         config = ConfigurationManager()
         processor = AIProcessor(config)
 
-        # The document system prompt is embedded in process_document_creation
+        # The document system prompt comes from the prompt registry
         # Check that it mentions document structuring, not cleanup
-        import inspect
-        source = inspect.getsource(processor.process_document_creation)
+        source = processor._prompt('document.system').text
 
         assert "document structuring" in source.lower()
         assert "extract the main topic" in source.lower()
         assert "bullet points" in source.lower()
         assert "H2" in source  # References H2 headers
+        assert source != processor._prompt('cleanup.system').text
 
     def test_process_document_creation_handles_none_project(self):
         """Test that process_document_creation handles None project gracefully."""
@@ -179,6 +179,59 @@ class TestDocumentProcessing:
         assert ("Document structuring failed" in result or "LLM timeout" in result or "LLM error" in result)
 
 
+class TestMapReduceDocument:
+    """Test chunked (map-reduce) processing of long transcripts."""
+
+    def _processor(self, chunk_tokens):
+        config = ConfigurationManager()
+        config.set('llm_provider', 'ollama')
+        config.set('document_chunk_tokens', chunk_tokens)
+        return AIProcessor(config)
+
+    def test_short_transcript_uses_single_request(self):
+        """Transcripts under the chunk limit are sent in one request."""
+        processor = self._processor(3000)
+
+        with patch.object(processor, '_process_with_document_prompt', return_value="# Doc") as mock_prompt:
+            processor.process_document_creation("short content")
+
+        mock_prompt.assert_called_once()
+
+    def test_long_transcript_maps_chunks_then_reduces(self):
+        """Each chunk is outlined, then one final pass builds the document."""
+        processor = self._processor(50)
+        transcript = ' '.join(f"This is sentence number {i} of the dictation." for i in range(40))
+        calls = []
+
+        def fake_prompt(text, system=None):
+            calls.append((text, system))
+            if text.startswith('Section outlines'):
+                return "# Final Document\n\n## Merged"
+            return f"## Outline {len(calls)}"
+
+        with patch.object(processor, '_process_with_document_prompt', side_effect=fake_prompt):
+            result = processor.process_document_creation(transcript, recording_path="/tmp/long.aac")
+
+        map_calls = [c for c in calls if c[0].startswith('Part ')]
+        assert len(map_calls) > 1
+        assert map_calls[0][0].startswith(f"Part 1 of {len(map_calls)}:")
+        final_text, final_system = calls[-1]
+        assert final_text.startswith('Section outlines')
+        assert 'document structuring assistant' in final_system
+        assert "# Final Document" in result
+
+    def test_chunk_failure_falls_back_to_raw_transcript(self):
+        """A failed chunk request returns the raw transcript with a warning."""
+        processor = self._processor(20)
+        transcript = ' '.join(f"Sentence {i} goes here." for i in range(30))
+
+        with patch.object(processor, '_process_with_document_prompt', side_effect=RuntimeError("boom")):
+            result = processor.process_document_creation(transcript)
+
+        assert "⚠️ **Warning**" in result
+        assert transcript in result
+
+
 class TestDocumentModeProviderRouting:
     """Test that document mode routes to correct LLM provider."""
 
@@ -0,0 +1,61 @@
+"""Tests for the lazily constructed engine container."""
+
+from unittest import mock
+
+import pytest
+
+from src.second_voice.core.engine import Engine
+
+
+def test_components_built_on_first_access_only():
+    """Nothing is constructed until a component is used, and then only once."""
+    recorder_factory = mock.MagicMock()
+    processor_factory = mock.MagicMock()
+    engine = Engine({'temp_dir': '/tmp'}, recorder_factory, processor_factory)
+
+    assert not engine.is_built('recorder')
+    processor = engine.processor
+
+    assert engine.processor is processor
+    processor_factory.assert_called_once_with({'temp_dir': '/tmp'})
+    recorder_factory.assert_not_called()
+    assert not engine.is_built('recorder')
+
+
+def test_reset_rebuilds_component():
+    """A reset component is rebuilt on next access."""
+    processor_factory = mock.MagicMock(side_effect=[object(), object()])
+    engine = Engine({}, processor_factory=processor_factory)
+
+    first = engine.processor
+    engine.reset('processor')
+
+    assert engine.processor is not first
+    assert processor_factory.call_count == 2
+
+
+def test_failed_construction_is_retried():
+    """A factory error propagates and nothing is cached."""
+    recorder_factory = mock.MagicMock(side_effect=[RuntimeError("no audio device"), 'recorder'])
+    engine = Engine({}, recorder_factory=recorder_factory)
+
+    with pytest.raises(RuntimeError):
+        engine.recorder
+
+    assert engine.recorder == 'recorder'
+
+
+def test_config_changes_reach_built_components():
+    """follow_config() passes changed keys to built components only."""
+    config = mock.MagicMock()
+    processor = mock.MagicMock()
+    recorder_factory = mock.MagicMock()
+    engine = Engine(config, recorder_factory, processor_factory=lambda cfg: processor)
+    engine.follow_config()
+    listener = config.subscribe.call_args[0][0]
+
+    engine.processor
+    listener(frozenset({'ollama_model'}))
+
+    processor.apply_config.assert_called_once_with(frozenset({'ollama_model'}))
+    recorder_factory.assert_not_called()
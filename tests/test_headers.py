@@ -70,6 +70,26 @@ Some content here"""
         header = Header.from_string(text)
         assert header is None
 
+    def test_header_parse_body_offset(self):
+        """Test that parse returns the offset where the body starts."""
+        text = """
+**Source**: recording-01.aac
+**Date:** 2026-01-26 10:30:00
+
+Body text here
+**Title:** not a header field"""
+        header, offset = Header.parse(text)
+        assert header.source == "recording-01.aac"
+        assert header.title is None  # Fields after the header block are ignored
+        assert text[offset:].startswith("Body text here")
+
+    def test_header_parse_only_reads_leading_block(self):
+        """Test that header lines after body text are not treated as a header."""
+        text = "Intro line\n**Source**: recording.aac\n"
+        header, offset = Header.parse(text)
+        assert header is None
+        assert offset == 0
+
     def test_generate_title(self):
         """Test title generation."""
         text = "Please implement a new API endpoint for user authentication in the system"
@@ -109,6 +129,11 @@ This is the actual content to use for title generation"""
         assert infer_project_name("add a button to the interface") == "ui"
         assert infer_project_name("design the react component") == "ui"
 
+    def test_infer_project_whole_words(self):
+        """Test that keywords inside other words do not count."""
+        assert infer_project_name("an interesting idea") == "unknown"
+        assert infer_project_name("a comfortable chair") == "unknown"
+
     def test_infer_project_unknown(self):
         """Test that unknown content defaults to 'unknown'."""
         assert infer_project_name("completely unrelated topic xyz") == "unknown"
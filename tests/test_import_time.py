@@ -0,0 +1,114 @@
+"""Import-time budget for the CLI entry point."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('mellona')
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+# Modules that only recording, LLM processing or the interactive modes need
+HEAVY_MODULES = [
+    'sounddevice',
+    'soundfile',
+    'numpy',
+    'rich',
+    'tkinter',
+    'second_voice.core.recorder',
+    'second_voice.core.processor',
+]
+
+# Cumulative seconds allowed for `import cli.run`; override on slow machines
+IMPORT_BUDGET = float(os.environ.get('SECOND_VOICE_IMPORT_BUDGET', '0.5'))
+
+REPORT = (
+    "import json, sys\n"
+    f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]), file=sys.stderr)\n"
+)
+
+
+def run_python(code):
+    """Run code in a fresh interpreter with -X importtime; returns stderr."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get('PYTHONPATH')]))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, env=env, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stderr
+
+
+def loaded_heavy_modules(stderr):
+    """Heavy modules reported loaded by the REPORT snippet (last stderr line)."""
+    return json.loads(stderr.strip().splitlines()[-1])
+
+
+def cumulative_seconds(stderr, module):
+    """Cumulative import time of module from -X importtime output."""
+    for line in stderr.splitlines():
+        if line.startswith('import time:') and line.rsplit('|', 1)[-1].strip() == module:
+            return int(line.split('|')[1]) / 1e6
+    raise AssertionError(f"{module} not found in import-time output")
+
+
+def test_cli_import_skips_heavy_modules():
+    """Importing the CLI does not load the audio stack, the processor or UI toolkits."""
+    stderr = run_python("import cli.run\n" + REPORT)
+
+    assert loaded_heavy_modules(stderr) == []
+
+
+def test_cli_import_within_budget():
+    """`import cli.run` stays within the import-time budget."""
+    stderr = run_python("import cli.run\n")
+
+    assert cumulative_seconds(stderr, 'cli.run') < IMPORT_BUDGET
+
+
+def test_help_skips_heavy_modules():
+    """--help prints usage without loading heavy modules."""
+    stderr = run_python(
+        "import sys\n"
+        "sys.argv = ['second-voice', '--help']\n"
+        "import cli.run\n"
+        "try:\n"
+        "    cli.run.main()\n"
+        "except SystemExit:\n"
+        "    pass\n" + REPORT
+    )
+
+    assert loaded_heavy_modules(stderr) == []
+
+
+def test_translate_only_skips_audio_stack(tmp_path):
+    """--translate-only builds the processor but never loads the recorder or audio libraries."""
+    text_file = tmp_path / 'transcript.txt'
+    text_file.write_text('hello world')
+    output_file = tmp_path / 'final.md'
+    stderr = run_python(
+        "import contextlib, sys\n"
+        f"sys.argv = ['second-voice', '--translate-only', '--text-file', {str(text_file)!r},"
+        f" '--output-file', {str(output_file)!r}]\n"
+        "import cli.run\n"
+        "class FakeProcessor:\n"
+        "    def __init__(self, config):\n"
+        "        pass\n"
+        "    def pipeline_deadline(self):\n"
+        "        return contextlib.nullcontext()\n"
+        "    def process_with_headers_and_fallback(self, text, context=None):\n"
+        "        return text.upper()\n"
+        "cli.run.AIProcessor = FakeProcessor\n"
+        "try:\n"
+        "    cli.run.main()\n"
+        "except SystemExit:\n"
+        "    pass\n" + REPORT
+    )
+
+    assert output_file.read_text() == 'HELLO WORLD'
+    assert loaded_heavy_modules(stderr) == []
@@ -0,0 +1,13 @@
+"""Tests for terminal keypress cancellation."""
+
+import io
+
+from src.second_voice.utils.keypress import cancel_on_keypress
+
+
+def test_non_terminal_input_never_cancels():
+    """Without a terminal the event is yielded unset and nothing is read."""
+    stream = io.StringIO('x')
+    with cancel_on_keypress(stream) as cancel:
+        assert not cancel.is_set()
+    assert stream.read() == 'x'
@@ -0,0 +1,49 @@
+"""Tests for whole-word keyword matching."""
+
+from src.second_voice.utils.keywords import DEFAULT_META_KEYWORDS, KeywordMatcher
+
+
+def test_keywords_match_whole_words_only():
+    """'list' matches the word but not inside 'realistic'."""
+    matcher = KeywordMatcher.from_keywords(DEFAULT_META_KEYWORDS)
+
+    assert matcher.search("Please list the steps")
+    assert matcher.search("LIST them")
+    assert not matcher.search("That is a realistic plan")
+    assert not matcher.search("The checklist is done")
+
+
+def test_wildcard_matches_word_endings():
+    """A trailing '*' accepts inflections but still starts at a word boundary."""
+    matcher = KeywordMatcher.from_keywords(['summari*', 'bullet*'])
+
+    assert matcher.search("summarize this")
+    assert matcher.search("can you summarising it")
+    assert matcher.search("as bullets")
+    assert not matcher.search("a presummary note")
+
+
+def test_multi_word_keywords_allow_any_whitespace():
+    """Spaces in a keyword match any run of whitespace."""
+    matcher = KeywordMatcher.from_keywords(['bullet points'])
+
+    assert matcher.search("make it bullet\n  points")
+    assert not matcher.search("bullet")
+
+
+def test_first_returns_highest_priority_label():
+    """Table order decides between labels found in the same text."""
+    matcher = KeywordMatcher({'high': ['voice'], 'low': ['button']})
+
+    assert matcher.first("a button for voice input") == 'high'
+    assert matcher.first("a button") == 'low'
+    assert matcher.first("nothing here") is None
+    assert matcher.matches("a button for voice input") == ['high', 'low']
+
+
+def test_empty_table_matches_nothing():
+    """An empty keyword table never matches."""
+    matcher = KeywordMatcher({})
+
+    assert not matcher.search("anything")
+    assert matcher.first("anything") is None
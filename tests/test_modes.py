@@ -102,5 +102,48 @@ class TestCore(unittest.TestCase):
             saved_path = recorder.stop_recording()
             self.assertIsNotNone(saved_path)
 
+class TestGUIStreaming(unittest.TestCase):
+    def test_escape_cancels_stalled_stream_and_blocks_rerun(self):
+        import tempfile
+        import time
+        from second_voice.modes.gui_mode import GUIMode
+
+        def stream_text(text, context, cancel):
+            yield 'partial'
+            # Stalled: no further chunk until generation is cancelled
+            cancel.wait(5)
+
+        processor = MagicMock()
+        processor.transcribe.return_value = 'hello'
+        processor.stream_text.side_effect = stream_text
+        recorder = MagicMock()
+        with tempfile.TemporaryDirectory() as vault:
+            mode = GUIMode({'vault_path': vault}, recorder, processor)
+        mode.root = MagicMock()
+        for widget in ('status_label', 'output_preview', 'btn_rec', 'btn_sub', 'context_indicator'):
+            setattr(mode, widget, MagicMock())
+        scheduled = []
+        mode.root.after.side_effect = lambda ms, func, *args: scheduled.append((func, args))
+        mode.audio_file = 'rec.wav'
+
+        with patch.object(mode, 'review_output', side_effect=lambda text: text) as review:
+            mode.submit()
+            # Space and Return while streaming do nothing
+            mode.toggle()
+            mode.submit()
+            self.assertEqual(processor.transcribe.call_count, 1)
+            recorder.start_recording.assert_not_called()
+
+            mode._cancel.set()  # Escape
+            deadline = time.monotonic() + 5
+            while scheduled and time.monotonic() < deadline:
+                func, args = scheduled.pop(0)
+                time.sleep(0.01)
+                func(*args)
+
+        review.assert_called_once_with('partial')
+        self.assertFalse(mode._busy)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,177 @@
+"""Tests for background recording processing and pipelined menu mode."""
+
+import threading
+import time
+from unittest import mock
+
+from src.second_voice.core.pipeline import RecordingPipeline
+from src.second_voice.modes.menu_mode import MenuMode
+
+
+def test_results_collected_in_submission_order():
+    """Jobs run one at a time; failures come back as results, not exceptions."""
+    def work(item):
+        if item == 'bad':
+            raise ValueError("no speech")
+        return item.upper()
+
+    pipeline = RecordingPipeline(work)
+    for item in ('a', 'bad', 'c'):
+        pipeline.submit(item)
+
+    results = [pipeline.wait(timeout=5) for _ in range(3)]
+    pipeline.close()
+
+    assert [r.seq for r in results] == [1, 2, 3]
+    assert [r.value for r in results] == ['A', None, 'C']
+    assert isinstance(results[1].error, ValueError)
+    assert pipeline.pending == 0
+    assert pipeline.wait() is None
+
+
+def test_ready_does_not_wait():
+    release = threading.Event()
+    pipeline = RecordingPipeline(lambda item: release.wait(5) and item)
+    pipeline.submit('slow')
+
+    assert pipeline.ready() == []
+    assert pipeline.wait(timeout=0.01) is None
+    release.set()
+    assert pipeline.wait(timeout=5).value == 'slow'
+    pipeline.close()
+
+
+def test_cancel_drops_queued_jobs():
+    """A cancelled pipeline returns at once with the jobs that never started."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def work(item):
+        started.set()
+        release.wait(5)
+        return item
+
+    pipeline = RecordingPipeline(work)
+    for item in ('running', 'queued-1', 'queued-2'):
+        pipeline.submit(item)
+    assert started.wait(5)
+
+    assert pipeline.close(cancel=True) == ['queued-1', 'queued-2']
+    release.set()
+
+
+def test_menu_mode_keeps_recording_while_processing(tmp_path):
+    """Recordings queue up behind slow processing; results are shown in order on quit."""
+    events = []
+    recordings = iter(['rec-1.wav', 'rec-2.wav'])
+    processor = mock.MagicMock()
+
+    def transcribe(audio_path, timestamp=None):
+        time.sleep(0.1)
+        events.append(f"transcribed {audio_path}")
+        return f"text of {audio_path}"
+
+    processor.transcribe.side_effect = transcribe
+    processor.process_with_headers_and_fallback.side_effect = \
+        lambda text, recording_path=None, context=None: f"{text} after {context}"
+
+    config = {'temp_dir': str(tmp_path), 'no_edit': True, 'keep_files': True, 'menu_pipeline': True}
+    mode = MenuMode(config, mock.MagicMock(), processor)
+
+    def record():
+        path = next(recordings)
+        events.append(f"recorded {path}")
+        return path
+
+    with mock.patch.object(mode, 'start_recording', side_effect=record), \
+            mock.patch('builtins.input', side_effect=['1', '1', '4']), \
+            mock.patch.object(mode, 'cleanup'):
+        mode.run()
+
+    assert events.index('recorded rec-2.wav') < events.index('transcribed rec-1.wav')
+    turns = [c.args[:2] for c in processor.record_turn.call_args_list]
+    assert turns == [
+        ('text of rec-1.wav', 'text of rec-1.wav after None'),
+        # The second recording follows on from the first one's output
+        ('text of rec-2.wav', 'text of rec-2.wav after text of rec-1.wav after None'),
+    ]
+
+
+class ReloadingConfig(dict):
+    """Dict config whose reload() reports whether a background job was running."""
+
+    def __init__(self, running, **values):
+        super().__init__(values)
+        self.running = running
+        self.reloads = []
+
+    def reload(self):
+        self.reloads.append(self.running.is_set())
+        return False
+
+
+def test_menu_mode_keeps_processor_to_itself_while_a_job_runs(tmp_path):
+    """Neither config reloads nor reviewed turns touch the processor under a running job."""
+    running = threading.Event()
+    second_started = threading.Event()
+    release = threading.Event()
+    recordings = iter(['rec-1.wav', 'rec-2.wav'])
+    turns_while_running = []
+    processor = mock.MagicMock()
+
+    def transcribe(audio_path, timestamp=None):
+        running.set()
+        if audio_path == 'rec-2.wav':
+            second_started.set()
+            release.wait(5)
+        return f"text of {audio_path}"
+
+    def process(text, recording_path=None, context=None):
+        running.clear()
+        return text
+
+    processor.transcribe.side_effect = transcribe
+    processor.process_with_headers_and_fallback.side_effect = process
+    processor.record_turn.side_effect = lambda *args: turns_while_running.append(running.is_set())
+
+    choices = iter(['1', '1', '', '', '4'])
+
+    def choose(prompt):
+        choice = next(choices)
+        if choice == '' and not release.is_set():
+            # Recording 1 is done and recording 2 is stuck: its review must wait for the job
+            assert second_started.wait(5)
+            threading.Timer(0.2, release.set).start()
+        return choice
+
+    config = ReloadingConfig(running, temp_dir=str(tmp_path), no_edit=True, keep_files=True,
+                             menu_pipeline=True)
+    mode = MenuMode(config, mock.MagicMock(), processor)
+
+    with mock.patch.object(mode, 'start_recording', side_effect=lambda: next(recordings)), \
+            mock.patch('builtins.input', side_effect=choose), \
+            mock.patch.object(mode, 'cleanup'):
+        mode.run()
+
+    assert turns_while_running == [False, False]
+    assert config.reloads and not any(config.reloads)
+
+
+def test_menu_mode_processes_in_foreground_by_default(tmp_path):
+    """Without menu_pipeline, each recording is processed (streamed) before the menu returns."""
+    processor = mock.MagicMock()
+    processor.transcribe.return_value = 'words'
+    processor.process_with_headers_and_fallback.return_value = 'output'
+
+    config = {'temp_dir': str(tmp_path), 'no_edit': True, 'keep_files': True}
+    mode = MenuMode(config, mock.MagicMock(), processor)
+
+    with mock.patch.object(mode, 'start_recording', return_value='rec.wav'), \
+            mock.patch('builtins.input', side_effect=['1', '4']), \
+            mock.patch.object(mode, 'cleanup'), \
+            mock.patch.object(mode._pipeline, 'submit') as submit:
+        mode.run()
+
+    submit.assert_not_called()
+    processor.record_turn.assert_called_once_with('words', 'output', mock.ANY)
+    assert 'on_token' in processor.process_with_headers_and_fallback.call_args.kwargs
@@ -3,6 +3,7 @@ Unit tests for AIProcessor.
 Tests transcription, LLM processing, and context management with mocked APIs.
 """
 import os
+import json
 import pytest
 from unittest import mock
 from pathlib import Path
@@ -168,6 +169,89 @@ class TestTranscriptionDispatch:
         assert result == "Transcribed text from mellona"
 
 
+class TestVerboseTranscription:
+    """Test segment/word timestamp metadata carried through transcribe()."""
+
+    VERBOSE_RAW = {
+        "language": "en",
+        "duration": 3.0,
+        "text": "Hello world",
+        "segments": [{
+            "id": 0, "start": 0.0, "end": 3.0, "text": " Hello world",
+            "avg_logprob": -0.2, "no_speech_prob": 0.01,
+            "words": [
+                {"word": " Hello", "start": 0.0, "end": 1.2, "probability": 0.9},
+                {"word": " world", "start": 1.2, "end": 3.0, "probability": 0.8},
+            ],
+        }],
+    }
+
+    def test_transcribe_requests_word_timestamps(self, mock_audio_file, mock_mellona_client):
+        """Verbose response format with word granularity is requested by default."""
+        processor = AIProcessor({'stt_provider': 'local_whisper', 'llm_provider': 'ollama'})
+
+        processor.transcribe(str(mock_audio_file))
+
+        call_kwargs = mock_mellona_client.transcribe.call_args[1]
+        assert call_kwargs['response_format'] == 'verbose_json'
+        assert call_kwargs['timestamp_granularities'] == ['segment', 'word']
+
+    def test_transcribe_plain_when_timestamps_disabled(self, mock_audio_file, mock_mellona_client):
+        """stt_timestamps='none' sends a plain transcription request."""
+        processor = AIProcessor({
+            'stt_provider': 'local_whisper',
+            'llm_provider': 'ollama',
+            'stt_timestamps': 'none',
+        })
+
+        processor.transcribe(str(mock_audio_file))
+
+        assert 'response_format' not in mock_mellona_client.transcribe.call_args[1]
+
+    def test_transcribe_leaves_out_unsupported_options(self, mock_audio_file, mock_mellona_client):
+        """Options missing from the client's signature are dropped; the rest are still sent."""
+        calls = []
+
+        def transcribe(audio_path, provider=None, model=None, timeout=None):
+            calls.append({'provider': provider, 'timeout': timeout})
+            return mock.MagicMock(text="Plain text", raw=None)
+
+        mock_mellona_client.transcribe = transcribe
+        processor = AIProcessor({'stt_provider': 'local_whisper', 'llm_provider': 'ollama'})
+
+        result = processor.transcribe(str(mock_audio_file))
+
+        assert result == "Plain text"
+        assert calls == [{'provider': 'local_whisper', 'timeout': 300}]
+        assert not processor.last_transcription.has_segments
+
+    def test_transcribe_does_not_resend_after_type_error(self, mock_audio_file, mock_mellona_client):
+        """A TypeError raised during the request is a failure, not a cue to send it again."""
+        mock_mellona_client.transcribe.side_effect = TypeError("bad response payload")
+        processor = AIProcessor({'stt_provider': 'local_whisper', 'llm_provider': 'ollama'})
+
+        assert processor.transcribe(str(mock_audio_file)) is None
+        assert mock_mellona_client.transcribe.call_count == 1
+
+    def test_transcribe_saves_segments_next_to_whisper_file(self, mock_audio_file, mock_mellona_client, temp_dir):
+        """Segment metadata is kept on the processor and saved beside the recovery file."""
+        mock_mellona_client.transcribe.return_value = mock.MagicMock(text="Hello world", raw=self.VERBOSE_RAW)
+        processor = AIProcessor({
+            'stt_provider': 'local_whisper',
+            'llm_provider': 'ollama',
+            'temp_dir': str(temp_dir),
+        })
+
+        result = processor.transcribe(str(mock_audio_file), "2026-01-26_14-30-45")
+
+        assert result == "Hello world"
+        assert processor.last_transcription.words[1]["word"] == " world"
+        assert (temp_dir / "whisper-2026-01-26_14-30-45.txt").exists()
+        segments_file = temp_dir / "whisper-2026-01-26_14-30-45.json"
+        assert segments_file.exists()
+        assert '"no_speech_prob": 0.01' in segments_file.read_text()
+
+
 class TestOllamaProcessing:
     """Test LLM processing configuration with Ollama via mellona."""
 
@@ -184,6 +268,30 @@ class TestOllamaProcessing:
         assert processor.config.get('ollama_model') == 'llama2'
 
 
+class TestMetaOperationDetection:
+    """Test keyword detection of meta-operations."""
+
+    def test_detects_whole_word_keywords(self):
+        """'list' triggers a meta-operation, 'realistic' does not."""
+        processor = AIProcessor({'llm_provider': 'ollama'})
+
+        assert processor._detect_meta_operation("please list my points")
+        assert processor._detect_meta_operation("Summarize what I said")
+        assert not processor._detect_meta_operation("that sounds realistic to me")
+
+    def test_keywords_from_config(self):
+        """meta_keywords and project_keywords replace the default tables."""
+        processor = AIProcessor({
+            'llm_provider': 'ollama',
+            'meta_keywords': ['condense'],
+            'project_keywords': {'garden': ['tomato*']},
+        })
+
+        assert processor._detect_meta_operation("condense this")
+        assert not processor._detect_meta_operation("list this")
+        assert processor._project_matcher.first("the tomatoes are ripe") == 'garden'
+
+
 class TestOpenRouterProcessing:
     """Test LLM processing with OpenRouter."""
 
@@ -294,6 +402,126 @@ class TestLLMProcessingDispatch:
         assert result == "Response from mellona LLM"
 
 
+class TestRequestTimeouts:
+    """Test that provider timeouts reach mellona and are enforced."""
+
+    def test_timeouts_from_config(self):
+        """Total, connect and read limits come from <provider>_* config keys."""
+        processor = AIProcessor({
+            'llm_provider': 'ollama',
+            'ollama_timeout': 30,
+            'ollama_connect_timeout': 5,
+            'ollama_read_timeout': 20,
+        })
+
+        timeouts = processor._timeouts('ollama')
+
+        assert (timeouts.connect, timeouts.read, timeouts.total) == (5, 20, 30)
+        assert processor._timeouts('openrouter').total == 60
+
+    def test_timeouts_passed_to_mellona(self, mock_mellona_client):
+        """Chat requests carry the configured limits."""
+        processor = AIProcessor({'llm_provider': 'ollama', 'ollama_timeout': 30})
+
+        processor.process_text("hello")
+
+        call_kwargs = mock_mellona_client.chat.call_args[1]
+        assert call_kwargs['timeout'] == 30
+        assert call_kwargs['connect_timeout'] == 10
+
+    def test_stalled_request_is_abandoned(self, mock_mellona_client):
+        """A backend that never answers fails after the total timeout."""
+        import threading
+        import time
+        release = threading.Event()
+        mock_mellona_client.chat.side_effect = lambda **kwargs: release.wait(5)
+        processor = AIProcessor({'llm_provider': 'ollama', 'ollama_timeout': 0.1})
+
+        started = time.monotonic()
+        result = processor.process_text("hello")
+        release.set()
+
+        assert time.monotonic() - started < 2
+        assert result.startswith("Error:")
+        assert "timed out" in result
+
+    def test_timeouts_survive_unsupported_options(self, mock_mellona_client):
+        """An option the client rejects is left out on its own; the limits are still sent."""
+        calls = []
+
+        def chat(prompt, system=None, profile=None, timeout=None, connect_timeout=None, read_timeout=None):
+            calls.append({'timeout': timeout, 'connect_timeout': connect_timeout})
+            return mock.MagicMock(text="ok")
+
+        mock_mellona_client.chat = chat
+        processor = AIProcessor({'llm_provider': 'ollama', 'ollama_timeout': 30})
+
+        assert processor.process_text("hello") == "ok"
+        assert calls == [{'timeout': 30, 'connect_timeout': 10}]
+
+    def test_abandoned_request_keeps_its_client_open(self):
+        """A timed-out request's client is closed by its own thread, once the call returns."""
+        import threading
+        release = threading.Event()
+        closed = threading.Event()
+        with mock.patch('second_voice.core.processor.SyncMellonaClient') as client_class:
+            client = client_class.return_value
+            client.__enter__.return_value.chat.side_effect = lambda **kwargs: release.wait(5)
+            client.__exit__.side_effect = lambda *args: closed.set()
+            processor = AIProcessor({'llm_provider': 'ollama', 'ollama_timeout': 0.1})
+
+            assert processor.process_text("hello").startswith("Error:")
+            assert not closed.is_set()
+            release.set()
+            assert closed.wait(5)
+
+    def test_pipeline_deadline_caps_request_timeouts(self):
+        """Inside pipeline_deadline, no request may outlast the pipeline."""
+        processor = AIProcessor({'llm_provider': 'ollama', 'pipeline_timeout': 2})
+
+        with processor.pipeline_deadline():
+            assert processor._timeouts('ollama').total <= 2
+            with processor.pipeline_deadline(100):
+                # A nested block cannot extend the outer deadline
+                assert processor._timeouts('ollama').total <= 2
+        assert processor._timeouts('ollama').total == 300
+
+    def test_pipeline_deadline_is_per_thread(self):
+        """A deadline bounds its own thread and the document workers it starts, nothing else."""
+        import threading
+        processor = AIProcessor({'llm_provider': 'ollama', 'pipeline_timeout': 2})
+        totals = {}
+
+        def other_thread():
+            totals['other'] = processor._timeouts('ollama').total
+
+        def document_request(text, system=None):
+            totals[text] = processor._timeouts('ollama').total
+            return text
+
+        with processor.pipeline_deadline():
+            worker = threading.Thread(target=other_thread)
+            worker.start()
+            worker.join()
+            with mock.patch.object(processor, '_process_with_document_prompt', side_effect=document_request):
+                processor._map_document_prompts([('a', None), ('b', None)])
+
+        assert totals['other'] == 300
+        assert totals['a'] <= 2 and totals['b'] <= 2
+
+    def test_expired_pipeline_falls_back_to_transcript(self, mock_mellona_client):
+        """Once the pipeline is out of time, processing falls back to the raw transcript."""
+        processor = AIProcessor({'llm_provider': 'openrouter', 'stream_output': False})
+
+        with processor.pipeline_deadline(0.001):
+            import time
+            time.sleep(0.01)
+            result = processor.process_with_headers_and_fallback("raw words", on_token=lambda chunk: None)
+
+        assert "raw words" in result
+        assert mock_mellona_client.chat.call_count == 0
+
+
 class TestContextManagement:
     """Test context saving and loading."""
 
@@ -308,9 +536,10 @@ class TestContextManagement:
 
         processor.save_context('This is my context')
 
-        context_file = temp_dir / 'tmp-context.txt'
-        assert context_file.exists()
-        assert context_file.read_text() == 'This is my context'
+        session_file = temp_dir / 'sessions' / f'{processor.session_id}.jsonl'
+        assert session_file.exists()
+        record = json.loads(session_file.read_text().splitlines()[-1])
+        assert record['context'] == 'This is my context'
 
     def test_load_context(self, temp_dir):
         """Load context from file."""
@@ -386,5 +615,201 @@ class TestContextManagement:
 
         processor.save_context('Context in custom temp dir')
 
-        context_file = subdir / 'tmp-context.txt'
-        assert context_file.exists()
+        session_file = subdir / 'sessions' / f'{processor.session_id}.jsonl'
+        assert session_file.exists()
+
+    def test_ollama_prompt_cache_options(self, mock_mellona_client):
+        """Ollama calls keep the model warm and keep the system prompt stable."""
+        config = {'stt_provider': 'local_whisper', 'llm_provider': 'ollama', 'ollama_keep_alive': '1h'}
+        processor = AIProcessor(config)
+
+        processor.process_text('Clean this up')
+        plain = mock_mellona_client.chat.call_args.kwargs
+        processor.process_text('Please outline this')
+        meta = mock_mellona_client.chat.call_args.kwargs
+
+        assert plain['keep_alive'] == '1h'
+        assert plain['system'] == meta['system']
+        assert meta['prompt'].startswith("User's transcribed speech:\nNote: this request")
+
+    def test_openrouter_fallback_sends_each_model(self, mock_mellona_client):
+        """Every fallback attempt asks for its own model, with no top-level cache_control."""
+        mock_mellona_client.chat.side_effect = [RuntimeError("overloaded"), mock.MagicMock(text="Done")]
+        config = {
+            'stt_provider': 'local_whisper',
+            'llm_provider': 'openrouter',
+            'openrouter_llm_model': 'anthropic/claude-3.5-sonnet',
+            'openrouter_fallback_models': ['openai/gpt-4'],
+        }
+
+        assert AIProcessor(config).process_text('Hello') == "Done"
+
+        calls = [call.kwargs for call in mock_mellona_client.chat.call_args_list]
+        assert [kwargs['model'] for kwargs in calls] == ['anthropic/claude-3.5-sonnet', 'openai/gpt-4']
+        assert not any('cache_control' in kwargs for kwargs in calls)
+
+    def test_openrouter_user_model_without_fallbacks(self, mock_mellona_client):
+        """Streaming and non-streaming paths share one model chain, even without fallbacks."""
+        config = {
+            'stt_provider': 'local_whisper',
+            'llm_provider': 'openrouter',
+            'openrouter_llm_model': 'openai/gpt-4',
+            'openrouter_fallback_models': [],
+        }
+        processor = AIProcessor(config)
+
+        assert processor.process_text('Hello') == "Response from mellona LLM"
+        assert processor._process_openrouter_document('Hello') == "Response from mellona LLM"
+        assert [call.kwargs['model'] for call in mock_mellona_client.chat.call_args_list] == ['openai/gpt-4'] * 2
+
+        config['openrouter_llm_model'] = None
+        assert AIProcessor(config).process_text('Hello') == "Error: No fallback models configured"
+
+    def test_prompt_cache_disabled(self, mock_mellona_client):
+        config = {'stt_provider': 'local_whisper', 'llm_provider': 'ollama', 'prompt_cache': False}
+        AIProcessor(config).process_text('Hello')
+        assert 'keep_alive' not in mock_mellona_client.chat.call_args.kwargs
+
+    def test_stream_text_yields_chunks(self, mock_mellona_client):
+        """Streaming yields chunks from the client as they arrive."""
+        mock_mellona_client.stream_chat.return_value = iter(['Hel', mock.MagicMock(text='lo'), {'delta': '!'}])
+        processor = AIProcessor({'stt_provider': 'local_whisper', 'llm_provider': 'ollama'})
+
+        assert list(processor.stream_text('hello')) == ['Hel', 'lo', '!']
+        assert mock_mellona_client.stream_chat.call_args.kwargs['profile'] == 'ollama'
+
+    def test_stream_text_falls_back_to_next_model(self, mock_mellona_client):
+        """A model that fails before streaming anything is replaced by the next one in the chain."""
+        def chunks(model=None, **kwargs):
+            if model == 'first/model':
+                raise RuntimeError("unavailable")
+            yield f"from {model}"
+
+        mock_mellona_client.stream_chat.side_effect = chunks
+        processor = AIProcessor({
+            'stt_provider': 'local_whisper',
+            'llm_provider': 'openrouter',
+            'openrouter_llm_model': 'first/model',
+            'openrouter_fallback_models': ['second/model'],
+        })
+
+        assert list(processor.stream_text('hello')) == ['from second/model']
+
+    def test_stream_text_cancel_keeps_partial_output(self, mock_mellona_client):
+        """Setting the cancel event stops streaming; headers wrap the partial output."""
+        import threading
+        cancel = threading.Event()
+
+        def chunks(**kwargs):
+            yield 'partial'
+            cancel.set()
+            yield ' never shown'
+
+        mock_mellona_client.stream_chat.side_effect = chunks
+        processor = AIProcessor({'stt_provider': 'local_whisper', 'llm_provider': 'ollama'})
+        received = []
+
+        result = processor.process_with_headers_and_fallback(
+            'some speech', context=None, on_token=received.append, cancel=cancel
+        )
+
+        assert received == ['partial']
+        assert result.endswith('partial')
+        assert 'never shown' not in result
+
+    def test_stream_text_without_streaming_support(self, mock_mellona_client):
+        """A complete response (no streaming in mellona) is yielded as one chunk."""
+        del mock_mellona_client.stream_chat
+        mock_mellona_client.chat.return_value = mock.MagicMock(text='whole response')
+        processor = AIProcessor({
+            'stt_provider': 'local_whisper',
+            'llm_provider': 'openrouter',
+            'openrouter_fallback_models': ['openai/gpt-4'],
+        })
+
+        assert list(processor.stream_text('hello')) == ['whole response']
+        assert mock_mellona_client.chat.call_args.kwargs['stream'] is True
+
+    def test_record_turn_and_resume(self, temp_dir):
+        """Turns are appended with metadata and a new processor can resume them."""
+        config = {
+            'stt_provider': 'groq',
+            'llm_provider': 'ollama',
+            'ollama_model': 'llama3',
+            'temp_dir': str(temp_dir)
+        }
+        processor = AIProcessor(config)
+
+        processor.record_turn('raw one', 'Output one.', {'transcribe': 1.5})
+        processor.record_turn('raw two', 'Output two.')
+
+        records = list(processor.session_store.records(processor.session_id))
+        assert [r['transcript'] for r in records] == ['raw one', 'raw two']
+        assert records[0]['timings'] == {'transcribe': 1.5}
+        assert records[0]['stt_model'] == 'whisper-large-v3'
+        assert records[0]['llm_model'] == 'llama3'
+        assert records[0]['prompt_hash'] == processor._prompt('cleanup.system').hash
+
+        resumed = AIProcessor(dict(config, session_id='last'))
+        assert resumed.session_id == processor.session_id
+        assert resumed.context_manager.turns == ['Output one.', 'Output two.']
+        assert resumed.load_context() == processor.load_context()
+
+    def test_process_text_sends_budgeted_context(self, temp_dir, mock_mellona_client):
+        """Saved turns are sent as summary plus recent turns, not the raw string."""
+        config = {
+            'stt_provider': 'local_whisper',
+            'llm_provider': 'ollama',
+            'temp_dir': str(temp_dir),
+            'context_keep_turns': 1,
+        }
+        processor = AIProcessor(config)
+
+        processor.save_context('First draft. With details.')
+        processor.save_context('Second draft.')
+        processor.process_text('make it shorter', 'Second draft.')
+
+        prompt = mock_mellona_client.chat.call_args.kwargs['prompt']
+        assert 'Summary of earlier turns: First draft.' in prompt
+        assert 'With details' not in prompt
+        assert 'Second draft.' in prompt
+
+
+class TestConfigReload:
+    """Test applying reloaded configuration to a running processor."""
+
+    def test_apply_config_rebuilds_only_affected_state(self, temp_dir):
+        """Changed providers and context settings apply; the session and its turns survive."""
+        config = {'llm_provider': 'ollama', 'temp_dir': str(temp_dir), 'context_keep_turns': 2}
+        processor = AIProcessor(config)
+        processor.save_context('First draft.')
+        session_store, meta_matcher = processor.session_store, processor._meta_matcher
+
+        config.update(llm_provider='cline', cline_llm_model='big-model', context_keep_turns=3)
+        processor.apply_config({'llm_provider', 'cline_llm_model', 'context_keep_turns'})
+
+        assert processor.llm_provider == 'cline'
+        assert processor.context_manager.model == 'big-model'
+        assert processor.context_manager.keep_turns == 3
+        assert processor.context_manager.turns == ['First draft.']
+        assert processor.session_store is session_store
+        assert processor._meta_matcher is meta_matcher
+
+    def test_mellona_config_reresolved_only_for_provider_settings(self, temp_dir):
+        config = {'temp_dir': str(temp_dir)}
+        with mock.patch('second_voice.core.processor.get_config') as mock_get_config:
+            processor = AIProcessor(config)
+            processor.apply_config({'ollama_model', 'context_token_budget'})
+            assert mock_get_config.call_count == 1
+
+            processor.apply_config({'ollama_url'})
+            assert mock_get_config.call_count == 2
+
+    def test_cli_mellona_config_is_kept(self, temp_dir):
+        """A mellona config passed in from the CLI is never replaced."""
+        cli_config = object()
+        processor = AIProcessor({'temp_dir': str(temp_dir), 'mellona_config': cli_config})
+
+        processor.apply_config({'ollama_url', 'profiles'})
+
+        assert processor.mellona_config is cli_config
@@ -0,0 +1,91 @@
+"""Tests for --profile span timing."""
+
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from src.second_voice.core.engine import Engine
+from src.second_voice.utils import profiling
+
+
+@pytest.fixture(autouse=True)
+def clean_profiling():
+    profiling.reset()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test_spans_not_recorded_when_disabled():
+    """Profiling is off by default, so spans cost nothing and record nothing."""
+    with profiling.span('stt.groq'):
+        pass
+    profiling.add_span('startup.imports', 0.0, 1.0)
+
+    assert profiling.spans() == []
+
+
+def test_span_records_duration_and_survives_errors():
+    """A span is recorded even when its block raises."""
+    profiling.enable()
+
+    with profiling.span('llm.ollama', model='llama'):
+        time.sleep(0.01)
+    with pytest.raises(ValueError):
+        with profiling.span('headers.inject'):
+            raise ValueError("boom")
+
+    recorded = profiling.spans()
+    assert [s['name'] for s in recorded] == ['llm.ollama', 'headers.inject']
+    assert recorded[0]['duration'] >= 0.01
+    assert recorded[0]['args'] == {'model': 'llama'}
+
+
+def test_report_aggregates_per_stage():
+    """The breakdown has one line per stage, slowest first, with call counts."""
+    profiling.enable()
+    profiling.add_span('request.ollama', 0.0, 0.1)
+    profiling.add_span('request.ollama', 1.0, 1.2)
+    profiling.add_span('output.write', 2.0, 2.001)
+
+    lines = profiling.report().splitlines()
+
+    assert lines[0].split() == ['stage', 'calls', 'total', 'ms', 'mean', 'ms']
+    assert lines[1].split() == ['request.ollama', '2', '300.0', '150.0']
+    assert lines[2].split()[:2] == ['output.write', '1']
+
+
+def test_chrome_trace_written(tmp_path):
+    """finish() prints the breakdown and writes complete events with thread names."""
+    profiling.enable()
+    with profiling.span('stt.local_whisper'):
+        pass
+    worker = threading.Thread(target=lambda: profiling.add_span('request.groq', 0.0, 0.5), name='stt-worker')
+    worker.start()
+    worker.join()
+
+    trace_path = tmp_path / 'trace.json'
+    out = io.StringIO()
+    profiling.finish(str(trace_path), stream=out)
+
+    assert 'stt.local_whisper' in out.getvalue()
+    trace = json.loads(trace_path.read_text())
+    complete = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+    assert {e['name'] for e in complete} == {'stt.local_whisper', 'request.groq'}
+    assert next(e for e in complete if e['name'] == 'request.groq')['dur'] == 500000.0
+    thread_names = {e['args']['name'] for e in trace['traceEvents'] if e['ph'] == 'M'}
+    assert 'stt-worker' in thread_names
+
+
+def test_engine_build_is_a_stage():
+    """Building an engine component shows up as its own stage."""
+    profiling.enable()
+    engine = Engine({}, processor_factory=lambda cfg: object())
+
+    engine.get('processor')
+    engine.get('processor')
+
+    assert [s['name'] for s in profiling.spans()] == ['engine.processor']
@@ -0,0 +1,56 @@
+"""Tests for the prompt registry."""
+
+import pytest
+
+from src.second_voice.core.prompts import (
+    PROMPTS, Prompt, PromptRegistry, META_OPERATION_HINT, cleanup_variant, load_prompts
+)
+
+
+class TestPromptRegistry:
+
+    def test_hashes_are_stable(self):
+        """Rebuilding the registry yields identical hashes."""
+        assert load_prompts().hashes() == PROMPTS.hashes()
+        assert all(len(value) == 12 for value in PROMPTS.hashes().values())
+
+    def test_hash_depends_on_version_and_text(self):
+        """Changing the text or the version changes the hash."""
+        base = Prompt('p', 'v1', 'text')
+        assert Prompt('p', 'v2', 'text').hash != base.hash
+        assert Prompt('p', 'v1', 'other').hash != base.hash
+
+    def test_latest_and_pinned_versions(self):
+        """get() returns the last registered version unless one is pinned."""
+        registry = PromptRegistry()
+        registry.register(Prompt('p', 'v1', 'one'))
+        registry.register(Prompt('p', 'v2', 'two'))
+
+        assert registry.get('p').text == 'two'
+        assert registry.get('p', 'v1').text == 'one'
+        assert registry.versions('p') == ['v1', 'v2']
+        with pytest.raises(KeyError):
+            registry.get('p', 'v9')
+        with pytest.raises(KeyError):
+            registry.get('missing')
+
+    def test_cleanup_variants_precomputed(self):
+        """Every provider/context/meta combination is registered."""
+        for profile in ('ollama', 'openrouter', 'cline'):
+            for context in (False, True):
+                for meta in (False, True):
+                    prompt = PROMPTS.get(cleanup_variant(profile, context, meta))
+                    rendered = prompt.render(text='SPEECH', context='CTX')
+                    assert rendered.endswith('SPEECH')
+                    assert ('CTX' in rendered) == context
+                    assert (META_OPERATION_HINT in rendered) == meta
+
+    def test_render_ignores_braces_in_values(self):
+        """User text containing braces is inserted verbatim."""
+        prompt = PROMPTS.get(cleanup_variant('ollama', False, False))
+        assert prompt.render(text='{not a field}') == "User's transcribed speech:\n{not a field}"
+
+    def test_cline_variant_embeds_system_prompt(self):
+        """Cline takes one input, so its layout starts with the system prompt."""
+        rendered = PROMPTS.get(cleanup_variant('cline', False, False)).render(text='hi')
+        assert rendered.startswith(PROMPTS.get('cleanup.system').text)
@@ -261,6 +261,90 @@ class TestRecordingOperations:
         assert recorder.get_amplitude() > 0.0
 
 
+class TestLevelEvents:
+    """Test decimated VU level events."""
+
+    @mock.patch("sounddevice.InputStream")
+    def test_levels_published_at_level_rate(self, mock_input_stream, temp_dir):
+        """The RMS is computed level_rate times a second, not on every callback."""
+        config = {'temp_dir': str(temp_dir), 'audio_config': {'sample_rate': 16000, 'level_rate': 10}}
+        recorder = AudioRecorder(config)
+        recorder.start_recording()
+        callback = mock_input_stream.call_args.kwargs['callback']
+        block = np.full((160, 1), 0.1, dtype=np.float32)
+
+        with mock.patch.object(recorder, '_calculate_rms', wraps=recorder._calculate_rms) as rms:
+            for _ in range(100):  # one second of 10 ms blocks
+                callback(block, 160, None, None)
+
+        # The first level right away, then one every 100 ms
+        assert rms.call_count == 11
+        assert recorder.level_seq == 11
+        assert recorder.get_amplitude() > 0.0
+
+    @mock.patch("soundfile.write")
+    @mock.patch("sounddevice.InputStream")
+    def test_levels_wake_waiting_consumer(self, mock_input_stream, mock_write, temp_dir):
+        """levels() yields each published level and ends when recording stops."""
+        import threading
+
+        config = {'temp_dir': str(temp_dir), 'audio_config': {'sample_rate': 1000, 'level_rate': 100}}
+        recorder = AudioRecorder(config)
+        recorder.start_recording()
+        callback = mock_input_stream.call_args.kwargs['callback']
+        received = []
+        listening = threading.Event()
+
+        def consume():
+            listening.set()
+            received.extend(recorder.levels(timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        assert listening.wait(5)
+        for value in (0.05, 0.1):
+            time.sleep(0.05)
+            callback(np.full((10, 1), value, dtype=np.float32), 10, None, None)
+        time.sleep(0.05)
+        recorder.stop_recording()
+        consumer.join(timeout=5)
+
+        assert not consumer.is_alive()
+        assert received == [pytest.approx(0.25), pytest.approx(0.5)]
+
+
+class TestConfigReload:
+    """Test applying reloaded audio settings."""
+
+    def test_apply_config_updates_audio_settings(self, temp_dir):
+        config = {'temp_dir': str(temp_dir), 'audio_config': {'sample_rate': 16000}}
+        recorder = AudioRecorder(config)
+
+        config['audio_config'] = {'sample_rate': 48000, 'channels': 2}
+        recorder.apply_config({'audio_config', 'audio_config.sample_rate', 'audio_config.channels'})
+
+        assert recorder.sample_rate == 48000
+        assert recorder.channels == 2
+
+    @mock.patch("soundfile.write")
+    @mock.patch("sounddevice.InputStream")
+    def test_settings_changed_while_recording_apply_after_stop(self, mock_input_stream, mock_write, temp_dir):
+        """A recording in progress is written at the rate it was captured at."""
+        config = {'temp_dir': str(temp_dir), 'audio_config': {'sample_rate': 16000}}
+        recorder = AudioRecorder(config)
+        recorder.start_recording()
+        recorder._audio_data = [np.zeros(1000, dtype=np.float32)]
+
+        config['audio_config'] = {'sample_rate': 48000}
+        recorder.apply_config({'audio_config.sample_rate'})
+        assert recorder.sample_rate == 16000
+
+        recorder.stop_recording()
+
+        assert mock_write.call_args[0][2] == 16000
+        assert recorder.sample_rate == 48000
+
+
 class TestAudioDeviceHandling:
     """Test audio device enumeration."""
 
@@ -0,0 +1,69 @@
+"""Tests for the append-only session store."""
+
+import os
+
+import pytest
+
+from src.second_voice.core import session as session_module
+from src.second_voice.core.session import SessionStore
+
+
+class TestSessionStore:
+
+    def test_append_and_replay(self, tmp_path):
+        """Records are appended in order and replayed from the session file."""
+        store = SessionStore(str(tmp_path / 'sessions'))
+        session_id = store.new_session_id()
+
+        store.append(session_id, {'type': 'turn', 'output': 'one'})
+        store.append(session_id, {'type': 'turn', 'output': 'two'})
+
+        records = list(store.records(session_id))
+        assert [r['output'] for r in records] == ['one', 'two']
+        assert all(r['session'] == session_id for r in records)
+        assert store.last(session_id)['output'] == 'two'
+
+    def test_last_reads_across_blocks(self, tmp_path, monkeypatch):
+        """last() finds the final record when it spans several tail blocks."""
+        monkeypatch.setattr(session_module, '_TAIL_BLOCK', 16)
+        store = SessionStore(str(tmp_path))
+
+        store.append('s', {'output': 'first'})
+        store.append('s', {'output': 'x' * 100})
+
+        assert store.last('s')['output'] == 'x' * 100
+
+    def test_corrupt_tail_is_skipped(self, tmp_path):
+        """A truncated final line falls back to the previous record."""
+        store = SessionStore(str(tmp_path))
+        store.append('s', {'output': 'good'})
+        with open(store.path('s'), 'a') as f:
+            f.write('{"output": "cut sho')
+
+        assert store.last('s')['output'] == 'good'
+        assert [r['output'] for r in store.records('s')] == ['good']
+
+    def test_missing_session(self, tmp_path):
+        """Unknown sessions have no records."""
+        store = SessionStore(str(tmp_path / 'none'))
+
+        assert store.last('nope') is None
+        assert list(store.records('nope')) == []
+        assert store.sessions() == []
+        assert store.latest_session() is None
+
+    def test_latest_session(self, tmp_path):
+        """The most recently written session is reported as latest."""
+        store = SessionStore(str(tmp_path))
+        store.append('b', {})
+        store.append('a', {})
+        os.utime(store.path('b'), (1, 1))
+
+        assert store.sessions() == ['a', 'b']
+        assert store.latest_session() == 'a'
+
+    def test_rejects_path_like_ids(self, tmp_path):
+        """Session ids cannot escape the session directory."""
+        store = SessionStore(str(tmp_path))
+        with pytest.raises(ValueError):
+            store.path('../escape')
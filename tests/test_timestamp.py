@@ -5,7 +5,7 @@ import os
 import re
 from src.second_voice.utils.timestamp import (
     get_timestamp, create_recording_filename, create_whisper_filename,
-    extract_timestamp_from_filename, find_matching_whisper_file
+    create_whisper_segments_filename, extract_timestamp_from_filename, find_matching_whisper_file
 )
 
 
@@ -47,6 +47,13 @@ class TestTimestamp:
         assert "whisper-" in path
         assert ".txt" in path
 
+    def test_whisper_segments_filename(self):
+        """Test whisper segment metadata filename sits next to the text output."""
+        timestamp = "2026-01-26_14-30-45"
+        path = create_whisper_segments_filename("/tmp", timestamp)
+        assert path == "/tmp/whisper-2026-01-26_14-30-45.json"
+        assert os.path.splitext(path)[0] == os.path.splitext(create_whisper_filename("/tmp", timestamp))[0]
+
     def test_extract_timestamp(self):
         """Test timestamp extraction from filename."""
         filename = "recording-2026-01-26_14-30-45.wav"
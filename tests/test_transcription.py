@@ -0,0 +1,92 @@
+"""Tests for structured transcription results."""
+
+import json
+from unittest import mock
+
+from src.second_voice.core.transcription import Transcription
+
+
+VERBOSE_PAYLOAD = {
+    "task": "transcribe",
+    "language": "en",
+    "duration": 6.5,
+    "text": "Hello there. General Kenobi.",
+    "segments": [
+        {
+            "id": 0, "seek": 0, "start": 0.0, "end": 2.4, "text": " Hello there.",
+            "avg_logprob": -0.21, "no_speech_prob": 0.01, "compression_ratio": 0.9,
+            "words": [
+                {"word": " Hello", "start": 0.0, "end": 0.8, "probability": 0.98},
+                {"word": " there.", "start": 0.8, "end": 2.4, "probability": 0.95},
+            ],
+        },
+        {
+            "id": 1, "seek": 0, "start": 3.0, "end": 6.5, "text": " General Kenobi.",
+            "avg_logprob": -0.35, "no_speech_prob": 0.02, "compression_ratio": 1.1,
+        },
+    ],
+}
+
+
+class TestTranscription:
+
+    def test_from_verbose_payload(self):
+        """Verbose JSON payload keeps segment timing and confidence fields."""
+        transcription = Transcription.from_response(VERBOSE_PAYLOAD)
+
+        assert transcription.text == "Hello there. General Kenobi."
+        assert transcription.language == "en"
+        assert transcription.duration == 6.5
+        assert transcription.has_segments
+        assert transcription.segments[0]["text"] == "Hello there."
+        assert transcription.segments[0]["avg_logprob"] == -0.21
+        assert transcription.segments[1]["no_speech_prob"] == 0.02
+        assert "words" not in transcription.segments[1]
+
+    def test_words_flattened_in_order(self):
+        """Word timestamps are exposed across all segments."""
+        transcription = Transcription.from_response(VERBOSE_PAYLOAD)
+        assert [w["word"] for w in transcription.words] == [" Hello", " there."]
+
+    def test_from_response_object_with_raw_payload(self):
+        """Response objects carrying the verbose payload in .raw are supported."""
+        response = mock.MagicMock(text="Hello there. General Kenobi.", raw=VERBOSE_PAYLOAD)
+        transcription = Transcription.from_response(response)
+        assert len(transcription.segments) == 2
+
+    def test_from_text_only_response(self):
+        """Text-only responses produce a transcription without segments."""
+        response = mock.MagicMock(text="Just text")
+        transcription = Transcription.from_response(response)
+
+        assert transcription.text == "Just text"
+        assert not transcription.has_segments
+        assert transcription.language is None
+        assert transcription.duration is None
+
+    def test_slice_returns_overlapping_segments(self):
+        """Slicing keeps only segments overlapping the requested window."""
+        transcription = Transcription.from_response(VERBOSE_PAYLOAD)
+
+        tail = transcription.slice(2.5, 10.0)
+        assert tail.text == "General Kenobi."
+        assert len(tail.segments) == 1
+
+        head = transcription.slice(0.0, 1.0)
+        assert head.text == "Hello there."
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Saved JSON loads back into an equivalent transcription."""
+        path = tmp_path / "whisper-2026-01-26_14-30-45.json"
+        original = Transcription.from_response(VERBOSE_PAYLOAD)
+        original.save(str(path))
+
+        data = json.loads(path.read_text())
+        assert data["segments"][0]["words"][0]["start"] == 0.0
+
+        loaded = Transcription.load(str(path))
+        assert loaded.to_dict() == original.to_dict()
+
+    def test_load_missing_file(self, tmp_path):
+        """Loading a missing file returns None."""
+        assert Transcription.load(str(tmp_path / "missing.json")) is None
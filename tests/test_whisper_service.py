@@ -0,0 +1,158 @@
+"""Tests for the pure helpers of the faster-whisper service (docker/service.py)."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+SERVICE_PATH = Path(__file__).resolve().parent.parent / 'docker' / 'service.py'
+RATE = 16000
+
+
+@pytest.fixture(scope='module')
+def service():
+    """Import the service with its server-side dependencies stubbed out."""
+    stubs = {name: mock.MagicMock() for name in (
+        'flask', 'faster_whisper', 'faster_whisper.audio', 'faster_whisper.vad', 'prometheus_client',
+    )}
+    spec = importlib.util.spec_from_file_location('whisper_service', SERVICE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, stubs):
+        spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def speech(service, monkeypatch):
+    """Make VAD report the given (start, end) regions in seconds."""
+    def set_regions(*regions):
+        timestamps = [{'start': int(start * RATE), 'end': int(end * RATE)} for start, end in regions]
+        monkeypatch.setattr(service, 'get_speech_timestamps', lambda audio, options: timestamps)
+    return set_regions
+
+
+def seconds(n):
+    return np.zeros(int(n * RATE), dtype=np.float32)
+
+
+def test_plan_chunks_cuts_midway_through_silence(service, speech):
+    """Regions are grouped up to the limit and chunks cover the audio without gaps."""
+    audio = seconds(110)
+    speech((1, 20), (22, 45), (50, 70), (80, 101))
+
+    chunks = service.plan_chunks(audio, {}, max_chunk_seconds=50)
+
+    assert chunks == [(0, int(47.5 * RATE)), (int(47.5 * RATE), int(75 * RATE)), (int(75 * RATE), len(audio))]
+
+
+def test_plan_chunks_keeps_long_region_whole(service, speech):
+    """A single speech region over the limit is never split."""
+    audio = seconds(90)
+    speech((0, 80))
+
+    assert service.plan_chunks(audio, {}, max_chunk_seconds=30) == [(0, len(audio))]
+
+
+def test_plan_chunks_without_speech_uses_fixed_chunks(service, speech):
+    """Audio VAD finds nothing in is still decoded in full."""
+    speech()
+
+    chunks = service.plan_chunks(seconds(25), {}, max_chunk_seconds=10)
+
+    assert chunks == [(0, 10 * RATE), (10 * RATE, 20 * RATE), (20 * RATE, 25 * RATE)]
+
+
+def test_plan_chunks_without_vad(service, monkeypatch):
+    """Requests with vad_filter off never run VAD for chunking."""
+    monkeypatch.setattr(service, 'get_speech_timestamps', mock.Mock(side_effect=AssertionError))
+
+    chunks = service.plan_chunks(seconds(15), {}, max_chunk_seconds=10, vad=False)
+
+    assert chunks == [(0, 10 * RATE), (10 * RATE, 15 * RATE)]
+
+
+def test_transcribe_chunked_detects_language_once(service, monkeypatch):
+    """With language=auto the first chunk's language is used for every other chunk."""
+    languages = []
+
+    def transcribe(audio, language=None, **kwargs):
+        languages.append(language)
+        return [], SimpleNamespace(language=language or 'de', duration=len(audio) / RATE)
+
+    monkeypatch.setattr(service, 'plan_chunks', lambda audio, vad_parameters, vad=True: [(0, 10), (10, 20), (20, 30)])
+    model = SimpleNamespace(transcribe=transcribe)
+
+    results, _ = service.transcribe_chunked(model, seconds(1), 0.0, {}, language=None, vad_filter=True)
+
+    assert languages == [None, 'de', 'de']
+    assert [info.language for _, _, info in results] == ['de', 'de', 'de']
+
+
+def test_trim_silence_returns_offset(service, speech):
+    """Samples before the first and after the last region are cut; the offset is the first kept sample."""
+    audio = np.arange(10 * RATE, dtype=np.float32)
+    speech((2, 4), (6, 8.5))
+
+    trimmed, offset = service.trim_silence(audio, {})
+
+    assert offset == 2.0
+    assert len(trimmed) == int(6.5 * RATE)
+    assert trimmed[0] == audio[2 * RATE]
+
+
+def test_trim_silence_without_speech(service, speech):
+    speech()
+
+    trimmed, offset = service.trim_silence(seconds(3), {})
+
+    assert len(trimmed) == 0
+    assert offset == 0.0
+
+
+def test_parse_decode_options(service):
+    options = service.parse_decode_options({
+        'language': 'auto',
+        'vad_filter': 'false',
+        'vad_threshold': '0.6',
+        'min_silence_duration_ms': '500',
+        'speech_pad_ms': '',
+    })
+
+    assert options['language'] is None
+    assert options['vad_filter'] is False
+    assert options['vad_parameters']['threshold'] == 0.6
+    assert options['vad_parameters']['min_silence_duration_ms'] == 500
+    assert 'speech_pad_ms' not in options['vad_parameters']
+
+
+@pytest.mark.parametrize('form, message', [
+    ({'min_speech_duration_ms': '2.5'}, 'min_speech_duration_ms must be a int'),
+    ({'trim_silence': 'maybe'}, 'trim_silence must be a boolean'),
+])
+def test_parse_decode_options_rejects_bad_values(service, form, message):
+    with pytest.raises(ValueError, match=message):
+        service.parse_decode_options(form)
+
+
+def test_segment_to_dict_shifts_timestamps(service):
+    word = SimpleNamespace(word=' hi', start=0.25, end=0.5, probability=0.9)
+    segment = SimpleNamespace(
+        id=1, seek=0, start=0.2, end=1.0, text=' hi there ', tokens=(1, 2), temperature=0.0,
+        avg_logprob=-0.1, compression_ratio=1.0, no_speech_prob=0.01, words=[word],
+    )
+
+    result = service.segment_to_dict(segment, include_words=True, offset=60.0)
+
+    assert (result['start'], result['end']) == (60.2, 61.0)
+    assert result['text'] == 'hi there'
+    assert result['words'] == [{'word': ' hi', 'start': 60.25, 'end': 60.5, 'probability': 0.9}]
+
+
+def test_speech_duration_keeps_zero(service):
+    """All audio removed by VAD is 0.0 seconds, not the full duration."""
+    assert service.speech_duration(SimpleNamespace(duration_after_vad=0.0, duration=12.0)) == 0.0
+    assert service.speech_duration(SimpleNamespace(duration=12.0)) == 12.0